@@ -1,3 +1,7 @@
+from typing import TextIO
+
+from Model.event_bus import BOX_OPENED, PRISONER_SUCCEEDED, PRISONER_FAILED, PRISONER_CHANGED, ROUND_CHANGED, \
+    PRISONER_MOVED, TIME_UPDATED, BOXES_UPCOMING
 from Model.modelmanager import ModelManger
 from View.viewmanager import ViewManager
 
@@ -22,6 +26,21 @@ class Controller:
         """
         self.model = model
         self.view = view
+        self.subscribe_view_events()
+
+    def subscribe_view_events(self) -> None:
+        """
+        Method that subscribes the view handlers to the events that the model publishes, the events reach the view once per frame.\n
+        :return: None.
+        """
+        self.model.events.subscribe(BOX_OPENED, self.cnt_ntfy_view_open_box)
+        self.model.events.subscribe(PRISONER_SUCCEEDED, self.cnt_ntfy_view_on_success)
+        self.model.events.subscribe(PRISONER_FAILED, self.cnt_ntfy_view_on_failure)
+        self.model.events.subscribe(TIME_UPDATED, self.cnt_ntfy_view_on_time)
+        self.model.events.subscribe(PRISONER_CHANGED, self.cnt_ntfy_view_pris_changed)
+        self.model.events.subscribe(ROUND_CHANGED, self.cnt_ntfy_view_round_changed)
+        self.model.events.subscribe(PRISONER_MOVED, self.cnt_ntfy_view_pris_moved)
+        self.model.events.subscribe(BOXES_UPCOMING, self.cnt_ntfy_view_upcoming_boxes)
 
     def get_view(self) -> ViewManager:
         """
@@ -53,31 +72,6 @@ class Controller:
 
     # **************************************************************************************************************************************************#
     # *************************************************** Model related methods ************************************************************************#
-    def model_need_box(self, box_num) -> None:
-        """
-        Method for notifying the ViewManager that the ModelManager need a box with specific number on screen.\n
-        :param box_num: int, number that representing box number.
-
-        :return: None.
-        """
-        self.cnt_ntfy_view_handle_box_req(box_num)
-
-    def model_need_box_dimensions(self) -> tuple[int, int]:
-        """
-        Method for notifying the ViewManager that the ModelManager need a box image dimensions.\n
-
-        :return: tuple[int,int], of box dimensions.
-        """
-        return self.cnt_ntfy_to_view_get_box_dimension()
-
-    def model_need_pris_dimensions(self) -> tuple[int, int]:
-        """
-        Method for notifying the ViewManager that the ModelManager need a prisoner image dimensions.\n
-
-        :return: tuple[int,int], of prisoner dimensions.
-        """
-        return self.cnt_ntfy_to_view_get_pris_dimension()
-
     def model_need_all_boxes_on_screen_pos(self) -> dict:
         """
         Method for notifying the ViewManager that the ModelManager need the boxes positions on screen.\n
@@ -86,52 +80,6 @@ class Controller:
         """
         return self.cnt_ntfy_to_view_get_all_boxes_location()
 
-    def model_need_to_open_box(self, current_box_num) -> None:
-        """
-        Method for notifying the ViewManager that the ModelManager need to open box with a specific number.\n
-        :param current_box_num: int, representing the box number to be open.
-
-        :return: None.
-        """
-        self.cnt_ntfy_view_open_box(current_box_num)
-
-    def model_need_to_report_success(self, current_pris_num, num_succeeded) -> None:
-        """
-        Method for notifying the ViewManager that the ModelManager need to show prisoner success.\n
-
-        :param current_pris_num: int, representing the prisoner that manged to escape.
-        :param num_succeeded: int, the prisoners that manged to escape so far.
-
-        :return: None.
-        """
-        self.cnt_ntfy_view_on_success(current_pris_num, num_succeeded)
-
-    def model_need_to_report_failure(self, current_pris_num) -> None:
-        """
-        Method for notifying the ViewManager that the ModelManager need to show prisoner success.\n
-        :param current_pris_num: int, representing the prisoner that failed.
-
-        :return: None.
-        """
-        self.cnt_ntfy_view_on_failure(current_pris_num)
-
-    def model_need_to_update_time(self, time: float) -> None:
-        """
-        Method for notifying the ViewManager that the ModelManager need to show prisoner success.\n
-        :param time: float, a number that represents the time that took the prisoner to get his target box.
-
-        :return: None.
-        """
-        self.cnt_ntfy_view_on_time(time)
-
-    def cnt_ntfy_to_view_pris_pos(self) -> tuple[int, int]:
-        """
-        Method for Controller notifying the model the position of a prisoner on screen.\n
-
-        :return: position tuple of (x,y).
-        """
-        return self.model.get_current_pris_pos()
-
     def cnt_ntfy_to_model_init_game(self, num_prisoners, num_round, initial_pos, print_specifically) -> dict:
         """
         Method for Controller notifying the model to initialize a new game.\n
@@ -144,13 +92,21 @@ class Controller:
         """
         return self.model.setup_game(num_prisoners, num_round, initial_pos, print_specifically)
 
-    def cnt_ntfy_to_model_run_game(self) -> None:
+    def cnt_ntfy_to_model_run_game(self) -> bool:
         """
         Method for Controller notifying the model to run game.\n
 
-        :return: None
+        :return: bool, False -> the game is over.
         """
-        self.model.run_game()
+        return self.model.run_game()
+
+    def cnt_ntfy_to_model_deliver_events(self) -> int:
+        """
+        Method for Controller notifying the model to deliver the events of the frame to the view.\n
+
+        :return: int, the number of delivered events.
+        """
+        return self.model.deliver_events()
 
     def cnt_ntfy_to_model_stop_game(self) -> None:
         """
@@ -160,21 +116,21 @@ class Controller:
         """
         self.model.stop_game()
 
-    def cnt_ntfy_to_view_pris_changed(self) -> int:
+    def cnt_ntfy_to_model_finish_game(self) -> list:
         """
-        Method for Controller notifying the model that the view need prisoner number.\n
+        Method for Controller notifying the model to jump to the end of the game.\n
 
-        :return: int, prisoner number.
+        :return: list, the (round number, number of prisoners that succeeded, every prisoner succeeded) of every round.
         """
-        return self.model.get_current_pris_num()
+        return self.model.finish_game()
 
-    def cnt_ntfy_to_view_round_num(self) -> int:
+    def cnt_ntfy_to_view_pris_changed(self) -> int:
         """
         Method for Controller notifying the model that the view need prisoner number.\n
 
-        :return: int, the current round number.
+        :return: int, prisoner number.
         """
-        return self.model.current_round
+        return self.model.get_current_pris_num()
 
     def cnt_update_boxes_pos(self) -> None:
         """
@@ -194,31 +150,23 @@ class Controller:
         """
         self.model.run_statistics(num_prisoners, num_rounds, print_specify)
 
-    def cnt_ntfy_view_need_output(self) -> str:
+    def cnt_ntfy_view_need_output(self) -> TextIO:
         """
         Method that tells to get statistics data.\n
-        :return: str, the statistics data.
+        :return: TextIO, a handle of the statistics report.
         """
         return self.model.get_statistics()
 
-    def get_from_model_game_status(self):
+    def cnt_ntfy_view_statistics_ready(self) -> bool:
         """
-        Method for Controller to retrieve from the model to its running status.\n
-
-        :return: bool, an indicator of game status in ModelManager.
+        Method that asks the model if the statistics of the current game were written.\n
+        :return: bool, True -> the statistics can be read.
         """
-        return self.model.get_game_status()
+        return self.model.is_statistics_ready()
 
     # *************************************************************************************************************************************************#
     # *************************************************** View related methods ************************************************************************#
 
-    def view_need_pris_pos(self) -> tuple[int, int]:
-        """
-        Method for notifying the ModelManager that the ViewManager need a prisoner with specific number on screen.\n
-        :return: tuple of (x,y)
-        """
-        return self.cnt_ntfy_to_view_pris_pos()
-
     def view_need_to_init_game(self, num_of_prisoners, num_of_rounds, initial_pos, print_specifically) -> dict:
         """
         Method for notifying the ModelManager that the ViewManager need to initialize game.\n
@@ -231,13 +179,6 @@ class Controller:
         """
         return self.cnt_ntfy_to_model_init_game(num_of_prisoners, num_of_rounds, initial_pos, print_specifically)
 
-    def view_need_round_num(self) -> int:
-        """
-        Method for notifying the ModelManager that the ViewManager need the current round number.\n
-        :return: int, representing round number.
-        """
-        return self.cnt_ntfy_to_view_round_num()
-
     def view_need_pris_num(self) -> int:
         """
         Method for notifying the ModelManager that the ViewManager need the current prisoner number.\n
@@ -245,19 +186,19 @@ class Controller:
         """
         return self.cnt_ntfy_to_view_pris_changed()
 
-    def view_need_to_run_game(self) -> None:
+    def view_need_to_run_game(self) -> bool:
         """
         Method for notifying the ModelManager that the ViewManager need to run the game.\n
-        :return: int, representing round number.
+        :return: bool, False -> the game is over.
         """
-        self.cnt_ntfy_to_model_run_game()
+        return self.cnt_ntfy_to_model_run_game()
 
-    def view_need_know_game_status(self) -> bool:
+    def view_need_events(self) -> int:
         """
-        Method for notifying the ModelManager that the ViewManager need the status of the game .\n
-        :return: bool, representing running game flag.
+        Method for notifying the ModelManager that the ViewManager is drawing a frame and needs the events that were published.\n
+        :return: int, the number of delivered events.
         """
-        return self.get_from_model_game_status()
+        return self.cnt_ntfy_to_model_deliver_events()
 
     def view_need_update_boxes_pos(self) -> None:
         """
@@ -273,6 +214,14 @@ class Controller:
         """
         self.cnt_ntfy_to_model_stop_game()
 
+    def view_need_to_finish_game(self) -> list:
+        """
+        Method for notifying the ModelManager that the ViewManager needs the results of the game without playing it.\n
+
+        :return: list, the (round number, number of prisoners that succeeded, every prisoner succeeded) of every round.
+        """
+        return self.cnt_ntfy_to_model_finish_game()
+
     def view_need_to_init_statistics(self, num_prisoners, num_rounds, print_specify) -> None:
         """
         Method that tells the controller to calculate statistics.\n
@@ -284,36 +233,21 @@ class Controller:
         """
         self.cnt_ntfy_to_model_init_stat(num_prisoners, num_rounds, print_specify)
 
-    def view_need_output(self) -> str:
+    def view_need_output(self) -> TextIO:
         """
         Method that tells the controller to get statistics data.\n
 
-        :return: str, the statistics output
+        :return: TextIO, a handle of the statistics report.
         """
         return self.cnt_ntfy_view_need_output()
 
-    def cnt_ntfy_view_handle_box_req(self, box_num) -> None:
+    def view_need_statistics_ready(self) -> bool:
         """
-        Method for Controller notifying the view that the model need a specific box number to be on screen.\n
-        :param box_num: int, representing the box number.
+        Method that tells the controller to check if the statistics of the current game were written.\n
 
-        :return: None.
+        :return: bool, True -> the statistics can be read.
         """
-        self.view.handle_box_request(box_num)
-
-    def cnt_ntfy_to_view_get_box_dimension(self) -> tuple[int, int]:
-        """
-        Method for Controller notifying the view that the model need the dimensions of box image for further calculation.\n
-        :return: tuple of (x,y) that represents box dimensions.
-        """
-        return self.view.get_box_dimensions()
-
-    def cnt_ntfy_to_view_get_pris_dimension(self) -> tuple[int, int]:
-        """
-        Method for Controller notifying the view that the model need the dimensions of prisoner image for further calculation.\n
-        :return: tuple of (x,y) that represents box dimensions.
-        """
-        return self.view.get_pris_dimensions()
+        return self.cnt_ntfy_view_statistics_ready()
 
     def cnt_ntfy_to_view_get_all_boxes_location(self) -> dict:
         """
@@ -355,5 +289,37 @@ class Controller:
         """
         self.view.handle_with_time(time)
 
+    def cnt_ntfy_view_pris_changed(self, current_pris_num) -> None:
+        """
+        Method for Controller notifying the view that the next prisoner has entered the room.\n
+        :param current_pris_num: int, a number that represents current prisoner number.
+        :return: None.
+        """
+        self.view.replace_prisoner(current_pris_num)
+
+    def cnt_ntfy_view_round_changed(self, round_num) -> None:
+        """
+        Method for Controller notifying the view that the next round has started.\n
+        :param round_num: int, a number that represents the current round number.
+        :return: None.
+        """
+        self.view.set_round(round_num)
+
+    def cnt_ntfy_view_pris_moved(self, pos) -> None:
+        """
+        Method for Controller notifying the view the position of the prisoner on screen.\n
+        :param pos: tuple of (x,y), the position of the current prisoner.
+        :return: None.
+        """
+        self.view.update_prisoner_location(pos)
+
+    def cnt_ntfy_view_upcoming_boxes(self, box_nums) -> None:
+        """
+        Method for Controller notifying the view the boxes that the current prisoner opens next.\n
+        :param box_nums: tuple of int, the box numbers in the order the prisoner opens them.
+        :return: None.
+        """
+        self.view.prefetch_boxes(box_nums)
+
 
 
@@ -0,0 +1,82 @@
+from collections import defaultdict
+
+# The events that the model publishes for the view
+BOX_OPENED = "box_opened"
+PRISONER_SUCCEEDED = "prisoner_succeeded"
+PRISONER_FAILED = "prisoner_failed"
+PRISONER_CHANGED = "prisoner_changed"
+ROUND_CHANGED = "round_changed"
+PRISONER_MOVED = "prisoner_moved"
+TIME_UPDATED = "time_updated"
+BOXES_UPCOMING = "boxes_upcoming"
+
+# Events that describe a state rather than a change, only their last value in a batch is delivered
+LATEST_ONLY = (PRISONER_MOVED, TIME_UPDATED, BOXES_UPCOMING)
+
+
+class EventBus:
+    """
+    A message bus that the model publishes its state changes to, the events are queued and delivered to the subscribers in one batch
+    when the view flushes the bus once per frame, so the view never polls the model for the game state.\n
+    The events are delivered in the order they were published, the latest-only events are delivered after them with their last value.\n
+
+    Attributes:\n
+
+    subscribers: the handlers of every event -> dict of {event: list of callables}.\n
+    latest_only: the events of which only the last value is delivered -> tuple of str.\n
+    pending: the queued events in the order they were published -> list of (event, args).\n
+    latest: the last value of every latest-only event that was published since the last flush -> dict of {event: args}.
+    """
+
+    def __init__(self, latest_only: tuple = LATEST_ONLY) -> None:
+        """
+        Initialize EventBus object.\n
+        :param latest_only: tuple of str, the events of which only the last value is delivered.
+        :return: None.
+        """
+        self.subscribers = defaultdict(list)
+        self.latest_only = latest_only
+        self.pending = []
+        self.latest = {}
+
+    def subscribe(self, event: str, handler) -> None:
+        """
+        Register a handler that is called with the arguments of every delivered event of a kind.\n
+        :param event: str, the event name.
+        :param handler: callable, called as handler(*args).
+        :return: None.
+        """
+        self.subscribers[event].append(handler)
+
+    def publish(self, event: str, *args) -> None:
+        """
+        Queue an event until the next flush.\n
+        :param event: str, the event name.
+        :param args: the arguments that the handlers are called with.
+        :return: None.
+        """
+        if event in self.latest_only:
+            self.latest[event] = args
+        else:
+            self.pending.append((event, args))
+
+    def flush(self) -> int:
+        """
+        Deliver all the queued events to their subscribers and empty the queue.\n
+        :return: int, the number of events that were delivered.
+        """
+        batch, self.pending = self.pending, []
+        batch.extend(self.latest.items())
+        self.latest = {}
+        for event, args in batch:
+            for handler in self.subscribers[event]:
+                handler(*args)
+        return len(batch)
+
+    def clear(self) -> None:
+        """
+        Drop the queued events without delivering them.\n
+        :return: None.
+        """
+        self.pending = []
+        self.latest = {}
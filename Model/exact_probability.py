@@ -0,0 +1,59 @@
+import math
+from functools import lru_cache
+
+# Windows up to this width are summed exactly on every step, wider windows are updated incrementally and summed exactly once
+# every max_attempts steps, which keeps the relative error of the recurrence below num_prisoners * machine epsilon
+EXACT_WINDOW = 32
+
+
+@lru_cache(maxsize=None)
+def success_probability(num_prisoners: int, max_attempts: int) -> float:
+    """
+    Calculate the exact probability that every cycle of a random permutation of num_prisoners boxes is at most max_attempts long,
+    which is the probability that all the prisoners find their number when each one may open max_attempts boxes.\n
+    When max_attempts >= num_prisoners / 2 at most one cycle can be too long, so the value is 1 - (1/(k+1) + ... + 1/n).
+    Otherwise the recurrence m * a(m) = a(m-1) + ... + a(m-k) is run in O(n) with a sliding window sum.\n
+    :param num_prisoners: int, the number of prisoners (and boxes).
+    :param max_attempts: int, the number of boxes each prisoner may open.
+    :return: float, the probability that the round succeeds.
+    """
+    if max_attempts >= num_prisoners:
+        return 1.0
+    if max_attempts <= 0:
+        return 0.0
+    if 2 * max_attempts >= num_prisoners:
+        return 1.0 - math.fsum(1 / length for length in range(max_attempts + 1, num_prisoners + 1))
+
+    probabilities = (num_prisoners + 1) * [0.0]  # probabilities[m] -> all cycles of a permutation of m boxes are short enough
+    probabilities[0] = 1.0
+    window = 0.0  # sum of probabilities[m - max_attempts .. m - 1]
+    for m in range(1, num_prisoners + 1):
+        if max_attempts <= EXACT_WINDOW or m % max_attempts == 0:
+            window = math.fsum(probabilities[max(0, m - max_attempts):m])
+        else:
+            window += probabilities[m - 1]
+            if m - 1 - max_attempts >= 0:
+                window -= probabilities[m - 1 - max_attempts]
+        probabilities[m] = window / m
+    return probabilities[num_prisoners]
+
+
+@lru_cache(maxsize=None)
+def longest_cycle_distribution(num_prisoners: int) -> tuple:
+    """
+    Calculate the exact distribution of the longest cycle of a random permutation of num_prisoners boxes.\n
+    A cycle longer than n/2 is unique, so P(longest = L) = 1/L above n/2. Below it every value costs one O(n) recurrence, so the
+    full distribution is meant for the sizes that are also simulated, up to a few tens of thousands of prisoners.\n
+    :param num_prisoners: int, the number of prisoners (and boxes).
+    :return: tuple, item L is the probability that the longest cycle is exactly L long (item 0 is always 0).
+    """
+    distribution = (num_prisoners + 1) * [0.0]
+    half = num_prisoners // 2
+    for length in range(half + 1, num_prisoners + 1):
+        distribution[length] = 1 / length
+    previous = 0.0
+    for length in range(1, half + 1):
+        current = success_probability(num_prisoners, length)
+        distribution[length] = current - previous
+        previous = current
+    return tuple(distribution)
@@ -1,6 +1,15 @@
+from threading import Thread
+from typing import TextIO
+
 from Model.boxm import BoxM
+from Model.event_bus import EventBus, BOX_OPENED, PRISONER_SUCCEEDED, PRISONER_FAILED, PRISONER_CHANGED, ROUND_CHANGED, \
+    PRISONER_MOVED, TIME_UPDATED, BOXES_UPCOMING
 from Model.prisonerm import PrisonerM
 from Model.probabilities_handler import ProbabilitiesHandler
+from Model.round_timeline import RoundTimeline
+
+# The number of boxes of the chain, from the target box, that the view is told about ahead of the prisoner
+PREFETCH_DEPTH = 4
 
 
 class ModelManger:
@@ -11,17 +20,22 @@ class ModelManger:
 
     Attributes:\n
 
-    dict_rounds: all rounds and its relational list representation -> dictionary of {round number: list of box numbers}.\n
+    dict_rounds: all rounds and its relational list representation, regenerated from the seed of each round on demand
+     -> mapping of {round number: list of box numbers}.\n
     dict_prisoners: all prisoners mapped by their number-> dictionary of {prisoner number: PrisonerM object}.\n
     dict_boxes:  all boxes mapped by their number-> dictionary of {box number: BoxM object}.\n
+    timeline: the events of the current round computed from its cycles -> RoundTimeline object.\n
     listener: coordinates the activity between the backend and the frontend -> Controller object.\n
+    events: the state changes of the game that are delivered to the view once per frame -> EventBus object.\n
+    requested_box: the last target box that the view was told about -> int.\n
     current_round: the number of the current round-> int.\n
     current_prisoner: the current prisoner number-> int.\n
     succeeded: the number of succeeded prisoners in the current game-> int.\n
     num_prisoners: the total number of prisoners -> int.\n
     num_rounds: the total number of rounds -> int.\n
     print_specifically: user choice if he/she wants to print to file "PrisonersResults.txt" the specific route of each prisoner or not -> bool.\n
-    prob_handler: a probability handler object, handles with probability calculations of each round and the total success rate -> ProbabilitiesHandler object.
+    prob_handler: a probability handler object, handles with probability calculations of each round and the total success rate -> ProbabilitiesHandler object.\n
+    stats_thread: the background thread that calculates the statistics of the current game -> Thread object.
     """
 
     def __init__(self) -> None:
@@ -32,6 +46,7 @@ class ModelManger:
         self.dict_rounds = {}  # dict of {round_num:list dependencies of boxes}
         self.dict_prisoners = {}  # dict of {num_pris:prisoner}
         self.dict_boxes = {}  # dict of {num_box:box}
+        self.timeline = None
         self.current_round = 1
         self.current_pris_num = 1
         self.succeeded = 0
@@ -40,63 +55,87 @@ class ModelManger:
         self.is_running_game = False
         self.initial_pos = None
         self.prob_handler = None
+        self.stats_thread = None
         self.listener = None
+        self.events = EventBus()
+        self.requested_box = None
 
     # ************************* MVC Methods ******************************************#
 
     def model_request_box(self) -> None:
         """
-        Method for requesting from ViewManager a specific box to be placed on screen.\n
+        Method for telling ViewManager the target box of the current prisoner once per target box, every box has its place in the
+        world grid so nothing is brought to screen, the view is told the boxes that the prisoner opens next.\n
         :return: None.
         """
-        self.listener.model_need_box(self.dict_prisoners[self.current_pris_num].target_box.box_num)
-
-    def model_request_box_dimensions(self) -> tuple[int, int]:
-        """
-        Method for requesting from ViewManager box image dimensions in purpose to help the prisoner calculate its route to box without collisions.\n
-        :return: a position tuple in form -> tuple[int,int].
-        """
-        return self.listener.model_need_box_dimensions()
+        box_num = self.dict_prisoners[self.current_pris_num].target_box.box_num
+        if box_num != self.requested_box:
+            self.requested_box = box_num
+            self.model_request_upcoming_boxes()
 
-    def model_request_pris_dimensions(self) -> tuple[int, int]:
+    def model_request_upcoming_boxes(self) -> None:
         """
-        Method for requesting from ViewManager prisoner image dimensions in purpose to help the prisoner calculate its route to box without collisions.\n
-        :return: a position tuple in form -> tuple[int,int].
+        Method for publishing to ViewManager the boxes that the current prisoner opens next, the target box and the boxes after it
+        on the chain, so the view prepares them before the prisoner walks there.\n
+        :return: None.
         """
-        return self.listener.model_need_pris_dimensions()
+        prisoner = self.dict_prisoners[self.current_pris_num]
+        opened = len(prisoner.visited_boxes)  # the target box is the first box of the open order that was not opened yet
+        self.events.publish(BOXES_UPCOMING, tuple(prisoner.boxes_to_open[opened:opened + PREFETCH_DEPTH]))
 
     def model_request_to_open_box(self, current_box_num) -> None:
         """
-        Method for requesting from ViewManager to open specific box number.\n
+        Method for publishing to ViewManager to open specific box number.\n
         :param current_box_num: int, a number that represents specific box number.
         :return: None.
         """
-        self.listener.model_need_to_open_box(current_box_num)
+        self.events.publish(BOX_OPENED, current_box_num)
 
     def model_request_success_prisoner(self, current_pris_num, num_succeeded) -> None:
         """
-        Method for requesting from ViewManager to open specific box number.\n
+        Method for publishing to ViewManager the success of a prisoner.\n
         :param current_pris_num: int, a number that represents prisoner number.
         :param num_succeeded: int, a number that represents the number of prisoners that managed to escape.
         :return: None.
         """
-        self.listener.model_need_to_report_success(current_pris_num, num_succeeded)
+        self.events.publish(PRISONER_SUCCEEDED, current_pris_num, num_succeeded)
 
     def model_request_failure_prisoner(self, current_pris_num) -> None:
         """
-        Method for requesting from ViewManager to open specific box number.\n
+        Method for publishing to ViewManager the failure of a prisoner.\n
         :param current_pris_num: int, a number that represents prisoner number.
         :return: None.
         """
-        self.listener.model_need_to_report_failure(current_pris_num)
+        self.events.publish(PRISONER_FAILED, current_pris_num)
 
     def model_request_time_prisoner(self, time: float) -> None:
         """
-        Method for requesting from ViewManager to open specific box number.\n
+        Method for publishing to ViewManager the time that took the prisoner to get his target box.\n
         :param time: float, a number that represents the time that took the prisoner to get his target box.
         :return: None.
         """
-        self.listener.model_need_to_update_time(time)
+        self.events.publish(TIME_UPDATED, time)
+
+    def model_request_new_prisoner(self) -> None:
+        """
+        Method for publishing to ViewManager that the next prisoner has entered the room.\n
+        :return: None.
+        """
+        self.events.publish(PRISONER_CHANGED, self.current_pris_num)
+
+    def model_request_new_round(self) -> None:
+        """
+        Method for publishing to ViewManager that the next round has started.\n
+        :return: None.
+        """
+        self.events.publish(ROUND_CHANGED, self.current_round)
+
+    def deliver_events(self) -> int:
+        """
+        Method that delivers the events that were published since the last frame to the view.\n
+        :return: int, the number of delivered events.
+        """
+        return self.events.flush()
 
     def ntfy_to_view_get_all_boxes_pos(self) -> dict:
         """
@@ -130,7 +169,9 @@ class ModelManger:
                                                             pace=5,
                                                             all_boxes=self.dict_boxes,
                                                             target_box=self.dict_boxes[index_pris + 1],
-                                                            all_prisoners=self.total_pris)
+                                                            all_prisoners=self.total_pris,
+                                                            boxes_to_open=self.timeline.boxes_opened(index_pris + 1),
+                                                            succeeds=self.timeline.succeeds(index_pris + 1))
 
     def init_boxes(self, num_pris: int) -> None:
         """
@@ -143,8 +184,10 @@ class ModelManger:
         for index_box in range(num_pris):
             box = BoxM(box_num=index_box + 1)
             self.dict_boxes[index_box + 1] = box
+        list_of_boxes = self.dict_rounds[self.current_round]  # fetched once, the round may be regenerated from its seed
+        self.timeline = RoundTimeline(list_of_boxes)
         for box_num in self.dict_boxes.keys():  # box num starts from 1 to n+1
-            self.dict_boxes[box_num].set_next_box(self.dict_boxes[self.dict_rounds[self.current_round][box_num - 1]])  # redirecting each box to current next box
+            self.dict_boxes[box_num].set_next_box(self.dict_boxes[list_of_boxes[box_num - 1]])  # redirecting each box to current next box
         self.set_all_boxes_pos()
 
     def set_all_boxes_pos(self) -> None:
@@ -153,39 +196,50 @@ class ModelManger:
         :return: None.
         """
         boxes_on_screen = self.ntfy_to_view_get_all_boxes_pos()
-        for box_num in self.dict_boxes.keys():
-            if box_num not in boxes_on_screen.keys():
-                continue  # There are might more boxes on screen up ahead
-            self.dict_boxes[box_num].set_pos(boxes_on_screen[box_num])
+        for box_num, pos in boxes_on_screen.items():
+            if box_num not in self.dict_boxes:
+                continue  # The view may hold boxes of another number of prisoners
+            self.dict_boxes[box_num].set_pos(pos)
 
     def setup_game(self, num_pris: int, num_rounds: int, initial_pos: tuple[int, int],
                    print_specifically: bool) -> dict:
         """
         The method that initialize all  calculations by ProbabilitiesHandler and organize all the prisoner and boxes objects.\n
+        Only the seeds of the rounds are drawn here, each round is built when the game reaches it and the statistics of the same rounds
+        are calculated in a background thread, so the game starts at once whatever the number of rounds is. The statistics of the
+        last game are cancelled and the new thread waits for them to stop, so the UI never waits for them.\n
         :param num_pris: int, the total number of prisoners.
         :param num_rounds: int, the total number of rounds.
         :param initial_pos: tuple, the position tuple of (x,y) in form -> tuple[int,int].
         :param print_specifically: bool ,the indication for specification in the PrisonersResults.txt.
         :return: the round dict of list dependencies.
         """
+        self.cancel_statistics()
         self.prob_handler = ProbabilitiesHandler(num_prisoners=num_pris, num_rounds=num_rounds,
-                                                 print_specifically=print_specifically)
-        self.dict_rounds = self.prob_handler.run_probabilities()
+                                                 print_specifically=print_specifically, backend="numpy", workers=None,
+                                                 start_method="spawn")
+        self.dict_rounds = self.prob_handler.prepare_rounds()
+        self.stats_thread = Thread(target=self.run_game_statistics, args=(self.stats_thread, self.prob_handler), daemon=True)
+        self.stats_thread.start()
         self.current_round = 1
         self.total_rounds = num_rounds
         self.total_pris = num_pris
         self.initial_pos = initial_pos
         self.init_boxes(num_pris=num_pris)
         self.init_prisoners(num_pris=num_pris, initial_pos=initial_pos)
+        self.requested_box = None
+        self.events.clear()
         self.is_running_game = True
         return self.dict_rounds
 
-    def run_game(self) -> None:
+    def run_game(self) -> bool:
         """
         The actual method that responsible for the game functionality, the method is operated by the view run loop which is infinite.\n
-        All the prisoners are searching their number by ProbabilityManager calculations.\n
-        :return: None.
+        All the prisoners are searching their number by ProbabilityManager calculations, the changes are published to the events bus.\n
+        :return: bool, False -> the game is over.
         """
+        if not self.is_running_game:
+            return False
         status = self.dict_prisoners[self.current_pris_num].is_still_searching()  # status[0] is indication of search, status[1] is the current box num
 
         self.model_request_time_prisoner(self.dict_prisoners[self.current_pris_num].time_interval)  # Updating the view on time intervals
@@ -196,17 +250,12 @@ class ModelManger:
             if not self.dict_prisoners[self.current_pris_num].on_exit:  # -1 is the exit point
                 self.model_request_box()  # Model alerts the View that he needs a new box, the view should bring it to screen if it's not there
 
-            box_dimensions = self.model_request_box_dimensions()  # Getting the dimensions of box image
-            pris_dimensions = self.model_request_pris_dimensions()  # Getting the dimensions of box image
-            self.dict_prisoners[self.current_pris_num].navigate(box_width=box_dimensions[0],
-                                                                box_height=box_dimensions[1],
-                                                                pris_width=pris_dimensions[0],
-                                                                pris_height=pris_dimensions[1])
+            self.dict_prisoners[self.current_pris_num].navigate()
         else:
 
             # Replacing Prisoner
             if self.dict_prisoners[self.current_pris_num].found_number:
-                self.succeeded += 1
+                self.succeeded = self.timeline.succeeded_until[self.current_pris_num]  # the running count of the round
                 self.model_request_success_prisoner(self.current_pris_num, self.succeeded)  # Reporting to view on successes
 
             # Reporting to view on failures
@@ -224,10 +273,15 @@ class ModelManger:
                 if self.current_round <= self.total_rounds:
                     self.init_boxes(num_pris=self.total_pris)
                     self.init_prisoners(num_pris=self.total_pris, initial_pos=self.initial_pos)
+                    self.model_request_new_round()
 
                 # Intializing parameters of ModelManger
                 else:
                     self.stop_game()
+                    return False
+            self.model_request_new_prisoner()
+        self.events.publish(PRISONER_MOVED, self.dict_prisoners[self.current_pris_num].get_pos())
+        return True
 
     def get_current_pris_num(self) -> int:
         """
@@ -260,6 +314,20 @@ class ModelManger:
         self.current_round = 1
         self.current_pris_num = 1
 
+    def finish_game(self) -> list:
+        """
+        Method that jumps to the end of the running game, the results of every round are taken from the round timelines instead
+        of being played, and the game is stopped.\n
+        :return: list, the (round number, number of prisoners that succeeded, every prisoner succeeded) of every round.
+        """
+        results = []
+        for round_num in range(1, self.total_rounds + 1):
+            timeline = self.timeline if round_num == self.current_round else RoundTimeline(self.dict_rounds[round_num])
+            results.append((round_num, timeline.total_succeeded(), timeline.round_succeeded()))
+        self.stop_game()
+        self.events.clear()  # The events of the skipped part of the game are never shown
+        return results
+
     def run_statistics(self, num_prisoners, num_rounds, print_specify):
         """
         Method that tells the probabilities' handler to calculate statistics.\n
@@ -269,14 +337,56 @@ class ModelManger:
 
         :return: None.
         """
-        self.prob_handler = ProbabilitiesHandler(num_prisoners, num_rounds, print_specify)
-        self.prob_handler.output = ""
+        self.cancel_statistics()
+        self.wait_statistics()
+        self.prob_handler = ProbabilitiesHandler(num_prisoners, num_rounds, print_specify, backend="numpy",
+                                                 workers=None, start_method="spawn")  # the game process runs SDL, Tk and threads
         self.prob_handler.run_probabilities()
 
-    def get_statistics(self) -> str:
+    @staticmethod
+    def run_game_statistics(previous_thread: Thread, prob_handler: ProbabilitiesHandler) -> None:
+        """
+        Method that calculates the statistics of a game in the background, after the statistics of the last game stopped, so two runs
+        never write the results file together.\n
+        :param previous_thread: Thread, the thread of the statistics of the last game, None -> there were none.
+        :param prob_handler: ProbabilitiesHandler, the handler of the statistics of the game.
+
+        :return: None.
+        """
+        if previous_thread:
+            previous_thread.join()
+        prob_handler.run_probabilities()
+
+    def cancel_statistics(self) -> None:
         """
-        Method that get the statistics data.\n
+        Method that cancels the statistics of the last game, they stop after the chunk of rounds that is being simulated.\n
 
         :return: None.
         """
-        return self.prob_handler.output
+        if self.prob_handler:
+            self.prob_handler.cancel()
+
+    def wait_statistics(self) -> None:
+        """
+        Method that waits for the statistics of the last game to be written, so two runs never write the results file together.\n
+
+        :return: None.
+        """
+        if self.stats_thread:
+            self.stats_thread.join()
+
+    def is_statistics_ready(self) -> bool:
+        """
+        Method that checks if the statistics of the current game were written.\n
+
+        :return: bool, True -> the statistics can be read.
+        """
+        return self.stats_thread is None or not self.stats_thread.is_alive()
+
+    def get_statistics(self) -> TextIO:
+        """
+        Method that get the statistics data, the report is streamed from "PrisonersResults.txt" instead of being held in memory.\n
+
+        :return: TextIO, a handle of the report that the caller reads incrementally and closes.
+        """
+        return self.prob_handler.open_report()
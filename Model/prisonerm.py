@@ -1,6 +1,7 @@
 from time import time
 from Model.boxm import BoxM
-from View.settings import EXIT_POINT
+from Model.route_cache import route_between
+from View.layout import EXIT_POINT
 
 
 class PrisonerM:
@@ -14,6 +15,13 @@ class PrisonerM:
     pace: the pace of the prisoner, int.\n
     visited_boxes: all the boxes that the prisoner has opened, dictionary of {box number: value box}.\n
     all_boxes: all the boxes located on screen-> dictionary of {box number:value box}.\n
+    boxes_to_open: the boxes the prisoner opens in order, known from the round timeline -> list of box numbers.\n
+    chain_length: the number of boxes the prisoner opens -> int.\n
+    succeeds: the prisoner finds its number, known from the round timeline -> bool.\n
+    route: the cached walk to the target box, the position after every step -> tuple of (x,y).\n
+    route_step: the index of the next step of the route -> int.\n
+    route_origin: the position that the route starts from -> tuple of (x,y).\n
+    route_target: the position that the route leads to -> tuple of (x,y).\n
     trgt_box: the current target box of the prisoner -> BoxM object.\n
     found_number: indicator if the prisoner has found his number -> bool.\n
     updated_pos: flag the represents if the prisoner has been changed position -> bool.
@@ -23,7 +31,8 @@ class PrisonerM:
     time_start: time object, a time measurement tool for measuring each box interval, end point.
     """
 
-    def __init__(self, num_prisoner: int, position: tuple, pace: int, all_boxes: dict, target_box: BoxM, all_prisoners: int):
+    def __init__(self, num_prisoner: int, position: tuple, pace: int, all_boxes: dict, target_box: BoxM, all_prisoners: int,
+                 boxes_to_open: list, succeeds: bool):
         """
         Initialize the PrisonerM object.\n
         :param num_prisoner: int , represents prisoner number.
@@ -32,12 +41,21 @@ class PrisonerM:
         :param all_boxes:dict, dictionary of BoxM objects located on screen.
         :param target_box:BoxM object, represents the target box.
         :param all_prisoners:int, represents the number of all prisoners.
+        :param boxes_to_open:list, the boxes the prisoner opens in order, the cycle of its box starting at its box.
+        :param succeeds:bool, the prisoner finds its number.
         """
         self.prisoner_num = num_prisoner
         self.pos = position
         self.pace = pace
         self.visited_boxes = dict()  # dictionary of {number box:value box}
         self.all_boxes = all_boxes  # dictionary of {number box:value box}
+        self.boxes_to_open = boxes_to_open
+        self.chain_length = len(boxes_to_open)
+        self.succeeds = succeeds
+        self.route = ()
+        self.route_step = 0
+        self.route_origin = None
+        self.route_target = None
         self.target_box = target_box
         self.found_number = False
         self.updated_pos = False
@@ -86,6 +104,8 @@ class PrisonerM:
         This method check if the prisoner is still searching his target box, and replaces it if there is a need.\n
         As long the prisoner is still searching for his number the output of this function will be True otherwise
         if the prisoner got disqualified or won the game, the function will return False.\n
+        The boxes and the outcome are known from the round timeline, the prisoner opens the boxes of its chain in order and then
+        goes to the exit or fails.\n
         :return: tuple of (bool,int),the left hand is indication of relevance of the participant the right hand is the current box number.
         """
         if self.target_box.get_pos()[0] == self.pos[0] and \
@@ -100,58 +120,54 @@ class PrisonerM:
                 self.found_number = True
                 return False, self.prisoner_num
 
-            if self.target_box.get_nxt_box().get_num() == self.prisoner_num and len(self.visited_boxes) <= self.total_pris_count // 2:
+            if len(self.visited_boxes) == self.chain_length and self.succeeds:
                 self.on_exit = True
                 fake_box = BoxM(-1)
                 fake_box.set_pos(EXIT_POINT)
                 self.target_box = fake_box
                 # print(f"Prisoner number {self.prisoner_num} found his number at box number {temp_box_num} at {self.target_box.pos}")
                 return True, temp_box_num
-            if self.target_box.get_nxt_box().get_num() in self.visited_boxes.keys():
+            if len(self.visited_boxes) == self.chain_length:
                 # print(f"Prisoner number {self.prisoner_num} got disqualified!")
                 return False, self.target_box.get_num()
             else:
                 # print(f"Prisoner number {self.prisoner_num} visited box number {self.target_box.box_num}")
-                self.target_box = self.target_box.get_nxt_box()
+                self.target_box = self.all_boxes[self.boxes_to_open[len(self.visited_boxes)]]
                 return True, temp_box_num
         return True, self.target_box.get_num()
 
     def move_to_box(self, blocked: bool) -> None:
         """
         This method check if a prisoner is blocked, it receives a boolean variable that tells if the prisoner is blocked or not.\n
+        A prisoner that is not blocked takes the next step of its cached route: upwards or downwards first and then left or right.\n
         :param: blocked: bool, indication if the prisoner is blocked (checked by method check_collision within PrisonerM).
         :return: bool, is the object moving or not.
         """
-        if self.target_box.get_pos()[1] < self.pos[1] and not self.updated_pos and not blocked:  # moving upwards
-            self.set_pos((self.pos[0], self.pos[1] - self.pace))
-            self.updated_pos = True
-        elif self.target_box.get_pos()[1] > self.pos[1] and not self.updated_pos and not blocked:  # moving downwards
-            self.set_pos((self.pos[0], self.pos[1] + self.pace))
-            self.updated_pos = True
-        if self.target_box.get_pos()[0] < self.pos[0] and not self.updated_pos and not blocked:  # moving left
-            self.set_pos((self.pos[0] - self.pace, self.pos[1]))
-            self.updated_pos = True
-        elif self.target_box.get_pos()[0] > self.pos[0] and not self.updated_pos and not blocked:  # moving right
-            self.set_pos((self.pos[0] + self.pace, self.pos[1]))
+        if self.route_step < len(self.route) and not self.updated_pos and not blocked:
+            self.set_pos(self.route[self.route_step])
+            self.route_step += 1
             self.updated_pos = True
         self.updated_pos = False
 
-    def navigate(self, box_width: int, box_height: int, pris_width: int, pris_height: int) -> None:
+    def plan_route(self) -> None:
+        """
+        This method fetches the cached route from the current position to the target box.\n
+        :return: None.
+        """
+        self.route_origin = self.pos
+        self.route_target = self.target_box.get_pos()
+        self.route = route_between(self.pos, self.route_target, self.pace)
+        self.route_step = 0
+
+    def navigate(self) -> None:
         """
-        This function swipe all box positions on screen, and check if the prisoner is about to collide box image on screen.\n
-        :param box_width: int, represents a box width of an image.
-        :param box_height: int, represents a box height of an image.
-        :param pris_width: int, represents a prisoner width of an image.
-        :param pris_height: int, represents a prisoner height of an image.
+        This function moves the prisoner one step towards the target box, the route is planned when the target changes or the
+        prisoner left the route, so a step is a lookup into the cached route.\n
         :return: None.
         """
-        for box_number in self.all_boxes.keys():
-            if not self.all_boxes[box_number].get_pos():
-                continue  # There are might more boxes on screen up ahead
-            if self.all_boxes[box_number].get_pos()[0] <= self.pos[0] + pris_width <= self.all_boxes[box_number].get_pos()[0] + box_width:  # collision on axis x
-                self.move_to_box(blocked=True)
-            if self.all_boxes[box_number].get_pos()[1] <= self.pos[1] and self.pos[1] + pris_height <= self.all_boxes[box_number].get_pos()[1] + box_height:  # collision on axis y
-                self.move_to_box(blocked=True)
+        expected_pos = self.route[self.route_step - 1] if self.route_step else self.route_origin
+        if self.route_target != self.target_box.get_pos() or expected_pos != self.pos:
+            self.plan_route()
         self.move_to_box(blocked=False)
 
     def measure_time(self) -> None:
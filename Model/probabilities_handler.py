@@ -1,6 +1,32 @@
-import random
-from copy import deepcopy
-from threading import Thread, Lock
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from statistics import NormalDist
+from typing import TextIO
+
+import numpy as np
+
+from Model.exact_probability import success_probability
+from Model.round_engine import cycle_lengths, max_cycle_lengths, round_seeds, rounds_per_block, rounds_per_chunk, simulate_chunk
+from Model.round_store import ArrayRoundStore, RoundStore, SeededRoundStore
+
+
+def wilson_interval(successes: int, trials: int, confidence: float) -> tuple[float, float]:
+    """
+    Calculate the Wilson score interval of a success rate.\n
+    :param successes: int, the number of successful rounds.
+    :param trials: int, the number of rounds.
+    :param confidence: float, the confidence level of the interval, for example 0.99.
+    :return: tuple of (float, float), the lower and upper bounds of the success rate.
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    center = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
 
 
 class ProbabilitiesHandler:
@@ -13,28 +39,67 @@ class ProbabilitiesHandler:
 
     filename: The designated file for showing game details.\n
     file: file pointer within file system.\n
-    lock_shuffle: mutex lock for protection to critical blocks.\n
+    buffer_size: the size in bytes of the buffer of the report file.\n
     num_prisoners: the total number of prisoners -> int.\n
     num_rounds: the total number of rounds -> int.\n
     print_specifically: user choice if he/she wants to print to file "PrisonersResults.txt" the specific route of each prisoner or not -> bool.\n
-    dict_rounds: all rounds and its relational list representation -> dictionary of {round number: list of box numbers}.
+    dict_rounds: all rounds and its relational list representation, either only the seed of each round from which the list is
+    regenerated on demand or a compact int32 matrix -> RoundStore of {round number: list of box numbers}.\n
+    backend: the engine that simulates the rounds, "python" walks each round in pure Python and "numpy" evaluates blocks of rounds
+    as 2-D arrays -> str.\n
+    workers: the number of processes that simulate chunks of rounds in parallel -> int.\n
+    seed: the master seed of the run, every round draws its own seed from it -> int.\n
+    rounds_used: the number of rounds that the last run simulated -> int.\n
+    success_rounds: the number of successful rounds of the last run -> int.\n
+    interval: the (lower, upper) confidence interval of the success rate that the last adaptive run reached -> tuple[float, float].\n
+    store: the kind of dict_rounds, "seeds" -> SeededRoundStore, "array" -> ArrayRoundStore -> str.\n
+    store_path: the ".npy" file that an "array" store is memory-mapped from, None -> the matrix is kept in memory -> str.\n
+    start_method: the way the worker processes are started, for example "spawn", None -> the default of the platform -> str.\n
+    pool_elements: the number of box entries from which a run is simulated by a process pool, a smaller run is faster in this
+    process than the start of the worker processes, which import the game again when they are spawned -> int.\n
+    cancelled: the run was cancelled, it stops after the chunk of rounds that is being simulated -> bool.
     """
     filename = "PrisonersResults.txt"
     file = None
-    lock_shuffle = Lock()
+    buffer_size = 1 << 20
+    backends = ("python", "numpy")
+    stores = ("seeds", "array")
+    pool_elements = 1 << 25
 
-    def __init__(self, num_prisoners: int, num_rounds: int, print_specifically: bool):
+    def __init__(self, num_prisoners: int, num_rounds: int, print_specifically: bool, backend: str = "python",
+                 workers: int = 1, seed: int = None, store: str = "seeds", store_path: str = None, filename: str = None,
+                 start_method: str = None):
         """
         Initialization of ProbabilitiesHandler object.\n
         :param num_prisoners: int, the number of prisoners.
         :param num_rounds: int, the number of rounds.
         :param print_specifically: bool, indication of details specification in file "PrisonerResults.txt".
+        :param backend: str, the simulation engine, one of ProbabilitiesHandler.backends.
+        :param workers: int, the number of worker processes, None -> one per core.
+        :param seed: int, the master seed of the run, None -> fresh entropy from the operating system.
+        :param store: str, the kind of round store, one of ProbabilitiesHandler.stores.
+        :param store_path: str, the file of an "array" store, None -> the store is kept in memory.
+        :param filename: str, the report file, None -> "PrisonersResults.txt".
+        :param start_method: str, the start method of the worker processes, None -> the default of the platform.
         """
+        if store not in self.stores:
+            raise ValueError("Unknown store {}, expected one of {}".format(store, self.stores))
         self.num_prisoners = num_prisoners
         self.num_rounds = num_rounds
         self.print_specifically = print_specifically
+        self.set_backend(backend)
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.store = store
+        self.store_path = store_path
+        if filename is not None:
+            self.filename = filename
         self.dict_rounds = {}
-        self.output = ""
+        self.rounds_used = 0
+        self.success_rounds = 0
+        self.interval = None
+        self.start_method = start_method
+        self.cancelled = False
 
     def run_route(self, list_of_boxes: list, print_route: bool) -> bool:
         """
@@ -44,80 +109,45 @@ class ProbabilitiesHandler:
         :return: bool, True -> prisoner succeed, False -> prisoner Failed.
         """
         number_of_boxes = len(list_of_boxes)
-        list_of_success = number_of_boxes * [0]
-        for j in range(number_of_boxes):
-            if print_route:
-                print("Prisoner number:", j + 1, file=self.file)
-                self.output += "--Prisoner number:{}--\n".format(j + 1)
-
-            visited_boxes = []
-            pointer_box = list_of_boxes[j]
-            current_box = j + 1
-            visited_boxes.append(pointer_box)
-            for attempts in range(number_of_boxes):
-                success = False
-                if print_route:
-                    print("Box number", current_box, " is leading to box", pointer_box + 1, file=self.file)
-                    self.output += "Box number {} is leading to box {}\n".format(current_box, pointer_box + 1)
-
-                if pointer_box == j and attempts < (number_of_boxes // 2):
-                    success = True
-                    list_of_success[j] = 1
-                    break
-                else:
-                    if pointer_box == j:
-                        break
-                    else:
-                        current_box = pointer_box + 1
-                        pointer_box = list_of_boxes[pointer_box]
-                        visited_boxes.append(pointer_box)
-            if print_route:
-                self.output += "\n"
-                print("Total Boxes:", end=" ", file=self.file)
-                self.output += "Total Boxes: "
-
-                for o in range(number_of_boxes):
-                    print(list_of_boxes[o] + 1, end=" ", file=self.file)
-                    self.output += "{} ".format(list_of_boxes[o] + 1)
-
-                print(file=self.file)
-                self.output += "\n"
-
-                print("Visited in boxes:", end=" ", file=self.file)
-                self.output += "Visited in boxes: "
-
-                for g in range(len(visited_boxes)):
-                    print(visited_boxes[g] + 1, end=" ", file=self.file)
-                    self.output += "{} ".format(list_of_boxes[g] + 1)
-
-                print(file=self.file)
-                self.output += "\n"
-
-                if success:
-                    print("Prisoner number", j + 1, "has been succeeded,",
-                          "the chain length is", (attempts + 1), file=self.file)
-                    self.output += "Prisoner number {} has been succeeded, the chain length is {}".format(j + 1, attempts + 1)
-
-                else:
-                    print("Prisoner number", j + 1, "has been failed,",
-                          "the chain length is", (attempts + 1), file=self.file)
-                    self.output += "Prisoner number {} has been failed, the chain length is {}".format(j + 1, attempts + 1)
-                self.output += "\n"
-
-                print(file=self.file)
-                self.output += "\n"
-
+        chain_lengths = cycle_lengths(list_of_boxes)  # The chain of prisoner j is the cycle of box j
+        list_of_success = [1 if chain_length <= number_of_boxes // 2 else 0 for chain_length in chain_lengths]
         if print_route:
-            print("The number of prisoners that found their number is",
-                  sum(list_of_success), "\nout of", number_of_boxes, "prisoners.\n", file=self.file)
-            self.output += "The number of prisoners that found their number is {}\n" \
-                           "out of {} prisoners".format(sum(list_of_success), number_of_boxes)
+            boxes_line = "Total Boxes: " + "".join("{} ".format(box_i + 1) for box_i in list_of_boxes) + "\n"  # Same for all prisoners
+            for j in range(number_of_boxes):
+                self.print_prisoner_route(list_of_boxes, j, chain_lengths[j], list_of_success[j] == 1, boxes_line)
+            self.file.write("The number of prisoners that found their number is {} \nout of {} prisoners.\n\n".format(
+                sum(list_of_success), number_of_boxes))
 
         if sum(list_of_success) == number_of_boxes:
             return True
         else:
             return False
 
+    def print_prisoner_route(self, list_of_boxes: list, j: int, chain_length: int, success: bool, boxes_line: str) -> None:
+        """
+        Method that writes the search route of a single prisoner to the report, the route is the cycle of box j.\n
+        Every block is written in one piece to the buffered report file, so nothing of the report is kept in memory.\n
+        :param list_of_boxes: list, list of dependencies between the boxes.
+        :param j: int, the prisoner index from zero to the number of prisoners - 1.
+        :param chain_length: int, the length of the cycle that contains box j.
+        :param success: bool, indication if the prisoner found his number.
+        :param boxes_line: str, the "Total Boxes" line of the round.
+        :return: None.
+        """
+        visited_boxes = []
+        pointer_box = j
+        for attempts in range(chain_length):
+            pointer_box = list_of_boxes[pointer_box]
+            visited_boxes.append(pointer_box)
+
+        self.file.write("Prisoner number: {}\n".format(j + 1))
+        self.file.write("".join("Box number {}  is leading to box {}\n".format(current_box + 1, pointer_box + 1)
+                                for current_box, pointer_box in zip([j] + visited_boxes[:-1], visited_boxes)))
+        self.file.write(boxes_line)
+        self.file.write("Visited in boxes: " + "".join("{} ".format(box_i + 1) for box_i in visited_boxes) + "\n")
+        self.file.write("Prisoner number {} has been {}, the chain length is {}\n\n".format(
+            j + 1, "succeeded" if success else "failed", chain_length))
+
     def run_all_probs(self, print_route) -> None:
         """
         Method that runs the search route of all prisoners of each round.\n
@@ -125,75 +155,227 @@ class ProbabilitiesHandler:
         :return: None.
         """
         self.open_file()
+        try:
+            self.write_report(print_route)
+        finally:
+            self.close_file()
+
+    def write_report(self, print_route) -> None:
+        """
+        Method that validates the input, simulates all the rounds and streams the results into the report file.\n
+        :param print_route: bool, indication of details specification "PrisonerResults.txt".
+        :return: None.
+        """
+        if not self.check_input(self.num_rounds):
+            return
+        self.success_rounds = self.simulate_rounds(print_route)
+        if self.cancelled:
+            print("The run was cancelled.", file=self.file)
+            return
+        self.rounds_used = self.num_rounds
+        self.write_summary(self.success_rounds)
+
+    def check_input(self, num_rounds: int) -> bool:
+        """
+        Method that validates the number of prisoners and the number of rounds of a run, an invalid one is explained in the report.\n
+        :param num_rounds: int, the number of rounds, or the most rounds of an adaptive run.
+        :return: bool, True -> the input is valid.
+        """
         if not isinstance(self.num_prisoners, int):
             print("The number of prisoners is ", self.num_prisoners, " the number of prisoners must be an integer.", file=self.file)
-            self.output += "The number of prisoners is {} the number of prisoners must be an integer.".format(self.num_prisoners)
-            return
+            return False
 
         if self.num_prisoners < 2:
             print("The number of prisoners is ", self.num_prisoners, " the number of prisoners must be greater than 1.", file=self.file)
-            self.output += "The number of prisoners is {} the number of prisoners must be greater than 1.".format(self.num_prisoners)
-            return
-
-        if not isinstance(self.num_rounds, int):
-            print("The number of rounds is ", self.num_rounds, " rounds must be an integer.", file=self.file)
-            self.output += "The number of rounds is {} the number of rounds must be an integer.".format(self.num_rounds)
-            return
+            return False
 
-        if self.num_rounds <= 0:
-            print("The number of rounds is ", self.num_rounds, " rounds must be greater 0.", file=self.file)
-            self.output += "The number of rounds is {} the number of rounds must be greater 0.".format(self.num_rounds)
-        success_rounds = 0
-        general_lists = {}  # {round:list dependencies}
-        for i in range(self.num_rounds):
-            if print_route:
-                print("Round number:", (i + 1), file=self.file)
-                self.output += "**Round number: {}**\n\n".format(i + 1)
-
-            list_of_boxes = self.num_prisoners * [0]
-            for j in range(self.num_prisoners):
-                list_of_boxes[j] = j
-
-            self.lock_shuffle.acquire()  # lock shuffling list area
-            if i + 1 not in general_lists.keys():
-                random.shuffle(list_of_boxes)
-                general_lists[i + 1] = list_of_boxes  #### need to fix the pointing value of each box to another from 1 to n+1
-                self.dict_rounds[i + 1] = deepcopy(general_lists[i + 1])  # matching dependencies of each box to another for each round
-                self.dict_rounds[i + 1] = [box_i + 1 for box_i in self.dict_rounds[i + 1]]  ## making renumbering boxes from 1 to n+1
-            else:
-                continue
-            self.lock_shuffle.release()  # release shuffling list area
+        if not isinstance(num_rounds, int):
+            print("The number of rounds is ", num_rounds, " rounds must be an integer.", file=self.file)
+            return False
 
-            if self.run_route(general_lists[i + 1], print_route):  ## fix this for one calculation
-                success_rounds += 1
+        if num_rounds <= 0:
+            print("The number of rounds is ", num_rounds, " rounds must be greater 0.", file=self.file)
+            return False
+        return True
 
+    def write_summary(self, success_rounds: int) -> None:
+        """
+        Method that writes the success rate of the run and the exact probability to the report.\n
+        :param success_rounds: int, the number of successful rounds.
+        :return: None.
+        """
         print("The total number of prisoners is", self.num_prisoners, ",the total number of rounds is", self.num_rounds, ",the number of successful rounds is ", success_rounds,
               "\n(successful_rounds / total_rounds) as percentage is", 100 * (success_rounds / self.num_rounds), "%", file=self.file)
-        temp = "The total number of prisoners is -> {}\n" \
-               "The total number of rounds is -> {}\n" \
-               "The number of successful rounds is -> {}\n" \
-               "(successful_rounds / total_rounds) as percentage is -> {}%\n".format(self.num_prisoners, success_rounds, self.num_rounds, 100 * (success_rounds / self.num_rounds))
-        temp += "\n"
+        exact_probability = success_probability(self.num_prisoners, self.num_prisoners // 2)
+        print("\n\nExact probability that every cycle is at most num_prisoners/2 boxes long:\n",
+              "1 - (1/((num_prisoners/2)+1) + 1/((num_prisoners/2)+2) + ... + 1/num_prisoners) =", exact_probability, file=self.file)
+        print("Difference between the simulated rate and the exact probability:",
+              success_rounds / self.num_rounds - exact_probability, file=self.file)
+
+    def simulate_rounds(self, print_route: bool) -> int:
+        """
+        Method that draws the seed of every round, splits the rounds into chunks and simulates the chunks in a process pool (or in this
+        process when there is a single worker, a single chunk or too little work for a pool), a cancelled run stops before the next chunk. A "seeds" store keeps only the seeds and regenerates a round on demand,
+        an "array" store receives every round, the workers write straight into a memory-mapped store.\n
+        The detailed route report is written in round order by this process, so it is always produced here.\n
+        :param print_route: bool, indication of details specification "PrisonerResults.txt".
+        :return: int, the number of successful rounds.
+        """
+        seeds = round_seeds(self.seed, self.num_rounds)
+        if self.store == "array":
+            self.dict_rounds = ArrayRoundStore.create(self.num_rounds, self.num_prisoners, self.store_path)
+        else:
+            self.dict_rounds = SeededRoundStore(self.backend, self.num_prisoners, seeds)
+        in_memory_array = self.store == "array" and self.store_path is None
+        chunk_size = rounds_per_chunk(self.num_prisoners, self.num_rounds)
+        first_rounds = range(0, self.num_rounds, chunk_size)
+        chunks = [seeds[first_round:first_round + chunk_size] for first_round in first_rounds]
+        arguments = (repeat(self.backend), repeat(self.num_prisoners), chunks, repeat(print_route or in_memory_array),
+                     repeat(self.store_path if self.store == "array" else None), first_rounds)
+
+        use_pool = self.use_pool(self.num_rounds) and len(chunks) > 1 and not print_route
+        executor = self.executor(min(self.workers, len(chunks))) if use_pool else None
         success_rounds = 0
-        hn = self.num_prisoners / 2
-        for i in range(self.num_prisoners // 2):
-            success_rounds += 1 / (hn + (i + 1))
-        print("\n\nProbability by loop calculation of the geometric series:\n",
-              "1 - (1/((num_prisoners/2)+1) + 1/((num_prisoners/2)+2) + ...) =", 1 - success_rounds, file=self.file)
-        temp += "Probability by loop calculation of the geometric series\n" \
-                "1 - (1/((num_prisoners/2)+1) + 1/((num_prisoners/2)+2) + ...) ={}%\n".format(1 - success_rounds)
-        temp += "\n"
-
-        self.close_file()
-        temp += self.output
-        self.output = temp
+        try:
+            results = executor.map(simulate_chunk, *arguments) if executor else map(simulate_chunk, *arguments)
+            for first_round, (chunk_success, block) in zip(first_rounds, results):
+                if self.cancelled:
+                    break
+                success_rounds += chunk_success
+                if in_memory_array:
+                    self.dict_rounds.write_rounds(first_round, block)
+                if print_route:
+                    for offset, list_of_boxes in enumerate(block.tolist()):
+                        self.file.write("Round number: {}\n".format(first_round + offset + 1))
+                        self.run_route(list_of_boxes, print_route)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+        return success_rounds
+
+    def use_pool(self, num_rounds: int) -> bool:
+        """
+        Method that checks if a run of num_rounds rounds is worth the start of a process pool.\n
+        :param num_rounds: int, the number of rounds of the run.
+        :return: bool, True -> the rounds are simulated by the worker processes.
+        """
+        return self.workers > 1 and num_rounds * self.num_prisoners >= self.pool_elements
+
+    def executor(self, max_workers: int) -> ProcessPoolExecutor:
+        """
+        Method that creates the process pool of the workers, started by the start method of the handler.\n
+        :param max_workers: int, the number of worker processes.
+        :return: ProcessPoolExecutor.
+        """
+        mp_context = multiprocessing.get_context(self.start_method) if self.start_method else None
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    def cancel(self) -> None:
+        """
+        Method that cancels the run, it stops after the chunk of rounds that is being simulated and writes no summary.\n
+        :return: None.
+        """
+        self.cancelled = True
+
+    def prepare_rounds(self) -> RoundStore:
+        """
+        Method that only draws the seed of every round, so a game can start at once and build each round when it reaches it.\n
+        The rounds are the same rounds that run_probabilities simulates with the same seed.\n
+        :return: SeededRoundStore, mapping of {round number:list of box number dependencies}.
+        """
+        self.dict_rounds = SeededRoundStore(self.backend, self.num_prisoners, round_seeds(self.seed, self.num_rounds))
+        return self.dict_rounds
+
+    def run_until_precision(self, target_width: float, confidence: float = 0.99, max_rounds: int = 10 ** 8) -> int:
+        """
+        Method that runs rounds in batches and stops as soon as the Wilson interval of the success rate is at most target_width wide.\n
+        Each batch holds one chunk per worker and the interval is checked after every chunk in order, so the number of rounds and the
+        outcome depend only on the seed and not on the number of workers. Afterwards dict_rounds holds the seeds of the rounds that were
+        used, whatever the kind of store is, since the number of rounds is not known in advance.\n
+        :param target_width: float, the wanted width of the interval, for example 0.002 for +-0.1%.
+        :param confidence: float, the confidence level of the interval, for example 0.99.
+        :param max_rounds: int, the number of rounds after which the run stops even if the target was not reached.
+        :return: int, the number of rounds that were used, 0 when the input is invalid.
+        """
+        self.rounds_used = 0
+        self.interval = None
+        executor = None
+        self.open_file()
+        try:
+            if not self.check_input(max_rounds):
+                return self.rounds_used
+            if not 0 < confidence < 1:
+                print("The confidence is ", confidence, " the confidence must be between 0 and 1.", file=self.file)
+                return self.rounds_used
+
+            chunk_size = rounds_per_chunk(self.num_prisoners, 0)  # The total is unknown, so chunks are sized by n alone
+            batch_size = max(1, self.workers) * chunk_size
+            seeds = round_seeds(self.seed, min(batch_size, max_rounds))
+            success_rounds = 0
+            while self.rounds_used < max_rounds:
+                batch_end = min(self.rounds_used + batch_size, max_rounds)
+                if executor is None and self.use_pool(batch_end):  # the pool starts once the run grew long enough for it
+                    executor = self.executor(self.workers)
+                if batch_end > len(seeds):
+                    seeds = round_seeds(self.seed, min(max_rounds, max(batch_end, 2 * len(seeds))))  # growing geometrically
+                chunks = [seeds[first_round:min(first_round + chunk_size, batch_end)]
+                          for first_round in range(self.rounds_used, batch_end, chunk_size)]
+                arguments = (repeat(self.backend), repeat(self.num_prisoners), chunks)
+                results = executor.map(simulate_chunk, *arguments) if executor else map(simulate_chunk, *arguments)
+                for chunk, (chunk_success, _) in zip(chunks, results):  # The interval is checked after every chunk
+                    success_rounds += chunk_success
+                    self.rounds_used += len(chunk)
+                    self.interval = wilson_interval(success_rounds, self.rounds_used, confidence)
+                    if self.interval[1] - self.interval[0] <= target_width:
+                        break
+                if self.interval[1] - self.interval[0] <= target_width:
+                    break
+
+            self.num_rounds = self.rounds_used
+            self.success_rounds = success_rounds
+            self.dict_rounds = SeededRoundStore(self.backend, self.num_prisoners, seeds[:self.rounds_used])
+            self.write_summary(success_rounds)
+            print("Stopped after", self.rounds_used, "rounds, the", 100 * confidence, "% Wilson interval of the success rate is",
+                  self.interval, file=self.file)
+        finally:
+            self.close_file()
+            if executor:
+                executor.shutdown()
+        return self.rounds_used
+
+    def longest_cycle_histogram(self) -> np.ndarray:
+        """
+        Method that counts the rounds of the last run by the length of their longest cycle, to be checked against the exact
+        distribution of longest_cycle_distribution. The rounds are read from dict_rounds block by block, a seeds store regenerates them.\n
+        :return: ndarray of int64, item L is the number of rounds whose longest cycle is exactly L long (item 0 is always 0).
+        """
+        histogram = np.zeros(self.num_prisoners + 1, dtype=np.int64)
+        block_size = rounds_per_block(self.num_prisoners)
+        for first_round in range(0, len(self.dict_rounds), block_size):
+            if isinstance(self.dict_rounds, ArrayRoundStore):
+                block = self.dict_rounds.rows[first_round:first_round + block_size].astype(np.int64) - 1  # stored from 1 to n
+            else:
+                seeds = self.dict_rounds.seeds[first_round:first_round + block_size]
+                block = simulate_chunk(self.dict_rounds.backend, self.num_prisoners, seeds, keep_rounds=True)[1]
+            histogram += np.bincount(max_cycle_lengths(block), minlength=self.num_prisoners + 1)
+        return histogram
+
+    def set_backend(self, backend: str) -> None:
+        """
+        Method for choosing the simulation engine.\n
+        :param backend: str, one of ProbabilitiesHandler.backends.
+        :return: None.
+        """
+        if backend not in self.backends:
+            raise ValueError("Unknown backend {}, expected one of {}".format(backend, self.backends))
+        self.backend = backend
 
     def open_file(self) -> None:
         """
         Method for opening file for specification.\n
         :return: None.
         """
-        self.file = open(self.filename, "w")
+        self.file = open(self.filename, "w", buffering=self.buffer_size)
 
     def close_file(self) -> None:
         """
@@ -202,17 +384,21 @@ class ProbabilitiesHandler:
         """
         self.file.close()
 
-    def run_probabilities(self) -> dict:
+    def open_report(self) -> TextIO:
+        """
+        Method for opening the report file for reading, the caller reads it incrementally and closes it.\n
+        :return: TextIO, a text handle of "PrisonersResults.txt".
+        """
+        return open(self.filename, "r", buffering=self.buffer_size)
+
+    def run_probabilities(self, backend: str = None) -> RoundStore:
         """
-        Method that run the probability calculation concurrently by threads and afterwards return the relation between each round and its
-        dependencies list of boxes.\n
-        :return: dict, each round has a dependencies for the boxes, dictionary of {round number:list of box number dependencies}.
+        Method that run the probability calculation, in parallel worker processes when there are several workers, and afterwards return
+        the relation between each round and its dependencies list of boxes.\n
+        :param backend: str, optional simulation engine to use instead of the current one, one of ProbabilitiesHandler.backends.
+        :return: RoundStore, each round has a dependencies for the boxes, mapping of {round number:list of box number dependencies}.
         """
-        threads = []
-        for i in range((int(self.num_rounds / 2)) + 1):  # this number could be bigger
-            threads.append(Thread(target=self.run_all_probs(self.print_specifically)))
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
+        if backend is not None:
+            self.set_backend(backend)
+        self.run_all_probs(self.print_specifically)
         return self.dict_rounds
@@ -0,0 +1,166 @@
+import random
+
+import numpy as np
+
+# Upper bound of box entries that a single block of rounds may hold, keeps the temporary arrays of the engine small
+BLOCK_ELEMENTS = 1 << 21
+# Bounds of the chunks of rounds that are handed to the workers, a chunk holds at least MIN_CHUNK_ELEMENTS box entries
+MIN_CHUNK_ELEMENTS = 1 << 16
+MAX_CHUNKS = 256
+
+
+def cycle_lengths(list_of_boxes: list) -> list:
+    """
+    Decompose a round into its cycles once and map every box to the length of the cycle it belongs to.
+    Prisoner j follows exactly the cycle of box j, so the cycle length is also the chain length of prisoner j.\n
+    :param list_of_boxes: list, list of dependencies between the boxes numbered from zero to n-1.
+    :return: list, the cycle length of each box by its index.
+    """
+    lengths = len(list_of_boxes) * [0]
+    for start in range(len(list_of_boxes)):
+        if lengths[start]:
+            continue  # The cycle of this box was already measured
+        members = [start]
+        pointer_box = list_of_boxes[start]
+        while pointer_box != start:
+            members.append(pointer_box)
+            pointer_box = list_of_boxes[pointer_box]
+        for box in members:
+            lengths[box] = len(members)
+    return lengths
+
+
+def rounds_per_block(num_prisoners: int) -> int:
+    """
+    Calculate how many rounds fit in one block of the batched engine.\n
+    :param num_prisoners: int, the number of prisoners (the row length of a block).
+    :return: int, the number of rounds per block, at least one.
+    """
+    return max(1, BLOCK_ELEMENTS // num_prisoners)
+
+
+def round_seeds(seed: int, num_rounds: int) -> np.ndarray:
+    """
+    Draw the seed of every round from the master seed, the seed of a round never depends on how many rounds are drawn, so a longer
+    run starts with the same rounds as a shorter one.\n
+    :param seed: int, the master seed of the run.
+    :param num_rounds: int, the number of rounds.
+    :return: ndarray of uint64, item i is the seed of round i + 1.
+    """
+    return np.random.SeedSequence(seed).generate_state(num_rounds, np.uint64)
+
+
+def shuffle_block(seeds: np.ndarray, num_prisoners: int) -> np.ndarray:
+    """
+    Create a block of rounds, each row is a random permutation of the boxes numbered from zero to num_prisoners - 1.\n
+    Row i is Generator(Philox(key=seeds[i])).permutation(num_prisoners), every seed keys its own independent Philox stream. A single
+    bit generator is re-keyed per row, which is much cheaper than building a new generator for every round.\n
+    :param seeds: ndarray of uint64, the seed of each round (row) in the block.
+    :param num_prisoners: int, the number of prisoners (columns) in the block.
+    :return: ndarray of shape (len(seeds), num_prisoners), row i is the dependencies list of the round of seeds[i].
+    """
+    bit_generator = np.random.Philox(key=0)
+    rng = np.random.Generator(bit_generator)
+    state = bit_generator.state
+    block = np.empty((len(seeds), num_prisoners), dtype=np.int64)
+    for row, seed in enumerate(seeds):
+        state["state"]["counter"] = np.zeros(4, dtype=np.uint64)
+        state["state"]["key"] = np.array([seed, 0], dtype=np.uint64)
+        state["buffer_pos"] = 4  # drop whatever the previous round left buffered
+        state["has_uint32"] = 0
+        bit_generator.state = state
+        block[row] = rng.permutation(num_prisoners)
+    return block
+
+
+def round_permutation(backend: str, num_prisoners: int, seed: int) -> list:
+    """
+    Regenerate the permutation of a single round from its seed, exactly as the engine of the backend created it.\n
+    :param backend: str, "python" or "numpy".
+    :param num_prisoners: int, the number of prisoners.
+    :param seed: int, the seed of the round.
+    :return: list, the dependencies list of the round numbered from zero to n-1.
+    """
+    if backend == "numpy":
+        return shuffle_block(np.array([seed], dtype=np.uint64), num_prisoners)[0].tolist()
+    list_of_boxes = list(range(num_prisoners))
+    random.Random(int(seed)).shuffle(list_of_boxes)
+    return list_of_boxes
+
+
+def max_cycle_lengths(block: np.ndarray) -> np.ndarray:
+    """
+    Calculate the longest cycle of every round in a block with array operations only.\n
+    Each box is labeled by the smallest box number of its cycle by pointer doubling, after log2(n) steps all the
+    members of a cycle share the same label so counting the labels gives the cycle lengths.\n
+    :param block: ndarray of shape (rounds, n), each row is a permutation of 0..n-1.
+    :return: ndarray of shape (rounds,), the longest cycle length of each round.
+    """
+    num_rounds, num_prisoners = block.shape
+    offsets = np.arange(num_rounds, dtype=np.int64)[:, None] * num_prisoners
+    pointer = (block + offsets).ravel()  # successor of each box in the flattened block
+    label = np.arange(num_rounds * num_prisoners, dtype=np.int64)
+    steps = 1
+    while steps < num_prisoners:
+        np.minimum(label, label[pointer], out=label)
+        pointer = pointer[pointer]
+        steps *= 2
+    cycle_sizes = np.bincount(label, minlength=num_rounds * num_prisoners).reshape(num_rounds, num_prisoners)
+    return cycle_sizes.max(axis=1)
+
+
+def evaluate_block(block: np.ndarray, max_attempts: int) -> np.ndarray:
+    """
+    Decide for every round in a block if all the prisoners found their number.\n
+    :param block: ndarray of shape (rounds, n), each row is a permutation of 0..n-1.
+    :param max_attempts: int, the number of boxes each prisoner is allowed to open.
+    :return: ndarray of bool of shape (rounds,), True -> the round succeeded, False -> the round failed.
+    """
+    return max_cycle_lengths(block) <= max_attempts
+
+
+def rounds_per_chunk(num_prisoners: int, num_rounds: int) -> int:
+    """
+    Calculate how many rounds each chunk of a run holds.\n
+    The size depends only on the size of the run and never on the number of workers, so every chunk keeps the same random
+    stream and the same rounds however the chunks are spread over processes.\n
+    :param num_prisoners: int, the number of prisoners.
+    :param num_rounds: int, the total number of rounds.
+    :return: int, the number of rounds per chunk, at least one.
+    """
+    chunk_size = max(-(-MIN_CHUNK_ELEMENTS // num_prisoners), -(-num_rounds // MAX_CHUNKS))
+    return max(1, min(chunk_size, rounds_per_block(num_prisoners)))
+
+
+def simulate_chunk(backend: str, num_prisoners: int, seeds: np.ndarray, keep_rounds: bool = False, store_path: str = None,
+                   first_round: int = 0) -> tuple[int, np.ndarray]:
+    """
+    Shuffle and evaluate a chunk of rounds, runs in the calling process or in a pool worker.\n
+    :param backend: str, "python" walks each round in pure Python, "numpy" evaluates the whole chunk as one block.
+    :param num_prisoners: int, the number of prisoners.
+    :param seeds: ndarray of uint64, the seed of each round in the chunk.
+    :param keep_rounds: bool, True -> the rounds are returned as well, False -> only the outcome is returned.
+    :param store_path: str, a memory-mapped ArrayRoundStore file that the rounds are written into, None -> nothing is written.
+    :param first_round: int, the index from zero of the first round of the chunk within the store.
+    :return: tuple of (int, ndarray), the number of successful rounds and the block of the rounds numbered from 0 to n-1 (or None).
+    """
+    if backend == "numpy":
+        block = shuffle_block(seeds, num_prisoners)
+        success_rounds = int(evaluate_block(block, num_prisoners // 2).sum())
+    else:
+        success_rounds = 0
+        rounds = []
+        for seed in seeds:
+            list_of_boxes = round_permutation(backend, num_prisoners, seed)
+            if max(cycle_lengths(list_of_boxes)) <= num_prisoners // 2:
+                success_rounds += 1
+            if keep_rounds or store_path:
+                rounds.append(list_of_boxes)
+        block = np.array(rounds, dtype=np.int64).reshape(len(rounds), num_prisoners)
+
+    if store_path:
+        from Model.round_store import ArrayRoundStore  # imported here, the store module depends on this one
+        store = ArrayRoundStore(np.load(store_path, mmap_mode="r+"))
+        store.write_rounds(first_round, block)
+        store.flush()
+    return success_rounds, block if keep_rounds else None
@@ -0,0 +1,181 @@
+from collections import OrderedDict
+from collections.abc import Mapping
+
+import numpy as np
+
+from Model.round_engine import round_permutation
+
+
+class RoundStore(Mapping):
+    """
+    A read-only mapping of {round number: list of box numbers} that all the round stores share.\n
+    """
+
+    def next_box(self, round_num: int, box_num: int) -> int:
+        """
+        Return the number of the box that a box is leading to in a round.\n
+        :param round_num: int, the round number from 1.
+        :param box_num: int, the box number from 1.
+        :return: int, the next box number from 1.
+        """
+        return self[round_num][box_num - 1]
+
+
+class SeededRoundStore(RoundStore):
+    """
+    A read-only mapping of {round number: list of box numbers} that keeps only the seed of every round.\n
+    The permutation of a round is regenerated from its seed whenever it is needed, and the most recently used rounds are kept in a
+    small LRU cache, so memory grows with the number of rounds alone and not with rounds x prisoners.\n
+
+    Attributes:\n
+
+    backend: the engine that created the rounds, the permutation is regenerated by the same engine -> str.\n
+    num_prisoners: the total number of prisoners -> int.\n
+    seeds: the seed of every round, item i is the seed of round i + 1 -> ndarray of uint64.\n
+    cache_size: the number of regenerated rounds that are kept -> int.\n
+    cache: the recently used rounds ordered from the least to the most recently used -> OrderedDict of {round number: list}.
+    """
+    cache_size = 8
+
+    def __init__(self, backend: str, num_prisoners: int, seeds: np.ndarray) -> None:
+        """
+        Initialize SeededRoundStore object.\n
+        :param backend: str, the engine that created the rounds, "python" or "numpy".
+        :param num_prisoners: int, the number of prisoners.
+        :param seeds: ndarray of uint64, the seed of every round.
+        :return: None.
+        """
+        self.backend = backend
+        self.num_prisoners = num_prisoners
+        self.seeds = seeds
+        self.cache = OrderedDict()
+
+    def __getitem__(self, round_num: int) -> list:
+        """
+        Return the boxes of a round numbered from 1 to n, regenerating the round if it is not cached.\n
+        :param round_num: int, the round number from 1.
+        :return: list, the dependencies list of the round numbered from 1 to n.
+        """
+        if round_num in self.cache:
+            self.cache.move_to_end(round_num)
+            return self.cache[round_num]
+        if not isinstance(round_num, int) or not 1 <= round_num <= len(self.seeds):
+            raise KeyError(round_num)
+        list_of_boxes = [box_i + 1 for box_i in round_permutation(self.backend, self.num_prisoners, self.seeds[round_num - 1])]
+        self.cache[round_num] = list_of_boxes
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)  # Dropping the least recently used round
+        return list_of_boxes
+
+    def __len__(self) -> int:
+        """
+        Return the number of rounds.\n
+        :return: int.
+        """
+        return len(self.seeds)
+
+    def __iter__(self):
+        """
+        Iterate the round numbers from 1.\n
+        :return: iterator of int.
+        """
+        return iter(range(1, len(self.seeds) + 1))
+
+    def seed_of(self, round_num: int) -> int:
+        """
+        Return the seed of a round, the round is reproduced by round_permutation(backend, num_prisoners, seed).\n
+        :param round_num: int, the round number from 1.
+        :return: int.
+        """
+        return int(self.seeds[round_num - 1])
+
+
+class ArrayRoundStore(RoundStore):
+    """
+    A read-only mapping of {round number: list of box numbers} backed by one contiguous int32 matrix of rounds x prisoners, that can be
+    memory-mapped from a ".npy" file, so a big experiment lives on disk and only the rounds that are touched are paged in.\n
+
+    Attributes:\n
+
+    rows: the box numbers from 1 to n of every round, row i is round i + 1 -> ndarray or memmap of int32.
+    """
+
+    def __init__(self, rows: np.ndarray) -> None:
+        """
+        Initialize ArrayRoundStore object.\n
+        :param rows: ndarray of int32, the box numbers of every round.
+        :return: None.
+        """
+        self.rows = rows
+
+    @classmethod
+    def create(cls, num_rounds: int, num_prisoners: int, path: str = None):
+        """
+        Create an empty store, in memory or as a new memory-mapped ".npy" file.\n
+        :param num_rounds: int, the number of rounds.
+        :param num_prisoners: int, the number of prisoners.
+        :param path: str, the file of the store, None -> the store is kept in memory.
+        :return: ArrayRoundStore object.
+        """
+        if path is None:
+            return cls(np.zeros((num_rounds, num_prisoners), dtype=np.int32))
+        return cls(np.lib.format.open_memmap(path, mode="w+", dtype=np.int32, shape=(num_rounds, num_prisoners)))
+
+    @classmethod
+    def open(cls, path: str):
+        """
+        Open a store that was written to a ".npy" file, read-only and memory-mapped.\n
+        :param path: str, the file of the store.
+        :return: ArrayRoundStore object.
+        """
+        return cls(np.load(path, mmap_mode="r"))
+
+    def __getitem__(self, round_num: int) -> list:
+        """
+        Return the boxes of a round numbered from 1 to n, only the row of the round is read.\n
+        :param round_num: int, the round number from 1.
+        :return: list, the dependencies list of the round numbered from 1 to n.
+        """
+        if not isinstance(round_num, int) or not 1 <= round_num <= len(self.rows):
+            raise KeyError(round_num)
+        return self.rows[round_num - 1].tolist()
+
+    def __len__(self) -> int:
+        """
+        Return the number of rounds.\n
+        :return: int.
+        """
+        return len(self.rows)
+
+    def __iter__(self):
+        """
+        Iterate the round numbers from 1.\n
+        :return: iterator of int.
+        """
+        return iter(range(1, len(self.rows) + 1))
+
+    def next_box(self, round_num: int, box_num: int) -> int:
+        """
+        Return the number of the box that a box is leading to in a round, reading a single entry of the matrix.\n
+        :param round_num: int, the round number from 1.
+        :param box_num: int, the box number from 1.
+        :return: int, the next box number from 1.
+        """
+        return int(self.rows[round_num - 1, box_num - 1])
+
+    def write_rounds(self, first_round: int, block: np.ndarray) -> None:
+        """
+        Write a block of rounds numbered from zero to n-1 into the store, renumbering the boxes from 1 to n.\n
+        :param first_round: int, the index from zero of the first round of the block.
+        :param block: ndarray, the dependencies list of each round of the block.
+        :return: None.
+        """
+        np.add(block, 1, out=self.rows[first_round:first_round + len(block)], casting="unsafe")
+
+    def flush(self) -> None:
+        """
+        Write the changes of a memory-mapped store to its file.\n
+        :return: None.
+        """
+        if isinstance(self.rows, np.memmap):
+            self.rows.flush()
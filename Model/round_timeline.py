@@ -0,0 +1,79 @@
+class RoundTimeline:
+    """
+    The complete events of a round, computed up front in O(n) from the cycles of its boxes.\n
+    Prisoner p opens the boxes of the cycle of box p in order, starting at box p, and the round of boxes is fully known in
+    advance, so the boxes each prisoner opens, whether the prisoner succeeds and the number of successes so far are known before
+    the prisoner makes a step.\n
+
+    Attributes:\n
+
+    num_prisoners: the total number of prisoners -> int.\n
+    max_attempts: the number of boxes a prisoner may open, num_prisoners // 2 -> int.\n
+    cycles: the cycles of the round, each one in opening order -> list of lists of box numbers.\n
+    cycle_of: the cycle index and the offset within it of every box, item i is box i + 1 -> list of tuples of (int, int).\n
+    succeeded_until: the number of prisoners from 1 to p that succeeded, item p is prisoner p -> list of int.
+    """
+
+    def __init__(self, list_of_boxes: list) -> None:
+        """
+        Initialize a RoundTimeline object.\n
+        :param list_of_boxes: list, the dependencies list of the round numbered from 1 to n.
+        """
+        self.num_prisoners = len(list_of_boxes)
+        self.max_attempts = self.num_prisoners // 2
+        self.cycles = []
+        self.cycle_of = self.num_prisoners * [None]
+        for start in range(1, self.num_prisoners + 1):
+            if self.cycle_of[start - 1] is not None:
+                continue  # The cycle of this box was already walked
+            cycle = []
+            box_num = start
+            while self.cycle_of[box_num - 1] is None:
+                self.cycle_of[box_num - 1] = (len(self.cycles), len(cycle))
+                cycle.append(box_num)
+                box_num = list_of_boxes[box_num - 1]
+            self.cycles.append(cycle)
+
+        self.succeeded_until = [0]
+        for prisoner_num in range(1, self.num_prisoners + 1):
+            self.succeeded_until.append(self.succeeded_until[-1] + self.succeeds(prisoner_num))
+
+    def chain_length(self, prisoner_num: int) -> int:
+        """
+        Return the number of boxes a prisoner opens, the length of the cycle of its box.\n
+        :param prisoner_num: int, the prisoner number from 1.
+        :return: int.
+        """
+        return len(self.cycles[self.cycle_of[prisoner_num - 1][0]])
+
+    def succeeds(self, prisoner_num: int) -> bool:
+        """
+        Check if a prisoner finds its number, which happens when its chain is at most max_attempts boxes long.\n
+        :param prisoner_num: int, the prisoner number from 1.
+        :return: bool.
+        """
+        return self.chain_length(prisoner_num) <= self.max_attempts
+
+    def boxes_opened(self, prisoner_num: int) -> list:
+        """
+        Return the boxes a prisoner opens in order, its cycle rotated to start at its own box.\n
+        :param prisoner_num: int, the prisoner number from 1.
+        :return: list of box numbers.
+        """
+        cycle_index, offset = self.cycle_of[prisoner_num - 1]
+        cycle = self.cycles[cycle_index]
+        return cycle[offset:] + cycle[:offset]
+
+    def total_succeeded(self) -> int:
+        """
+        Return the number of prisoners that find their number in the round.\n
+        :return: int.
+        """
+        return self.succeeded_until[-1]
+
+    def round_succeeded(self) -> bool:
+        """
+        Check if every prisoner finds its number, which happens when no cycle is longer than max_attempts.\n
+        :return: bool.
+        """
+        return self.total_succeeded() == self.num_prisoners
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+# Upper bound of the steps of all the cached routes, about 30 MB, the routes across a large world hold thousands of steps each
+ROUTE_CACHE_STEPS = 250000
+
+
+class RouteCache:
+    """
+    Least recently used cache of the walks of the prisoners, bounded by the total number of cached steps rather than the number
+    of routes, so long routes across a large world grid do not grow the memory with the cache.\n
+    A route that is longer than the whole bound is calculated on every call and never cached.\n
+
+    Attributes:\n
+
+    max_steps: the upper bound of the steps of all the cached routes -> int.\n
+    routes: the cached routes, least recently used first -> OrderedDict of {(start, target, pace): tuple of (x,y)}.\n
+    steps: the number of steps of all the cached routes -> int.
+    """
+
+    def __init__(self, max_steps: int = ROUTE_CACHE_STEPS) -> None:
+        """
+        Initialize RouteCache object.\n
+        :param max_steps: int, the upper bound of the steps of all the cached routes.
+        :return: None.
+        """
+        self.max_steps = max_steps
+        self.routes = OrderedDict()
+        self.steps = 0
+
+    def __call__(self, start: tuple[int, int], target: tuple[int, int], pace: int) -> tuple:
+        """
+        Return the walk of a prisoner between two positions, the same walk that stepping frame by frame makes: first along the
+        y axis and then along the x axis, one pace per step.\n
+        The box positions, the door way and the exit point are fixed positions, so a route is usually computed a single time and
+        each step of the prisoner becomes a lookup into the cached route.\n
+        :param start: tuple, the position tuple of (x,y) the prisoner starts from.
+        :param target: tuple, the position tuple of (x,y) of the target.
+        :param pace: int, the pace of the prisoner in pixels per step.
+        :return: tuple, the position after every step, the last one is the target (empty when start is the target).
+        """
+        key = (start, target, pace)
+        route = self.routes.get(key)
+        if route is not None:
+            self.routes.move_to_end(key)
+            return route
+        route = walk(start, target, pace)
+        if len(route) <= self.max_steps:
+            self.routes[key] = route
+            self.steps += len(route)
+            while self.steps > self.max_steps:
+                self.steps -= len(self.routes.popitem(last=False)[1])
+        return route
+
+    def cache_clear(self) -> None:
+        """
+        Drop all the cached routes.\n
+        :return: None.
+        """
+        self.routes.clear()
+        self.steps = 0
+
+
+def walk(start: tuple[int, int], target: tuple[int, int], pace: int) -> tuple:
+    """
+    Calculate the walk of a prisoner between two positions, first along the y axis and then along the x axis, one pace per step.\n
+    :param start: tuple, the position tuple of (x,y) the prisoner starts from.
+    :param target: tuple, the position tuple of (x,y) of the target.
+    :param pace: int, the pace of the prisoner in pixels per step.
+    :return: tuple, the position after every step, the last one is the target (empty when start is the target).
+    """
+    x, y = start
+    steps = []
+    while y != target[1]:
+        y += max(-pace, min(pace, target[1] - y))  # The last step is shortened if the distance is not a multiple of the pace
+        steps.append((x, y))
+    while x != target[0]:
+        x += max(-pace, min(pace, target[0] - x))
+        steps.append((x, y))
+    return tuple(steps)
+
+
+route_between = RouteCache()
@@ -0,0 +1,99 @@
+import os
+
+import pygame
+
+from View.settings import RESOURCES_DIR, SOUND_VOLUMES
+
+
+class AssetManager:
+    """
+    Central store of the images and sounds of the game.\n
+    Each asset is loaded from disk once, the first time it is asked for, and the same surface or sound is handed to every caller.
+    Images are converted to the pixel format of the display as soon as a display mode is set, so blitting them needs no conversion
+    on every frame.\n
+
+    Attributes:\n
+    resources_dir: the folder of the asset files -> str.\n
+    images: the loaded images by file name -> dict of {str: Surface}.\n
+    scaled_images: the scaled copies of the images by (file name, size) -> dict of {tuple: Surface}.\n
+    sounds: the loaded sounds by file name -> dict of {str: Sound}.\n
+    converted: the cached images are in the pixel format of the display -> bool.
+    """
+
+    def __init__(self, resources_dir: str) -> None:
+        """
+        Initializes an AssetManager object, nothing is loaded until it is used.\n
+        :param resources_dir: The folder of the asset files -> str object.
+        """
+        self.resources_dir = resources_dir
+        self.images = {}
+        self.scaled_images = {}
+        self.sounds = {}
+        self.converted = False
+
+    def image(self, name: str) -> pygame.Surface:
+        """
+        Return the shared surface of an image, the surface must not be drawn on.\n
+        :param name: The file name of the image -> str object.
+
+        :return: Surface
+        """
+        if name not in self.images:
+            surface = pygame.image.load(os.path.join(self.resources_dir, name))
+            self.images[name] = self.convert_surface(surface) if self.converted else surface
+        return self.images[name]
+
+    def scaled_image(self, name: str, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Return the shared surface of an image scaled to a size, the scaling is done once per size.\n
+        :param name: The file name of the image -> str object.
+        :param size: The wanted (width, height) -> tuple object.
+
+        :return: Surface
+        """
+        key = (name, size)
+        if key not in self.scaled_images:
+            self.scaled_images[key] = pygame.transform.scale(self.image(name), size)
+        return self.scaled_images[key]
+
+    def sound(self, name: str) -> pygame.mixer.Sound:
+        """
+        Return the shared sound of a sound file, the mixer is started by the first sound that is asked for.\n
+        :param name: The file name of the sound -> str object.
+
+        :return: Sound
+        """
+        if name not in self.sounds:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            sound = pygame.mixer.Sound(os.path.join(self.resources_dir, name))
+            if name in SOUND_VOLUMES:
+                sound.set_volume(SOUND_VOLUMES[name])
+            self.sounds[name] = sound
+        return self.sounds[name]
+
+    def convert_all(self) -> None:
+        """
+        Convert the cached images to the pixel format of the display, called once after pygame.display.set_mode.\n
+        Images that are loaded afterwards are converted when they are loaded.\n
+
+        :return: None
+        """
+        self.images = {name: self.convert_surface(surface) for name, surface in self.images.items()}
+        self.scaled_images = {key: self.convert_surface(surface) for key, surface in self.scaled_images.items()}
+        self.converted = True
+
+    @staticmethod
+    def convert_surface(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Convert a surface to the pixel format of the display, keeping the transparency of images that have it.\n
+        :param surface: The surface to convert -> Surface object.
+
+        :return: Surface
+        """
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+
+ASSETS = AssetManager(RESOURCES_DIR)
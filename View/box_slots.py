@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+from View.box_view import BoxV
+from View.dirty_renderer import DirtyRenderer
+from View.settings import BOX_SLOT_CACHE
+
+
+class BoxSlots:
+    """
+    Pool of the BoxV sprites of the boxes that are out of the viewport.\n
+    A box that leaves the viewport keeps its sprite in least recently used order, so scrolling back to it reuses the sprite as it was
+    left. When more sprites are kept than the capacity allows, the least recently used one is evicted to the spare sprites and the
+    next box that enters the viewport reuses it instead of allocating a new BoxV. The kept sprites never outgrow the capacity, the
+    open state of a box is kept by the view, not by its sprite. Every operation is O(1).\n
+
+    Attributes:\n
+    screen: the renderer that the sprites draw on -> DirtyRenderer object.\n
+    capacity: the number of sprites that are kept out of the viewport -> int.\n
+    recent: the sprites out of the viewport, least recently used first -> OrderedDict of {box number: BoxV}.\n
+    spare: the evicted sprites that are reused by the next boxes -> list of BoxV.\n
+    allocations: the number of BoxV objects created -> int.\n
+    evictions: the number of sprites evicted -> int.
+    """
+
+    def __init__(self, screen: DirtyRenderer, capacity: int = BOX_SLOT_CACHE) -> None:
+        """
+        Initializes a BoxSlots object.\n
+        :param screen: The renderer that the sprites draw on -> DirtyRenderer object.
+        :param capacity: The number of sprites that are kept out of the viewport -> int object.
+        """
+        self.screen = screen
+        self.capacity = capacity
+        self.recent = OrderedDict()
+        self.spare = []
+        self.allocations = 0
+        self.evictions = 0
+
+    def acquire(self, box_num: int) -> BoxV:
+        """
+        Return the sprite of a box that enters the viewport, its kept sprite if there is one, otherwise a spare sprite or a new one.\n
+        :param box_num: The box number -> int object.
+
+        :return: BoxV, a new or reused sprite is closed.
+        """
+        if box_num in self.recent:
+            return self.recent.pop(box_num)
+        if self.spare:
+            box = self.spare.pop()
+            box.rebind(box_num)
+            return box
+        self.allocations += 1
+        return BoxV(screen=self.screen, box_num=box_num)
+
+    def release(self, box: BoxV) -> None:
+        """
+        Keep the sprite of a box that left the viewport, the least recently used sprite is evicted when over capacity.\n
+        :param box: The sprite of the box -> BoxV object.
+
+        :return: None
+        """
+        self.recent[box.box_num] = box
+        if len(self.recent) > self.capacity:
+            self.spare.append(self.recent.popitem(last=False)[1])
+            self.evictions += 1
+
+    def prepare(self, box_num: int) -> None:
+        """
+        Keep a sprite ready for a box that is about to enter the viewport, as the most recently used one.\n
+        :param box_num: The box number, of a box out of the viewport -> int object.
+
+        :return: None
+        """
+        if box_num in self.recent:
+            self.recent.move_to_end(box_num)
+            return
+        self.release(self.acquire(box_num))
+
+    def clear(self, boxes: list = ()) -> None:
+        """
+        Forget every kept box when the layout is built again, the kept sprites and the given sprites become spare sprites.\n
+        :param boxes: The sprites that are returned to the pool as well -> iterable of BoxV.
+
+        :return: None
+        """
+        self.spare.extend(self.recent.values())
+        self.spare.extend(boxes)
+        self.recent.clear()
@@ -1,9 +1,10 @@
 import pygame.draw
 
+from View.assets import ASSETS
+from View.dirty_renderer import DirtyRenderer
 from View.settings import *
-from pygame import Surface, image, Rect
+from pygame import Surface, Rect
 from pygame.font import SysFont
-import os
 
 
 class BoxV:
@@ -15,13 +16,17 @@ class BoxV:
     box_num: box number -> int.\n
     print_num: the number that print on the view.\n
     pos: the position tuple of (x,y) in form -> tuple[int,int].\n
-    screen: object that blitting the box image on screen.\n to the next target box -> Surface object.\n
-    load_images: load images of chest -> Surface object.\n
+    screen: object that blitting the box image on screen.\n to the next target box -> DirtyRenderer object.\n
+    chest_img: the shared image of the chest from the asset manager, it is never drawn on -> Surface object.\n
     color_num: the color of the number presented in view -> Color object.\n
     open: if the box is open or closed -> boolean.\n
+    font: the font of the box numbers, shared by all boxes and created on the first draw -> Font object.\n
+    glyphs: the rendered numbers shared by all boxes -> dict of {(number, color): Surface}.\n
     """
+    font = None
+    glyphs = {}
 
-    def __init__(self, screen: Surface, box_num: int) -> None:
+    def __init__(self, screen: DirtyRenderer, box_num: int) -> None:
         """
         Initializes a BoxV object.\n
         """
@@ -31,10 +36,21 @@ class BoxV:
         self.pos = None
         self.screen = screen
         self.chest_img = None
-        self.load_images('chest_closed.png')
+        self.load_images(IMG_BOX_CLOSED)
         self.color_num = YELLOW
         self.open = False
 
+    def rebind(self, box_num: int) -> None:
+        """
+        Reuse the box for another box number, the box is closed.\n
+        :param box_num: The new box number -> int object.
+
+        :return: None
+        """
+        self.box_num = box_num
+        self.pos = None
+        self.close_box(box_num)
+
     def clear_image(self, next_num: int) -> None:
         """
         Clear the image in view.\n
@@ -47,18 +63,19 @@ class BoxV:
 
     def close_box(self, num: int) -> None:
         """
-        Close the box image in view.\n
+        Close the box image in view, the box is drawn closed on the next frame.\n
         :param num: The current number to print -> int object.
 
         :return: None
         """
         self.print_num = num
-        self.open_box('chest_closed.png', YELLOW)
+        self.load_images(IMG_BOX_CLOSED)
+        self.color_num = YELLOW
         self.open = False
 
     def open_box(self, new_name_img: str, color: pygame.Color) -> None:
         """
-        Open the box image in view.\n
+        Open the box image in view, the box is drawn open on the next frame.\n
         :param new_name_img: The name of the new image to be load -> str object.\n
         :param color: the color of the number that presents on view.\n
 
@@ -66,37 +83,49 @@ class BoxV:
         """
         self.load_images(new_name_img)
         self.color_num = color
-        self.draw_box()
         self.open = True
 
     def load_images(self, new_name_img: str) -> None:
         """
-        Loads the new image.\n
+        Loads the new image, the image is read from disk only the first time and shared by all boxes.\n
         :param new_name_img: The name of the new image to be load -> str object.\n
 
         :return: None
         """
-        self.chest_img = image.load(os.path.join('View/Resources/' + new_name_img))
+        self.chest_img = ASSETS.image(new_name_img)
+
+    @classmethod
+    def render_number(cls, num: int, color: tuple[int, int, int]) -> Surface:
+        """
+        Return the rendered number in a color, each (number, color) is rendered once and shared by all boxes.\n
+        :param num: The number to render -> int object.
+        :param color: The color of the number -> tuple object.
+
+        :return: Surface
+        """
+        key = (num, tuple(color))
+        if key not in cls.glyphs:
+            if cls.font is None:
+                cls.font = SysFont('monospace', FONT_SIZE, bold=True)
+            cls.glyphs[key] = cls.font.render(str(num), True, color)
+        return cls.glyphs[key]
 
     def draw_box(self) -> None:
         """
-        Draw the box on view.\n
+        Draw the box on view, only cached surfaces are blitted.\n
 
         :return: None
         """
-        font = SysFont('monospace', FONT_SIZE, bold=True)
         rect = Rect(self.pos[0], self.pos[1], CELL_SIZE, CELL_SIZE)
-        self.text_surface = font.render(str(self.print_num), True, self.color_num)
+        self.text_surface = self.render_number(self.print_num, self.color_num)
         text_rect = self.text_surface.get_rect()
-        text_rect.center = self.chest_img.get_rect().center
-        self.chest_img.blit(self.text_surface, text_rect)
+        text_rect.center = self.chest_img.get_rect(topleft=self.pos).center
         self.screen.blit(self.chest_img, rect)
+        self.screen.blit(self.text_surface, text_rect)  # The number goes on the screen, the shared chest image stays clean
 
         if self.open:
-            font_prev_num = SysFont('monospace', FONT_SIZE, bold=True)
-            rect_prev_num = Rect(self.pos[0] + IMG_BOX_WIDTH // 2, self.pos[1] - 15, IMG_BOX_WIDTH, 10)
-            text_surface_prev_num = font_prev_num.render(str(self.box_num), True, BLACK)
-            self.screen.blit(text_surface_prev_num, rect_prev_num.center)
+            rect_prev_num = Rect(self.pos[0] + self.chest_img.get_width() // 2, self.pos[1] - 15, self.chest_img.get_width(), 10)
+            self.screen.blit(self.render_number(self.box_num, BLACK), rect_prev_num.center)
 
     def set_pos(self, new_pos: tuple[int, int]) -> None:
         """
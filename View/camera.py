@@ -0,0 +1,136 @@
+from View.layout import BOX_START_Y, CELL_SIZE, MAX_BOX_WIDTH, VIEW_ROWS
+
+
+class Camera:
+    """
+    Vertical camera over the world grid of the boxes, the viewport shows VIEW_ROWS rows of boxes at a time.\n
+    The camera moves by whole rows, so a box is never cut by the edge of the viewport and the boxes are drawn at the same positions
+    until the camera moves again. It follows the prisoner unless the user scrolled it.\n
+
+    Attributes:\n
+    top_row: the first row of the world grid that the viewport shows -> int.\n
+    num_rows: the number of rows of the world grid -> int.\n
+    following: the camera keeps the prisoner in the viewport -> bool.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a Camera object over an empty world.
+        """
+        self.top_row = 0
+        self.num_rows = 0
+        self.following = True
+
+    def set_world(self, num_boxes: int) -> None:
+        """
+        Set the number of boxes of the world grid and bring the camera back to the first row.\n
+        :param num_boxes: The number of boxes -> int object.
+
+        :return: None
+        """
+        self.num_rows = -(-num_boxes // MAX_BOX_WIDTH)
+        self.top_row = 0
+        self.following = True
+
+    def max_top_row(self) -> int:
+        """
+        Return the last row that the viewport can start from.\n
+
+        :return: int
+        """
+        return max(0, self.num_rows - VIEW_ROWS)
+
+    def offset(self) -> int:
+        """
+        Return the vertical distance between the world and the screen.\n
+
+        :return: int
+        """
+        return self.top_row * CELL_SIZE
+
+    def to_screen(self, pos: tuple[int, int]) -> tuple[int, int]:
+        """
+        Convert a position of the world to a position on the screen.\n
+        :param pos: The position in the world -> tuple object.
+
+        :return: tuple of (x,y)
+        """
+        return pos[0], pos[1] - self.offset()
+
+    def row_of(self, pos: tuple[int, int]) -> int:
+        """
+        Return the row of the world grid that a position is in.\n
+        :param pos: The position in the world -> tuple object.
+
+        :return: int
+        """
+        return (pos[1] - BOX_START_Y) // CELL_SIZE
+
+    def visible_boxes(self, num_boxes: int) -> range:
+        """
+        Return the numbers of the boxes that are in the viewport.\n
+        :param num_boxes: The number of boxes -> int object.
+
+        :return: range of the box numbers from 1
+        """
+        return range(self.top_row * MAX_BOX_WIDTH + 1, min(num_boxes, (self.top_row + VIEW_ROWS) * MAX_BOX_WIDTH) + 1)
+
+    def row_boxes(self, row: int, num_boxes: int) -> range:
+        """
+        Return the numbers of the boxes of a row of the world grid.\n
+        :param row: The row -> int object.
+        :param num_boxes: The number of boxes -> int object.
+
+        :return: range of the box numbers from 1
+        """
+        return range(row * MAX_BOX_WIDTH + 1, min(num_boxes, (row + 1) * MAX_BOX_WIDTH) + 1)
+
+    def is_visible(self, pos: tuple[int, int], height: int) -> bool:
+        """
+        Check if an object of the world is entirely inside the rows of the viewport.\n
+        :param pos: The position of the object in the world -> tuple object.
+        :param height: The height of the object -> int object.
+
+        :return: bool
+        """
+        top = self.offset() + (BOX_START_Y if self.top_row else 0)  # The first row also shows the room above the boxes
+        return top <= pos[1] and pos[1] + height <= self.offset() + BOX_START_Y + VIEW_ROWS * CELL_SIZE
+
+    def move_to(self, top_row: int) -> bool:
+        """
+        Move the viewport to start from a row, within the world grid.\n
+        :param top_row: The first row to show -> int object.
+
+        :return: bool, True -> the camera moved.
+        """
+        top_row = min(max(0, top_row), self.max_top_row())
+        moved = top_row != self.top_row
+        self.top_row = top_row
+        return moved
+
+    def scroll(self, rows: int) -> bool:
+        """
+        Scroll the viewport by the user, the camera stops following the prisoner.\n
+        :param rows: The number of rows to scroll, positive -> down -> int object.
+
+        :return: bool, True -> the camera moved.
+        """
+        self.following = False
+        return self.move_to(self.top_row + rows)
+
+    def follow(self, pos: tuple[int, int]) -> bool:
+        """
+        Keep a position of the world at least one row away from the edges of the viewport, when the camera is following. The position
+        is the top of the prisoner, who is about a row tall, so two rows are kept below it.\n
+        :param pos: The position of the prisoner in the world -> tuple object.
+
+        :return: bool, True -> the camera moved.
+        """
+        if not self.following:
+            return False
+        row = self.row_of(pos)
+        if row < self.top_row + 1:
+            return self.move_to(row - 1)
+        if row > self.top_row + VIEW_ROWS - 3:
+            return self.move_to(row - VIEW_ROWS + 3)
+        return False
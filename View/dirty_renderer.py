@@ -0,0 +1,140 @@
+from collections import Counter
+
+from pygame import Rect, Surface
+import pygame
+
+
+class DirtyRenderer:
+    """
+    Dirty-rectangle renderer of the main screen.\n
+    The objects of a frame are queued instead of being drawn at once. When the frame is presented its queue is compared with the
+    queue of the previous frame, only the regions of the items that appeared, disappeared or moved are restored from the static
+    layer (the background and the floor, composited once) and redrawn, and only those regions are sent to the display.
+    An item is a shared surface at a position, so the queued surfaces must be cached surfaces that are not drawn on.\n
+
+    Attributes:\n
+    screen: the display surface -> Surface object.\n
+    static_layer: the background and the floor composited once -> Surface object.\n
+    items: the (surface, rect) items queued for the current frame in drawing order -> list.\n
+    previous_items: the items of the last presented frame, None -> the whole screen is redrawn -> list.\n
+    overlay_rects: regions that were drawn straight on the screen and must be restored on the next frame -> list of Rect.\n
+    fills: the solid and outlined rectangle surfaces by (size, color, width) -> dict of {tuple: Surface}.
+    """
+
+    def __init__(self, screen: Surface, static_layer: Surface) -> None:
+        """
+        Initializes a DirtyRenderer object.\n
+        :param screen: The display surface -> Surface object.
+        :param static_layer: The layer that is restored under the moving objects -> Surface object.
+        """
+        self.screen = screen
+        self.static_layer = static_layer
+        self.items = []
+        self.previous_items = None
+        self.overlay_rects = []
+        self.fills = {}
+
+    def blit(self, surface: Surface, dest) -> Rect:
+        """
+        Queue a surface to be drawn on this frame, same call form as Surface.blit.\n
+        :param surface: The surface to draw -> Surface object.
+        :param dest: The top-left corner as a tuple or a Rect -> tuple or Rect object.
+
+        :return: Rect, the region of the item.
+        """
+        rect = surface.get_rect(topleft=(dest[0], dest[1]))
+        self.items.append((surface, rect))
+        return rect
+
+    def draw_rect(self, color: tuple[int, int, int], rect: Rect, width: int = 0) -> Rect:
+        """
+        Queue a solid (width 0) or outlined rectangle, same arguments as pygame.draw.rect without the surface.\n
+        :param color: The color of the rectangle -> tuple object.
+        :param rect: The region of the rectangle -> Rect object.
+        :param width: The width of the outline, 0 -> filled -> int object.
+
+        :return: Rect, the region of the item.
+        """
+        key = (rect.size, tuple(color), width)
+        if key not in self.fills:
+            surface = Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(surface, color, surface.get_rect(), width)
+            self.fills[key] = surface
+        return self.blit(self.fills[key], rect)
+
+    def overlay(self, surface: Surface, dest) -> None:
+        """
+        Draw a surface straight on the screen above the last presented frame and show it at once, for messages that are shown
+        while the game waits in the middle of a frame. The region is restored when the next frame is presented.\n
+        :param surface: The surface to draw -> Surface object.
+        :param dest: The top-left corner -> tuple object.
+
+        :return: None
+        """
+        rect = self.screen.blit(surface, dest)
+        self.overlay_rects.append(rect)
+        pygame.display.update(rect)
+
+    def invalidate(self) -> None:
+        """
+        Force the next presented frame to redraw the whole screen.\n
+
+        :return: None
+        """
+        self.previous_items = None
+
+    def dirty_rects(self) -> list:
+        """
+        Compare the queued frame with the previous one and return the regions that changed.\n
+
+        :return: list of Rect
+        """
+        if self.previous_items is None:
+            return [self.screen.get_rect()]
+        previous = Counter((surface, tuple(rect)) for surface, rect in self.previous_items)
+        current = Counter((surface, tuple(rect)) for surface, rect in self.items)
+        if previous == current:
+            if all(old[0] is new[0] and old[1] == new[1] for old, new in zip(self.previous_items, self.items)):
+                return merge_rects(self.overlay_rects)
+            return [self.screen.get_rect()]  # The same items in another order, the stacking may have changed
+        changed = [Rect(rect) for _, rect in ((previous - current) + (current - previous)).elements()]
+        return merge_rects(changed + self.overlay_rects)
+
+    def present(self) -> list:
+        """
+        Draw the changed regions of the queued frame on the screen, send them to the display and start a new frame.\n
+
+        :return: list of Rect, the regions that were updated.
+        """
+        dirty = self.dirty_rects()
+        for dirty_rect in dirty:
+            self.screen.set_clip(dirty_rect)
+            self.screen.blit(self.static_layer, dirty_rect, dirty_rect)
+            for surface, rect in self.items:
+                if rect.colliderect(dirty_rect):
+                    self.screen.blit(surface, rect)
+        self.screen.set_clip(None)
+        if dirty:
+            pygame.display.update(dirty)
+        self.previous_items = self.items
+        self.items = []
+        self.overlay_rects = []
+        return dirty
+
+
+def merge_rects(rects: list) -> list:
+    """
+    Merge overlapping rectangles, so no region is restored and redrawn twice.\n
+    :param rects: The rectangles to merge -> list of Rect.
+
+    :return: list of Rect
+    """
+    merged = []
+    for rect in rects:
+        rect = Rect(rect)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
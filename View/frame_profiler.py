@@ -0,0 +1,141 @@
+from collections import deque
+from time import perf_counter_ns
+
+from View.settings import PROFILER_HISTORY, PROFILER_REFRESH
+
+
+class FrameProfiler:
+    """
+    Profiler of the frames of the game loop.\n
+    The loop is split into phases by laps, lap(name) charges the time since the previous lap to a phase. The phase times and the
+    frame times of the last frames are kept in ring buffers for the overlay, and the totals of the whole run for the exit summary.
+    The overlay rows are computed again only every PROFILER_REFRESH frames, so their texts do not change on every frame.\n
+
+    Attributes:\n
+    history: the number of frames that the ring buffers hold -> int.\n
+    frame_times: the time of every recent frame in ms -> deque of float.\n
+    phase_times: the time of every phase on the recent frames in ms, 0 on a frame that the phase did not run, so every deque holds
+     the same frames as frame_times -> dict of {phase name: deque of float}.\n
+    totals: the total time of every phase over the whole run in ns -> dict of {phase name: int}.\n
+    peaks: the longest time of every phase over the whole run in ns -> dict of {phase name: int}.\n
+    frames: the number of frames that were recorded -> int.\n
+    current: the time of every phase on the current frame in ns -> dict of {phase name: int}.\n
+    frame_start: the time that the current frame started in ns -> int.\n
+    last_lap: the time of the last lap in ns -> int.\n
+    visible: the overlay is shown -> bool.\n
+    rows: the last computed overlay rows -> list of (str, float).
+    """
+
+    def __init__(self, history: int = PROFILER_HISTORY) -> None:
+        """
+        Initializes a FrameProfiler object.\n
+        :param history: The number of frames that the ring buffers hold -> int object.
+        """
+        self.history = history
+        self.frame_times = deque(maxlen=history)
+        self.phase_times = {}
+        self.totals = {}
+        self.peaks = {}
+        self.frames = 0
+        self.current = {}
+        self.frame_start = perf_counter_ns()
+        self.last_lap = self.frame_start
+        self.visible = False
+        self.rows = []
+
+    def lap(self, phase: str) -> None:
+        """
+        Charge the time since the previous lap to a phase of the current frame.\n
+        :param phase: The name of the phase -> str object.
+
+        :return: None
+        """
+        now = perf_counter_ns()
+        self.current[phase] = self.current.get(phase, 0) + now - self.last_lap
+        self.last_lap = now
+
+    def end_frame(self) -> None:
+        """
+        Record the current frame in the ring buffers and the totals and start a new frame.\n
+
+        :return: None
+        """
+        now = perf_counter_ns()
+        self.frame_times.append((now - self.frame_start) / 1e6)
+        for phase, elapsed in self.current.items():
+            if phase not in self.phase_times:
+                self.phase_times[phase] = deque(maxlen=self.history)
+                self.totals[phase] = 0
+                self.peaks[phase] = 0
+            self.totals[phase] += elapsed
+            self.peaks[phase] = max(self.peaks[phase], elapsed)
+        for phase, times in self.phase_times.items():
+            times.append(self.current.get(phase, 0) / 1e6)
+        self.frames += 1
+        self.current = {}
+        self.frame_start = now
+        self.last_lap = now
+        if self.visible and self.frames % PROFILER_REFRESH == 0:
+            self.rows = self.overlay_rows()
+
+    def toggle(self) -> None:
+        """
+        Show or hide the overlay.\n
+
+        :return: None
+        """
+        self.visible = not self.visible
+        self.rows = self.overlay_rows()
+
+    @staticmethod
+    def percentile(values, fraction: float) -> float:
+        """
+        Return the value below which a fraction of the values fall, by the nearest rank.\n
+        :param values: The values -> iterable of float.
+        :param fraction: The fraction from 0 to 1 -> float object.
+
+        :return: float, 0 when there are no values.
+        """
+        ordered = sorted(values)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def phase_means(self) -> dict:
+        """
+        Return the mean time of every phase on the recent frames, the frames that a phase did not run count as 0.\n
+
+        :return: dict of {phase name: ms}
+        """
+        return {phase: sum(times) / len(times) for phase, times in self.phase_times.items()}
+
+    def overlay_rows(self) -> list:
+        """
+        Compute the rows of the overlay, the frame time percentiles and the mean time of every phase in ms.\n
+
+        :return: list of (str, float), the text of a row and the share of the frame time to draw as a bar (None -> no bar).
+        """
+        rows = [("frame ms p50 %.1f p95 %.1f p99 %.1f" % (self.percentile(self.frame_times, 0.5),
+                                                          self.percentile(self.frame_times, 0.95),
+                                                          self.percentile(self.frame_times, 0.99)), None)]
+        frame_mean = max(sum(self.frame_times) / max(1, len(self.frame_times)), 1e-9)
+        for phase, mean in sorted(self.phase_means().items(), key=lambda item: -item[1]):
+            rows.append(("%-8s %6.2f" % (phase, mean), min(1.0, mean / frame_mean)))
+        return rows
+
+    def summary(self) -> str:
+        """
+        Return the summary of every phase over the whole run, its mean, p95 of the recent frames, peak and share of the run time.\n
+
+        :return: str
+        """
+        run_time = max(1, sum(self.totals.values()))
+        lines = ["Frame profile of %d frames, recent frame ms p50 %.2f p95 %.2f p99 %.2f" %
+                 (self.frames, self.percentile(self.frame_times, 0.5), self.percentile(self.frame_times, 0.95),
+                  self.percentile(self.frame_times, 0.99)),
+                 "%-10s %10s %10s %10s %8s" % ("phase", "mean ms", "p95 ms", "peak ms", "share")]
+        for phase, total in sorted(self.totals.items(), key=lambda item: -item[1]):
+            lines.append("%-10s %10.3f %10.3f %10.3f %7.1f%%" % (phase, total / 1e6 / max(1, self.frames),
+                                                                 self.percentile(self.phase_times[phase], 0.95),
+                                                                 self.peaks[phase] / 1e6, 100 * total / run_time))
+        return "\n".join(lines)
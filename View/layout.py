@@ -0,0 +1,36 @@
+# Geometry of the game screen, plain numbers and arithmetic only, so the Model can share the positions without importing pygame
+
+# SCREEN & BUTTONS
+screen_width = 1100
+screen_height = 750
+floor_width = screen_width - 275
+floor_height = screen_height - 137
+button_width = 100
+button_height = 50
+button_x = 38
+button_y = 550
+
+# PRISONER
+NUMBER_POSITION_ON_PRIS_ABOVE_9 = (13, 35)
+NUMBER_POSITION_ON_PRIS_BELOW_9 = (20, 35)
+
+# BOX
+CELL_SIZE = 80
+MAX_BOX_WIDTH = 10
+MAX_NO_PRISONER_BOX = 80  # The boxes that the viewport shows at once, the grid of the world holds every box of the game
+VIEW_ROWS = MAX_NO_PRISONER_BOX // MAX_BOX_WIDTH
+MAX_NO_ROUND = 30
+MAX_NO_PRIS = 5000
+DOOR_WAY = (120, 400)
+EXIT_POINT = (940, 460)
+BOX_START_X = 150
+BOX_START_Y = 80
+
+
+def box_world_pos(box_num: int) -> tuple[int, int]:
+    """
+    Return the position of a box in the world grid, rows of MAX_BOX_WIDTH boxes that go down from the first row on screen.\n
+    :param box_num: int, the box number from 1.
+    :return: tuple of (x,y).
+    """
+    return BOX_START_X + (box_num - 1) % MAX_BOX_WIDTH * CELL_SIZE, BOX_START_Y + (box_num - 1) // MAX_BOX_WIDTH * CELL_SIZE
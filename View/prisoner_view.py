@@ -1,6 +1,7 @@
 import pygame.transform
 from pygame.font import Font
 from pygame import Surface
+from View.dirty_renderer import DirtyRenderer
 from View.settings import *
 
 
@@ -11,18 +12,31 @@ class PrisonerV:
     Attributes:\n
     pos: the position tuple of (x,y) in form -> tuple[int,int].\n
     pris_num: the number of the prisoner.\n
-    screen: object that blitting the box image on screen.\n to the next target box -> Surface object.\n
-    img_prisoner: transformed image of the prisoner o better dimensions -> Surface object.\n
+    screen: object that blitting the box image on screen.\n to the next target box -> DirtyRenderer object.\n
+    img_prisoner: transformed image of the prisoner o better dimensions, the number is drawn on it once -> Surface object.\n
+    numbered: the number of the prisoner was drawn on img_prisoner -> bool.\n
     """
 
-    def __init__(self, start_pos: tuple[int, int], num: int, screen: Surface, image: Surface) -> None:
+    def __init__(self, start_pos: tuple[int, int], num: int, screen: DirtyRenderer, image: Surface) -> None:
         """
         Initializes a PrisonerV object.
         """
         self.pos = start_pos
         self.pris_num = num
-        self.img_prisoner = pygame.transform.scale(image, (image.get_width() + 27, image.get_height() + 25))
+        self.img_prisoner = pygame.transform.scale(image, self.scaled_size(image))
         self.screen = screen
+        self.numbered = False
+
+    @staticmethod
+    def scaled_size(image: Surface) -> tuple[int, int]:
+        """
+        Return the size that a prisoner image is scaled to on screen.
+
+        :param image: The image of the prisoner.\n
+
+        :return: tuple of (width, height)
+        """
+        return image.get_width() + 27, image.get_height() + 25
 
     def draw_prisoner(self, font: Font) -> None:
         """
@@ -32,13 +46,14 @@ class PrisonerV:
 
         :return: None
         """
-        text_surface = font.render(str(self.pris_num), True, BLACK)
-        if self.pris_num > 9:
-            text_rect = NUMBER_POSITION_ON_PRIS_ABOVE_9
-        else:
-            text_rect = NUMBER_POSITION_ON_PRIS_BELOW_9
-
-        self.img_prisoner.blit(text_surface, text_rect)
+        if not self.numbered:
+            text_surface = font.render(str(self.pris_num), True, BLACK)
+            if self.pris_num > 9:
+                text_rect = NUMBER_POSITION_ON_PRIS_ABOVE_9
+            else:
+                text_rect = NUMBER_POSITION_ON_PRIS_BELOW_9
+            self.img_prisoner.blit(text_surface, text_rect)
+            self.numbered = True
         self.screen.blit(self.img_prisoner, self.pos)
 
     def set_pris_pos(self, pos: tuple[int, int]) -> None:
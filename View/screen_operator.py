@@ -1,7 +1,12 @@
 import tkinter
 import warnings
+from typing import TextIO
+from View.assets import ASSETS
+from View.dirty_renderer import DirtyRenderer
+from View.frame_profiler import FrameProfiler
 from View.prisoner_view import PrisonerV
 from View.settings import *
+from View.text_cache import TextCache
 import pygame
 
 
@@ -33,6 +38,7 @@ class ScreenOperator:
     size_main_screen: the size's main screen.\n
     main_screen: the main screen object of the game.\n
     background_image: the image of the background's game.\n
+    renderer: the dirty-rectangle renderer that every object of the main screen is drawn through -> DirtyRenderer object.\n
     start_rect: the rect object of the start button.\n
     start_hover_rect: the hover rect object of the start button.\n
     text_surface_start: the surface object of the text of start button.\n
@@ -43,6 +49,9 @@ class ScreenOperator:
     reset_hover_rect: the hover rect object of the reset button.\n
     text_surface_reset: the surface object of the text of reset button.\n
     text: the text object of the secondary window (tkinter).\n
+    speed_label: the text of the game speed -> str.\n
+    text_cache: the rendered texts of the HUD and the menu, a text is rendered again only when it changes -> TextCache object.\n
+    profiler_font: the small font of the profiler overlay -> Font object.\n
     """
 
     def __init__(self) -> None:
@@ -54,6 +63,8 @@ class ScreenOperator:
         self.error_prisoner_max = False
         self.error_round_max = False
         self.font = pygame.font.SysFont('monospace', FONT_SIZE, bold=True)
+        self.text_cache = TextCache(TEXT_CACHE_SIZE)
+        self.profiler_font = pygame.font.SysFont('monospace', PROFILER_FONT_SIZE, bold=True)
 
         # Variables
         self.p_color = RED
@@ -65,13 +76,21 @@ class ScreenOperator:
         self.current_round = -1
         self.num_succeeded = 0
         self.mouse_click = None
+        self.speed_label = ""
 
         # Screen and background
         self.size_main_screen = (screen_width, screen_height)
         self.main_screen = pygame.display.set_mode(self.size_main_screen)
+        ASSETS.convert_all()
 
-        self.background_image = pygame.transform.scale(IMG_BACKGROUND, (screen_width, screen_height))
-        self.floor_image = pygame.transform.scale(IMG_FLOOR, (floor_width, floor_height))
+        self.background_image = ASSETS.scaled_image(IMG_BACKGROUND, (screen_width, screen_height))
+        self.floor_image = ASSETS.scaled_image(IMG_FLOOR, (floor_width, floor_height))
+
+        # The background and the floor never change, they are composited once and restored under the objects that moved
+        static_layer = pygame.Surface(self.size_main_screen).convert()
+        static_layer.blit(self.background_image, (0, 0))
+        static_layer.blit(self.floor_image, (138, 70))
+        self.renderer = DirtyRenderer(self.main_screen, static_layer)
 
         # Buttons
         self.start_rect = pygame.Rect(button_x, button_y - 75, button_width, button_height)
@@ -101,19 +120,19 @@ class ScreenOperator:
 
     def draw_failure(self, current_pris_num: int) -> None:
         """
-        Draw prisoner on view.\n
+        Draw prisoner on view, the message is shown at once above the last frame.\n
         :param current_pris_num: The current prisoner number -> int object.
 
         :return: None
         """
         txt = 'Prisoner ' + str(current_pris_num) + ' has been failed'
-        text_surface_failed = self.font.render(txt, True, RED)
+        text_surface_failed = self.render_text(txt, RED)
         text_pos_failed = (screen_width // 3, 45)
-        self.main_screen.blit(text_surface_failed, text_pos_failed)
+        self.renderer.overlay(text_surface_failed, text_pos_failed)
 
     def draw_success(self, current_pris_num: int, num_succeeded: int) -> None:
         """
-        Draw prisoner on view.\n
+        Draw prisoner on view, the message is shown at once above the last frame.\n
         :param current_pris_num: The current prisoner number -> int object.
         :param num_succeeded: The number of prisoner have been succeeded until now -> int object
 
@@ -121,9 +140,9 @@ class ScreenOperator:
         """
         self.num_succeeded = num_succeeded
         txt = 'Prisoner ' + str(current_pris_num) + ' has been succeeded'
-        text_surface_succeed = self.font.render(txt, True, GREEN)
+        text_surface_succeed = self.render_text(txt, GREEN)
         text_pos_succeed = (screen_width // 3, 45)
-        self.main_screen.blit(text_surface_succeed, text_pos_succeed)
+        self.renderer.overlay(text_surface_succeed, text_pos_succeed)
 
     def draw_button(self, mouse_click: tuple[int, int, int], mouse_pos: tuple[int, int],
                     rect: pygame.Rect, hover: pygame.Rect, text_surface: pygame.Surface,
@@ -147,14 +166,14 @@ class ScreenOperator:
 
         if mouse_over_button:
             # Draw the hover rect if the mouse is over the button
-            pygame.draw.rect(self.main_screen, color, hover)
+            self.renderer.draw_rect(color, hover)
         else:
             # Draw the normal state if the mouse is not over the button
-            pygame.draw.rect(self.main_screen, WHITE, rect)
+            self.renderer.draw_rect(WHITE, rect)
 
         # Draw the text surface in the center of the button
-        self.main_screen.blit(text_surface, (rect.x + rect.width // 2 - text_surface.get_width() // 2,
-                                             rect.y + rect.height // 2 - text_surface.get_height() // 2))
+        self.renderer.blit(text_surface, (rect.x + rect.width // 2 - text_surface.get_width() // 2,
+                                          rect.y + rect.height // 2 - text_surface.get_height() // 2))
 
         # Check if mouse is over button and button is clicked
 
@@ -173,12 +192,13 @@ class ScreenOperator:
         """
         Draw prisoner on view.\n
         :param boxes_on_screen_obj: The current prisoner number -> dict object.\n
-        :param prisoner: Prisoner object to be printed -> Prisoner object.\n
+        :param prisoner: Prisoner object to be printed, None -> the prisoner is out of the viewport -> Prisoner object.\n
 
         :return: None
         """
         self.draw_boxes(boxes_on_screen_obj)
-        self.draw_prisoner(prisoner)
+        if prisoner is not None:
+            self.draw_prisoner(prisoner)
         self.draw_round_num()
         self.draw_num_succeeded()
         self.draw_time_reach_box()
@@ -199,9 +219,9 @@ class ScreenOperator:
         :return: None
         """
         txt = 'Current round : ' + str(self.current_round)
-        text_surface_round = self.font.render(txt, True, BLACK)
+        text_surface_round = self.render_text(txt, BLACK)
         text_pos_round = (screen_width // 3 + 50, 20)
-        self.main_screen.blit(text_surface_round, text_pos_round)
+        self.renderer.blit(text_surface_round, text_pos_round)
 
     @suppress_warnings
     def read_from_file(self) -> str:
@@ -249,6 +269,28 @@ class ScreenOperator:
         self.text.delete("1.0", tk.END)  # delete all text from the widget
         self.text.insert(tk.END, txt)
 
+    def append_text_on_secondary_screen(self, txt: str, tk: tkinter) -> None:
+        """
+        Add text at the end of the secondary screen (tkinter), the text that is already shown is kept.\n
+        :param txt: the text to add.\n
+        :param tk: the tkinter object to run the window, text and the scrollbar.\n
+
+        :return: None
+        """
+        self.text.insert(tk.END, txt)
+
+    def stream_text_on_secondary_screen(self, report: TextIO, tk: tkinter) -> None:
+        """
+        Write a report on the secondary screen (tkinter) chunk by chunk, so the report is never read whole into memory.\n
+        :param report: a text handle of the report.\n
+        :param tk: the tkinter object to run the window, text and the scrollbar.\n
+
+        :return: None
+        """
+        self.text.delete("1.0", tk.END)  # delete all text from the widget
+        for chunk in iter(lambda: report.read(REPORT_CHUNK_SIZE), ''):
+            self.text.insert(tk.END, chunk)
+
     def draw_menu(self) -> None:
         """
         Draw all menu's objects.\n
@@ -267,6 +309,7 @@ class ScreenOperator:
             self.draw_label(RED, 430, (screen_height - 35), 'MAX ' + str(MAX_NO_ROUND) + ' rounds in view')
 
         self.draw_label(self.s_color, 680, (screen_height - 70), 'Specified result:')
+        self.draw_label(BLACK, SPEED_LABEL_POS[0], SPEED_LABEL_POS[1], self.speed_label)
 
     def draw_check_box(self, print_specify: bool) -> None:
         """
@@ -280,9 +323,19 @@ class ScreenOperator:
             text = 'X'
         else:
             text = ''
-        pygame.draw.rect(self.main_screen, RED, select_box, 2)
-        text_surface = self.font.render(text, True, RED)
-        self.main_screen.blit(text_surface, (904, (screen_height - 70)))
+        self.renderer.draw_rect(RED, select_box, 2)
+        text_surface = self.render_text(text, RED)
+        self.renderer.blit(text_surface, (904, (screen_height - 70)))
+
+    def render_text(self, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render a text with the font of the screen through the text cache.\n
+        :param text: The text to render -> str object.
+        :param color: The color of the text -> tuple object.
+
+        :return: Surface
+        """
+        return self.text_cache.render(self.font, text, color)
 
     def draw_label(self, color: tuple[int, int, int], pos_x: int, pos_y: int, text: str = "") -> None:
         """
@@ -293,8 +346,8 @@ class ScreenOperator:
         :param pos_y: The y position of the top-left corner of the label.
         :param text: The text to be displayed in the label. Defaults to an empty string.
         """
-        text_surface = self.font.render(text, True, color)
-        self.main_screen.blit(text_surface, (pos_x, pos_y))
+        text_surface = self.render_text(text, color)
+        self.renderer.blit(text_surface, (pos_x, pos_y))
 
     @suppress_warnings
     def draw_boxes(self, boxes_on_screen_obj: dict) -> None:
@@ -309,14 +362,38 @@ class ScreenOperator:
 
     def draw_screen(self) -> None:
         """
-        Draw the main screen.\n
+        Draw the main screen, the background and the floor are restored by the renderer where objects changed.\n
 
         :return: None
         """
-        self.main_screen.blit(self.background_image, (0, 0))
-        self.main_screen.blit(self.floor_image, (138, 70))
         self.draw_menu()
 
+    def draw_profiler(self, profiler: FrameProfiler) -> None:
+        """
+        Draw the overlay of the frame profiler above all the objects, the frame time percentiles and a bar of the share of the
+        frame time of every phase.\n
+        :param profiler: The profiler of the game loop -> FrameProfiler object.
+
+        :return: None
+        """
+        pos_x, pos_y = PROFILER_POS
+        panel = pygame.Rect(pos_x - 5, pos_y - 5, 160 + PROFILER_BAR_WIDTH, len(profiler.rows) * PROFILER_ROW_HEIGHT + 10)
+        self.renderer.draw_rect(WHITE, panel)
+        for row, (text, share) in enumerate(profiler.rows):
+            row_y = pos_y + row * PROFILER_ROW_HEIGHT
+            self.renderer.blit(self.text_cache.render(self.profiler_font, text, BLACK), (pos_x, row_y))
+            if share:
+                bar = pygame.Rect(pos_x + 150, row_y + 3, max(1, int(share * PROFILER_BAR_WIDTH)), PROFILER_ROW_HEIGHT - 6)
+                self.renderer.draw_rect(PROFILER_BAR_COLOR, bar)
+
+    def present(self) -> None:
+        """
+        Show the frame, only the regions that changed since the last frame are redrawn and sent to the display.\n
+
+        :return: None
+        """
+        self.renderer.present()
+
     def draw_num_succeeded(self) -> None:
         """
         Draw the number of prisoner that have been succeeded on the screen.\n
@@ -324,6 +401,6 @@ class ScreenOperator:
         :return: None
         """
         txt_num_succeeded = str(self.num_succeeded) + ' Succeeded'
-        text_surface_num_succeed = self.font.render(txt_num_succeeded, True, GREEN)
+        text_surface_num_succeed = self.render_text(txt_num_succeeded, GREEN)
         text_pos_num_succeed = (screen_width // 2 + 250, 20)
-        self.main_screen.blit(text_surface_num_succeed, text_pos_num_succeed)
+        self.renderer.blit(text_surface_num_succeed, text_pos_num_succeed)
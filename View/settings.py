@@ -1,5 +1,4 @@
-import pygame
-import os
+from View.layout import *
 
 # Color
 GREEN = (0, 255, 0)
@@ -10,66 +9,45 @@ WHITE = (255, 255, 255)
 YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 
-# SCREEN & BUTTONS
-screen_width = 1100
-screen_height = 750
-floor_width = screen_width - 275
-floor_height = screen_height - 137
-button_width = 100
-button_height = 50
+# BUTTONS
 BUTTON_COLOR = WHITE
-button_x = 38
-button_y = 550
 
 # FONT
 FONT_SIZE = 20
+TEXT_CACHE_SIZE = 256  # rendered texts kept by the HUD and menu
 
-# PRISONER
-NUMBER_POSITION_ON_PRIS_ABOVE_9 = (13, 35)
-NUMBER_POSITION_ON_PRIS_BELOW_9 = (20, 35)
-
-# BOX
-CELL_SIZE = 80
-MAX_BOX_WIDTH = 10
-MAX_NO_PRISONER_BOX = 80
-MAX_NO_ROUND = 30
-MAX_NO_PRIS = 50
-DOOR_WAY = (120, 400)
-EXIT_POINT = (940, 460)
-BOX_START_X = 150
-BOX_START_Y = 80
+# RESOURCES, the files are loaded on first use by View.assets.ASSETS
+RESOURCES_DIR = 'View/Resources'
 
 # IMAGES BOX
-IMG_BOX = pygame.image.load(os.path.join('View/Resources', 'chest_closed.png'))
-IMG_BOX_WIDTH = IMG_BOX.get_width()
-IMG_BOX_HEIGHT = IMG_BOX.get_height()
+IMG_BOX_CLOSED = 'chest_closed.png'
+IMG_BOX_OPEN = 'chest_open.png'
 
 # IMAGES' PRISONERS
-IMG_SP1_F = pygame.image.load(os.path.join('View/Resources', 'SP1_front.png'))
-IMG_SP2_F = pygame.image.load(os.path.join('View/Resources', 'SP2_front.png'))
-IMG_SP3_F = pygame.image.load(os.path.join('View/Resources', 'SP3_front.png'))
-IMG_SP4_F = pygame.image.load(os.path.join('View/Resources', 'SP4_front.png'))
-IMG_FP1_F = pygame.image.load(os.path.join('View/Resources', 'FP1_front.png'))
-IMG_FP2_F = pygame.image.load(os.path.join('View/Resources', 'FP2_front.png'))
+IMG_PRISONERS = ('SP1_front.png', 'SP2_front.png', 'SP3_front.png', 'SP4_front.png', 'FP1_front.png', 'FP2_front.png')
 
 # IMAGE BACKGROUND
-IMG_BACKGROUND = pygame.image.load(os.path.join('View/Resources', 'Lunatic_Room.jpg'))
-IMG_FLOOR = pygame.image.load(os.path.join('View/Resources', 'floor.jpg'))
+IMG_BACKGROUND = 'Lunatic_Room.jpg'
+IMG_FLOOR = 'floor.jpg'
 
 # SOUNDS
-pygame.mixer.init()
-OPEN_CHEST_SOUND = pygame.mixer.Sound(os.path.join('View/Resources', 'open_chest_sound.mp3'))
-SUCCESS_SOUND = pygame.mixer.Sound(os.path.join('View/Resources', 'success_sound.mp3'))
-SUCCESS_SOUND.set_volume(0.2)
-FAILURE_SOUND = pygame.mixer.Sound(os.path.join('View/Resources', 'failure_sound.mp3'))
-# FAILURE_SOUND.set_volume(0.2)
+OPEN_CHEST_SOUND = 'open_chest_sound.mp3'
+SUCCESS_SOUND = 'success_sound.mp3'
+FAILURE_SOUND = 'failure_sound.mp3'
+SOUND_VOLUMES = {SUCCESS_SOUND: 0.2}
 
 # USER GUIDE TEXT
 USER_GUIDE = 'USER GUIDE:\n' + \
              '---------------------------------------' + \
              '\n\n' + 'LEFT ARROW: Select prisoner text input' + \
              '\n' + 'RIGHT ARROW: Select specify print check box' + \
-             '\n' + 'X - Select/Unselect check box' + '\n\n' + \
+             '\n' + 'X - Select/Unselect check box' + \
+             '\n' + 'UP/DOWN ARROW: Change the game speed' + \
+             '\n' + '(1x, 10x, 100x, max)' + \
+             '\n' + 'END: Jump to the results of the game' + \
+             '\n' + 'F3: Show/hide the frame profiler' + \
+             '\n' + 'PAGE UP/DOWN, MOUSE WHEEL: Scroll the boxes' + \
+             '\n' + 'HOME: The view follows the prisoner again' + '\n\n' + \
              '---------------------------------------' + \
              '\n' + 'Press START to run the game after' + '\n' + \
              '---------------------------------------' + \
@@ -77,10 +55,34 @@ USER_GUIDE = 'USER GUIDE:\n' + \
              '---------------------------------------' + \
              '\n' + 'Press RESET to clear the screen' + '\n' + \
              '\n' + '*Please be notified that that the maximum numbers' + \
-             '\n' + 'of prisoners that can participate the game is 200' + \
-             '\n' + 'From 200 prisoners onwards you can only' + \
+             '\n' + 'of prisoners that can participate the game is ' + str(MAX_NO_PRIS) + \
+             '\n' + 'From ' + str(MAX_NO_PRIS) + ' prisoners onwards you can only' + \
              '\n' + 'calculate probabilities*'
 
+# RESULTS WINDOW
+REPORT_CHUNK_SIZE = 1 << 16
+
 # FRAME CLOCK RATE
 FRAME_RATE = 25
 WAIT_FRAME_RATE = 1
+
+# GAME SPEED, model ticks per rendered frame, None -> as many ticks as one frame time allows
+GAME_SPEEDS = (1, 10, 100, None)
+MAX_TICKS_PER_FRAME = 20000
+# The most frames whose ticks are caught up in one frame after the rendering fell behind
+MAX_CATCH_UP_FRAMES = 4
+SPEED_LABEL_POS = (20, 20)
+
+# FRAME PROFILER, the frames kept for the overlay and the frames between two refreshes of its texts
+PROFILER_HISTORY = 250
+PROFILER_REFRESH = 10
+PROFILER_POS = (20, 50)
+PROFILER_FONT_SIZE = 14
+PROFILER_ROW_HEIGHT = 16
+PROFILER_BAR_WIDTH = 120
+PROFILER_BAR_COLOR = (0, 160, 0)
+
+# BOX SLOTS, the sprites of the boxes out of the viewport that are kept for scrolling back, one viewport of boxes
+BOX_SLOT_CACHE = MAX_NO_PRISONER_BOX
+# the upcoming boxes of the chain whose row is prepared on a frame that has time to spare
+PREFETCH_PER_FRAME = 2
@@ -0,0 +1,84 @@
+from time import perf_counter
+
+from View.settings import FRAME_RATE, GAME_SPEEDS, MAX_CATCH_UP_FRAMES, MAX_TICKS_PER_FRAME
+
+
+class SimulationClock:
+    """
+    Fixed-timestep clock of the animated game, decoupled from the rendering.\n
+    At 1x one model tick is run per rendered frame, as the game always did. At a speed of s, s ticks are run per frame, and when a
+    frame took longer than the frame rate allows the ticks of up to MAX_CATCH_UP_FRAMES dropped frames are run as well, so the game
+    keeps its speed through a short stall and only the rendering is skipped, while a long stall is not replayed at once. At max speed ticks are run until the time of one frame is used up. The ticks are
+    the same ModelManger.run_game steps at every speed, so the outcome of a game does not depend on the speed.\n
+
+    Attributes:\n
+    speed_index: the index of the current speed in GAME_SPEEDS -> int.\n
+    frame_time: the time of one frame in seconds -> float.\n
+    frame_start: the time in seconds that the current frame started -> float.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a SimulationClock object at 1x speed.
+        """
+        self.speed_index = 0
+        self.frame_time = 1 / FRAME_RATE
+        self.frame_start = perf_counter()
+
+    def get_speed(self) -> int:
+        """
+        Return the speed multiplier, None -> max speed.\n
+
+        :return: int
+        """
+        return GAME_SPEEDS[self.speed_index]
+
+    def is_real_time(self) -> bool:
+        """
+        Check if the game runs at 1x, pauses and sounds are played only in real time.\n
+
+        :return: bool
+        """
+        return self.get_speed() == 1
+
+    def faster(self) -> None:
+        """
+        Switch to the next speed.\n
+
+        :return: None
+        """
+        self.speed_index = min(self.speed_index + 1, len(GAME_SPEEDS) - 1)
+
+    def slower(self) -> None:
+        """
+        Switch to the previous speed.\n
+
+        :return: None
+        """
+        self.speed_index = max(self.speed_index - 1, 0)
+
+    def speed_label(self) -> str:
+        """
+        Return the speed as shown on screen.\n
+
+        :return: str
+        """
+        return 'Speed: ' + ('max' if self.get_speed() is None else str(self.get_speed()) + 'x')
+
+    def ticks(self, elapsed_ms: int):
+        """
+        Generate the ticks that the model runs before the next frame is rendered.\n
+        :param elapsed_ms: The time of the last frame in milliseconds as returned by Clock.tick -> int object.
+
+        :return: generator of int, the index of the tick within the frame.
+        """
+        self.frame_start = perf_counter()
+        speed = self.get_speed()
+        if speed is None:
+            tick = 0
+            while tick < MAX_TICKS_PER_FRAME and (tick == 0 or perf_counter() - self.frame_start < self.frame_time):
+                yield tick
+                tick += 1
+            return
+        frames = max(1, min(round(elapsed_ms / 1000 / self.frame_time), MAX_CATCH_UP_FRAMES))  # the rendering fell behind
+        yield from range(min(speed * frames, MAX_TICKS_PER_FRAME))
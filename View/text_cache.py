@@ -0,0 +1,56 @@
+from collections import OrderedDict
+
+from pygame import Surface
+from pygame.font import Font
+
+
+class TextCache:
+    """
+    Least recently used cache of rendered texts, a text is rendered again only when it was not drawn lately.\n
+
+    Attributes:\n
+    max_size: the number of rendered texts that are kept -> int.\n
+    surfaces: the rendered texts from the least to the most recently used -> OrderedDict of {(text, color, font): Surface}.\n
+    hits: the number of renders that were served from the cache -> int.\n
+    misses: the number of renders that called font.render -> int.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initializes a TextCache object.\n
+        :param max_size: The number of rendered texts that are kept -> int object.
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: Font, text: str, color: tuple[int, int, int]) -> Surface:
+        """
+        Return the text rendered by a font in a color, the returned surface is shared and must not be drawn on.\n
+        :param font: The font of the text -> Font object.
+        :param text: The text to render -> str object.
+        :param color: The color of the text -> tuple object.
+
+        :return: Surface
+        """
+        key = (text, tuple(color), font)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)  # Dropping the least recently used text
+        return surface
+
+    def stats(self) -> tuple[int, int]:
+        """
+        Return the counters of the cache.\n
+
+        :return: tuple of (hits, misses)
+        """
+        return self.hits, self.misses
@@ -1,16 +1,22 @@
-import math
 import sys
 import pygame.time
 import tkinter as tk
+from collections import deque
+from typing import TextIO
 from random import randint
 
 from pygame import Surface
 from pygame.event import Event
 from pygame.locals import KEYDOWN, K_BACKSPACE
+from View.assets import ASSETS
 from View.screen_operator import ScreenOperator, suppress_warnings
 from View.prisoner_view import PrisonerV
 from View.settings import *
 from View.box_view import BoxV
+from View.box_slots import BoxSlots
+from View.simulation_clock import SimulationClock
+from View.camera import Camera
+from View.frame_profiler import FrameProfiler
 from pygame.time import Clock
 import pygame.mixer
 
@@ -25,7 +31,7 @@ class ViewManager:
 
     state: the state of the game for the current particular time -> str object.\n
     running: boolean parameter -> bool.\n
-    num_of_boxes_view: the number of boxes that view represents -> int.\n
+    num_of_boxes_view: the number of boxes of the world grid that the view represents -> int.\n
     num_of_prisoners: the number of prisoners -> int.\n
     status: the status of the view -> str object.\n
     current_round: the current round in the game -> int object.\n
@@ -34,17 +40,29 @@ class ViewManager:
     print_specify: the flag if the results would be specify or not.\n
     prisoner: the prisoner that is currently searching for his number -> PrisonerV object.\n
     listener: coordinates the activity between the backend and the frontend -> Controller object.\n
-    boxes_on_screen_obj: dictionary of BoxV objects that are currently on screen mapped by their
-     number -> dict of {int:BoxV object}.\n
-    boxes_on_screen_pos: dictionary of tuple of position of each BoxV object, mapped by their
+    boxes_on_screen_obj: dictionary of BoxV objects of the boxes in the viewport, the other boxes have no sprite or a kept one in the
+     box slots, mapped by their number -> dict of {int:BoxV object}.\n
+    prefetch_queue: the upcoming boxes of the chain that are prepared on the next frames with time to spare -> deque of int.\n
+    box_slots: the pool of the sprites of the boxes out of the viewport, reused by the boxes that enter it -> BoxSlots object.\n
+    boxes_world_pos: dictionary of the position of every box in the world grid, mapped by their
      number -> dict of {int: tuple (x,y)}.\n
-    boxes_off_screen_obj: dictionary of BoxV objects that are not currently on screen mapped by their
-     number -> dict of {int:BoxV object}.\n
+    opened_boxes: the number printed in every box that the current prisoner opened, kept for the boxes out of the viewport
+     -> dict of {int: int}.\n
+    camera: the camera that decides which rows of the world grid are in the viewport -> Camera object.\n
+    prisoner_world_pos: the position of the prisoner in the world grid -> tuple (x,y).\n
     list_depend: list of box dependencies number from zero to num of prisoners - 1.\n
+    layout_version: incremented whenever the boxes dictionaries are cleared or rearranged -> int.\n
+    built_layout: the (boxes in view, boxes, layout version) that the current boxes were built for -> tuple.\n
+    results_pending: the statistics of the running game are calculated in the background and not printed yet -> bool.\n
+    game_summary: the results of the rounds of a game that was jumped to its end, printed after the statistics -> str.\n
     root: tkinter window (secondary screen).\n
     screen_operator: object that organizes the drawing of the objects on screen, fonts and
      buttons -> ScreenOpreator object.\n
     clock: clock the keeps the frame rate reasonable -> Clock object.\n
+    sim_clock: the fixed-timestep clock that decides how many model ticks run per rendered frame -> SimulationClock object.\n
+    frame_ms: the time of the last rendered frame of the game in milliseconds -> int.\n
+    frame_start: the time in milliseconds that the work of the current frame started, right after the last frame wait -> int.\n
+    profiler: the timings of the phases of every frame of the run loop -> FrameProfiler object.\n
     """
 
     def __init__(self) -> None:
@@ -64,19 +82,31 @@ class ViewManager:
         self.num_of_rounds = 0
         self.actual_num_of_boxes = 0
         self.print_specify = False
+        self.results_pending = False
+        self.game_summary = ""
 
         # Objects
         self.prisoner = None
         self.listener = None
         self.boxes_on_screen_obj = {}
-        self.boxes_on_screen_pos = {}
-        self.boxes_off_screen_obj = {}
+        self.box_slots = None
+        self.prefetch_queue = deque()
+        self.boxes_world_pos = {}
+        self.opened_boxes = {}
+        self.camera = Camera()
+        self.prisoner_world_pos = DOOR_WAY
         self.list_depend = {}  # Dictionary of {num round : list of dependencies}
+        self.layout_version = 0
+        self.built_layout = None
 
         # Screen Operations
         self.root = None
         self.screen_operator = None
         self.clock = Clock()
+        self.sim_clock = SimulationClock()
+        self.frame_ms = 0
+        self.frame_start = 0
+        self.profiler = FrameProfiler()
 
     @suppress_warnings
     def pygame_setup(self) -> None:
@@ -89,6 +119,8 @@ class ViewManager:
         pygame.font.init()
         pygame.display.set_caption("Prisoners Riddle")
         self.screen_operator = ScreenOperator()
+        self.box_slots = BoxSlots(self.screen_operator.renderer)
+        self.screen_operator.speed_label = self.sim_clock.speed_label()
 
     def run(self) -> None:
         """
@@ -111,8 +143,11 @@ class ViewManager:
             # listens to event
             if self.state != 'running':
                 self.screen_operator.draw_boxes(boxes_on_screen_obj=self.boxes_on_screen_obj)
+            self.profiler.lap("menu")
             self.listen_to_events()
+            self.profiler.lap("events")
             self.button_events()
+            self.profiler.lap("buttons")
 
             # Occurs when reset button is clicked
             if self.state == 'reset':
@@ -139,42 +174,82 @@ class ViewManager:
                 self.list_depend = self.listener. \
                     view_need_to_init_game(self.num_of_prisoners, self.num_of_rounds, DOOR_WAY, self.print_specify)
 
-                # prints result to tk
-                self.tk_print_results()
+                # the results are printed to tk once the background statistics are ready
+                self.results_pending = True
+
+                # every game starts with the camera on the door
+                self.close_opened_boxes()
+                self.camera.following = True
+                if self.camera.move_to(0):
+                    self.update_visible_boxes()
+                self.prisoner_world_pos = DOOR_WAY
 
                 pris_num = self.view_request_pris_num()
                 self.create_prisoner(pris_num)
+                self.set_round(1)
                 self.state = "running"
 
-            if self.state == "running":
-                pris_num = self.view_request_pris_num()
-                self.current_round = self.view_request_round_num()
-
-                if pris_num != self.prisoner.pris_num:
-                    self.replace_prisoner(prisoner_num=pris_num)
-
-                self.screen_operator.current_round = self.current_round
-
-                if self.view_request_is_running_game():
-                    self.view_request_run_game()
+                # the clock does not tick while no game runs, so the idle time before the start is not caught up as dropped frames
+                self.clock.tick()
+                self.frame_ms = 0
+                self.frame_start = pygame.time.get_ticks()
 
-                    pos = self.view_request_pris_pos()
-                    self.prisoner.set_pris_pos(pos=pos)
-
-                    self.screen_operator.draw_objects(self.boxes_on_screen_obj, self.prisoner)
-                else:
-                    self.state = 'reset'
-                self.clock.tick(FRAME_RATE)
+            if self.results_pending and self.view_request_statistics_ready():
+                self.tk_print_results()
+                self.results_pending = False
+            self.profiler.lap("state")
 
-            # Update the display
-            pygame.display.update()
+            if self.state == "running":
+                # The model runs the ticks of this frame by the game speed, the frames in between are not rendered
+                for _ in self.sim_clock.ticks(self.frame_ms):
+                    if not self.view_request_run_game():
+                        self.state = 'reset'
+                        break
+                self.profiler.lap("model")
+
+                # The changes of all the ticks of the frame arrive at once, in the order they took place
+                self.view_request_events()
+                self.profiler.lap("bus")
+
+                if self.state == "running":
+                    prisoner_in_view = self.camera.is_visible(self.prisoner_world_pos, self.prisoner.img_prisoner.get_height())
+                    self.screen_operator.draw_objects(self.boxes_on_screen_obj, self.prisoner if prisoner_in_view else None)
+                self.profiler.lap("draw")
+                self.prepare_upcoming_boxes()
+                self.profiler.lap("prefetch")
+                self.frame_ms = self.clock.tick(FRAME_RATE)
+                self.frame_start = pygame.time.get_ticks()
+                self.profiler.lap("wait")
+
+            if self.profiler.visible:
+                self.screen_operator.draw_profiler(self.profiler)
+
+            # Update the changed regions of the display
+            self.screen_operator.present()
+            self.profiler.lap("present")
             self.root.update()
+            self.profiler.lap("tk")
+            self.profiler.end_frame()
 
         # Quit the game
+        print(self.profiler.summary())
         pygame.quit()
         self.root.quit()
         sys.exit()
 
+    def change_speed(self, faster: bool) -> None:
+        """
+        Method that switches the game to the next or the previous speed.\n
+        :param faster: True -> the next speed, False -> the previous speed.\n
+
+        :return: None.
+        """
+        if faster:
+            self.sim_clock.faster()
+        else:
+            self.sim_clock.slower()
+        self.screen_operator.speed_label = self.sim_clock.speed_label()
+
     def tk_print_results(self) -> None:
         """
         Print the results from the file into the secondary results (tkinter).
@@ -184,8 +259,38 @@ class ViewManager:
         if not self.is_root_up:
             self.set_secondary_window()
             self.screen_operator.config_text_window(tk, self.root)
-        result = self.view_get_output()
-        self.screen_operator.write_text_on_secondary_screen(result, tk)
+        with self.view_get_output() as report:
+            self.screen_operator.stream_text_on_secondary_screen(report, tk)
+        self.tk_print_summary()
+
+    def tk_print_summary(self) -> None:
+        """
+        Print the results of the rounds of a game that was jumped to its end after the text of the secondary screen (tkinter).
+
+        :return: None
+        """
+        if not self.game_summary:
+            return
+        if not self.is_root_up:
+            self.set_secondary_window()
+            self.screen_operator.config_text_window(tk, self.root)
+        self.screen_operator.append_text_on_secondary_screen(self.game_summary, tk)
+        self.game_summary = ""
+
+    def jump_to_results(self) -> None:
+        """
+        Method that ends the running game at once, the results of all the rounds come from the round timelines of the model.\n
+        The results are printed after the statistics, or at once if the statistics were already printed.
+
+        :return: None
+        """
+        results = self.listener.view_need_to_finish_game()
+        self.game_summary = "\n\nGame results:\n" + "".join(
+            "Round {}: {} out of {} prisoners found their number{}\n".format(
+                round_num, succeeded, self.num_of_prisoners, ", all the prisoners are free" if round_succeeded else "")
+            for round_num, succeeded, round_succeeded in results)
+        if not self.results_pending:
+            self.tk_print_summary()
 
     def on_close(self, event):  # Ignoring method of exit button for tk window
         # self.is_root_up = False
@@ -223,9 +328,10 @@ class ViewManager:
         self.screen_operator.num_succeeded = 0
 
         # Objects
-        self.boxes_on_screen_pos.clear()
-        self.boxes_off_screen_obj.clear()
-        self.boxes_on_screen_obj.clear()
+        self.boxes_world_pos.clear()
+        self.opened_boxes.clear()
+        self.release_all_boxes()
+        self.invalidate_layout()
 
         # Screen
         self.screen_operator.text_input_n = ""
@@ -284,6 +390,28 @@ class ViewManager:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            if event.type == KEYDOWN and event.key == pygame.K_END and self.state == 'running':
+                self.jump_to_results()
+
+            if event.type == KEYDOWN and event.key in (pygame.K_UP, pygame.K_DOWN):
+                self.change_speed(faster=event.key == pygame.K_UP)
+
+            if event.type == KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+
+            if event.type == KEYDOWN and event.key in (pygame.K_PAGEUP, pygame.K_PAGEDOWN):
+                self.scroll_boxes(rows=-1 if event.key == pygame.K_PAGEUP else 1)
+
+            if event.type == pygame.MOUSEWHEEL:
+                self.scroll_boxes(rows=-event.y)
+
+            if event.type == KEYDOWN and event.key == pygame.K_HOME:  # The camera follows the prisoner again
+                self.camera.following = True
+                self.update_prisoner_location(self.prisoner_world_pos)
+
+            if event.type == pygame.WINDOWEXPOSED:  # The window content was lost, the next frame is drawn whole
+                self.screen_operator.renderer.invalidate()
+
             if event.type == KEYDOWN and self.state != 'begin':
 
                 self.decide_input_type(event)
@@ -342,12 +470,28 @@ class ViewManager:
 
     def update_prisoner_location(self, pos: tuple[int, int]) -> None:
         """
-        Updates the location of the prisoner.\n
-        :param pos: The new location of the prisoner as a tuple of integers (x, y).\n
+        Updates the location of the prisoner, the camera follows the prisoner and the prisoner is placed on screen by the camera.\n
+        :param pos: The new location of the prisoner in the world grid as a tuple of integers (x, y).\n
 
         :return: None.
         """
-        self.prisoner.set_pris_pos(pos)
+        self.prisoner_world_pos = pos
+        if self.camera.follow(pos):
+            self.update_visible_boxes()
+        if self.prisoner:
+            self.prisoner.set_pris_pos(self.camera.to_screen(pos))
+
+    def scroll_boxes(self, rows: int) -> None:
+        """
+        Scrolls the viewport over the world grid of boxes, the camera stops following the prisoner until HOME is pressed.\n
+        :param rows: The number of rows to scroll, positive -> down.\n
+
+        :return: None.
+        """
+        if self.camera.scroll(rows):
+            self.update_visible_boxes()
+            if self.prisoner:
+                self.prisoner.set_pris_pos(self.camera.to_screen(self.prisoner_world_pos))
 
     def convert_input_prisoner_to_num(self) -> None:
         """
@@ -360,14 +504,9 @@ class ViewManager:
                 self.screen_operator.error_prisoner_max = True
                 self.screen_operator.run_only_probs = True
                 self.num_of_boxes_view = MAX_NO_PRISONER_BOX
-            else:  # occurs when the input is below the max num of prisoners
+            else:  # occurs when the input is below the max num of prisoners, the world grid holds all the boxes
                 self.screen_operator.error_prisoner_max = False
-
-                if num <= MAX_NO_PRISONER_BOX:
-                    self.num_of_boxes_view = num
-                else:  # occurs when the input is valid and there are boxes more than the displayed
-                    self.num_of_boxes_view = MAX_NO_PRISONER_BOX
-
+                self.num_of_boxes_view = num
                 self.num_of_prisoners = num
             self.actual_num_of_boxes = num
         else:
@@ -387,8 +526,9 @@ class ViewManager:
         """
         if event_input.key == K_BACKSPACE:
             if len(text) > 0:
-                self.boxes_on_screen_obj.clear()
-                self.boxes_on_screen_pos.clear()
+                self.release_all_boxes()
+                self.boxes_world_pos.clear()
+                self.invalidate_layout()
                 text = text[:-1]
         else:
             text += event_input.unicode
@@ -396,146 +536,174 @@ class ViewManager:
 
     def create_boxes(self) -> None:
         """
-        Method that creates boxes on screen and determines which boxes are on
-        screen in case of overflow and also in charge of the position of each box.\n
+        Method that places all the boxes in the world grid and creates the boxes of the viewport.\n
+        The boxes are built again only when the number of boxes or the layout version changed since the last build, otherwise
+        the existing boxes and positions are kept and the model is not notified.\n
 
         :return: None
         """
-        rows = int(math.floor(self.num_of_boxes_view / MAX_BOX_WIDTH))
-        remainder = self.num_of_boxes_view - rows * MAX_BOX_WIDTH
-
-        # create the boxes the complete a row of boxes
-        for row in range(rows):
-            for col in range(MAX_BOX_WIDTH):
-                box = BoxV(screen=self.screen_operator.main_screen, box_num=row * MAX_BOX_WIDTH + col + 1)
-                box.set_pos(new_pos=(BOX_START_X + col * CELL_SIZE, BOX_START_Y + row * CELL_SIZE))
-                self.boxes_on_screen_obj[box.box_num] = box  # Mapping objects of BoxV by their number
-                self.boxes_on_screen_pos[
-                    box.box_num] = box.get_pos()  # Mapping positions of BoxV objects by their number
-
-        # create the remained boxes
-        for rem in range(remainder):
-            box = BoxV(screen=self.screen_operator.main_screen, box_num=rows * MAX_BOX_WIDTH + rem + 1)
-            box.set_pos(new_pos=(BOX_START_X + rem * CELL_SIZE, BOX_START_Y + rows * CELL_SIZE))
-            self.boxes_on_screen_obj[box.box_num] = box
-            self.boxes_on_screen_pos[box.box_num] = box.get_pos()
-
-        # occurs when there boxes the overflow the screen and the amount of the boxes inputted is valid
-        if self.actual_num_of_boxes - MAX_NO_PRISONER_BOX > 0:
-            for box_index in range(MAX_NO_PRISONER_BOX + 1, self.actual_num_of_boxes + 1):
-                box = BoxV(screen=self.screen_operator.main_screen, box_num=box_index)
-                self.boxes_off_screen_obj[box.box_num] = box
+        layout = (self.num_of_boxes_view, self.actual_num_of_boxes, self.layout_version)
+        if layout == self.built_layout:
+            return
+        self.release_all_boxes()
+        self.opened_boxes.clear()
+        self.boxes_world_pos = {box_num: box_world_pos(box_num) for box_num in range(1, self.num_of_boxes_view + 1)}
+        self.camera.set_world(self.num_of_boxes_view)
+        self.update_visible_boxes()
 
         # update boxes positions
         self.view_request_update_boxes_pos()
+        self.built_layout = layout
 
-    def create_prisoner(self, num_prisoner: int) -> None:
+    def update_visible_boxes(self) -> None:
         """
-        Method that creates a new PrisonerV object.
-        :param num_prisoner: An integer representing the number of the prisoner.\n
+        Method that culls the boxes by the viewport, the boxes that left it are returned to the box slots, the boxes that entered it
+        take their sprite from the box slots and are opened or closed by opened_boxes, and every box of the viewport is placed on
+        screen by the camera.\n
+
+        :return: None
+        """
+        visible = self.camera.visible_boxes(self.num_of_boxes_view)
+        for box_num in [box_num for box_num in self.boxes_on_screen_obj if box_num not in visible]:
+            self.box_slots.release(self.boxes_on_screen_obj.pop(box_num))
+        for box_num in visible:
+            if box_num not in self.boxes_on_screen_obj:
+                box = self.box_slots.acquire(box_num)
+                opened_num = self.opened_boxes.get(box_num)
+                if opened_num is None and box.open:  # a kept sprite of a chain that already ended
+                    box.close_box(box_num)
+                elif opened_num is not None and (not box.open or box.print_num != opened_num):
+                    box.clear_image(opened_num)
+                    box.open_box(new_name_img=IMG_BOX_OPEN, color=RED)
+                self.boxes_on_screen_obj[box_num] = box
+            self.boxes_on_screen_obj[box_num].set_pos(self.camera.to_screen(self.boxes_world_pos[box_num]))
+
+    def release_all_boxes(self) -> None:
+        """
+        Method that drops the boxes of the viewport and every kept box, their sprites are left to the box slots for the next layout.\n
 
         :return: None.
         """
-        self.prisoner = PrisonerV(DOOR_WAY, num_prisoner, self.screen_operator.main_screen,
-                                  self.generate_random_image().convert_alpha())
+        self.box_slots.clear(self.boxes_on_screen_obj.values())
+        self.boxes_on_screen_obj.clear()
+        self.prefetch_queue.clear()
 
-    @suppress_warnings
-    def generate_random_image(self) -> Surface:
+    def close_opened_boxes(self) -> None:
         """
-        Method that generate random image's prisoner to load.
+        Method that closes all the boxes that the current prisoner opened, the kept sprites out of the viewport are closed when they
+        enter it again.\n
 
-        :return: The image itself -> Surface.
+        :return: None.
         """
-        images = [IMG_SP1_F, IMG_SP2_F, IMG_SP3_F, IMG_SP4_F, IMG_FP1_F, IMG_FP2_F]
-        image_name = images[randint(0, len(images) - 1)]
-        return image_name
+        self.opened_boxes.clear()
+        for box in self.boxes_on_screen_obj.values():
+            box.close_box(box.box_num)
+        self.prefetch_queue.clear()
 
-    def replace_prisoner(self, prisoner_num: int) -> None:
+    def prefetch_boxes(self, box_nums: tuple) -> None:
         """
-        Method that replaces the current prisoner with a new one and close all boxes when prisoner replaces.\n
-        :param prisoner_num: An integer representing the number of the new prisoner.\n
+        Method that gets the boxes that the prisoner opens next, they replace the boxes that were not prepared yet.\n
+        :param box_nums: The box numbers in the order the prisoner opens them -> tuple of int.\n
 
         :return: None.
         """
-        for box in self.boxes_on_screen_obj.values():
-            box.close_box(box.box_num)
-        self.create_prisoner(prisoner_num)
+        self.prefetch_queue = deque(box_nums)
 
-    def handle_box_request(self, box_number: int) -> None:
+    def prepare_upcoming_boxes(self) -> None:
         """
-        Method that gets a new box number that overflows the screen and replaces an existing box in the screen
-        :param box_number: An integer representing the number of the box would be display on the screen.\n
+        Method that prepares the upcoming boxes while the work of the current frame is within the frame budget, the wait of the
+        frame limiter is not counted as work.\n
 
         :return: None.
         """
+        for _ in range(min(PREFETCH_PER_FRAME, len(self.prefetch_queue))):
+            if pygame.time.get_ticks() - self.frame_start >= 1000 // FRAME_RATE:
+                return
+            self.prepare_box(self.prefetch_queue.popleft())
 
-        # check if the overflow box num is not in the view box on the screen
-        if box_number in self.boxes_on_screen_pos.keys():
+    def prepare_box(self, box_num: int) -> None:
+        """
+        Method that renders the numbers of a box and keeps sprites ready for the boxes of its row that are out of the viewport, so
+        the camera brings the row into the viewport without creating sprites on that frame.\n
+        :param box_num: The box number -> int object.\n
+
+        :return: None.
+        """
+        if box_num not in self.boxes_world_pos:
             return
-        else:
-            replaced_num_box = 0
-            while replaced_num_box not in self.boxes_on_screen_pos or box_number == replaced_num_box:
-                replaced_num_box = randint(1, self.num_of_prisoners)
-
-            pos = self.boxes_on_screen_pos.pop(
-                replaced_num_box)  # The value position of the replaced box is moved to a local variable
-            self.boxes_on_screen_obj.pop(replaced_num_box)
-
-            # Putting the new box on the other bo position on screen
-            self.boxes_off_screen_obj.pop(box_number)  # Removing the target box from self.boxes_off_screen_obj
-            target_box = BoxV(screen=self.screen_operator.main_screen, box_num=box_number)
-            self.boxes_on_screen_pos.update({box_number: pos})
-            self.boxes_on_screen_obj.update({box_number: target_box})
-            target_box.set_pos(pos)
-
-            # Putting the replaced box in self.boxes_off_screen_obj
-            replaced_box = BoxV(screen=self.screen_operator.main_screen,
-                                box_num=replaced_num_box)  # Creating new object of the replaced box
-            self.boxes_off_screen_obj.update({replaced_num_box: replaced_box})
-            self.view_request_update_boxes_pos()
+        BoxV.render_number(box_num, YELLOW)
+        BoxV.render_number(box_num, BLACK)
+        BoxV.render_number(self.list_depend.next_box(self.current_round, box_num), RED)
+        row = self.camera.row_of(self.boxes_world_pos[box_num])
+        for row_box_num in self.camera.row_boxes(row, self.num_of_boxes_view):
+            if row_box_num not in self.boxes_on_screen_obj:
+                self.box_slots.prepare(row_box_num)
 
-    def open_box(self, box_num: int) -> None:
+    def invalidate_layout(self) -> None:
         """
-        Method that opens the box according the box number.
-        :param box_num: An integer representing the number of the box to be opened.\n
+        Method that marks the boxes layout as changed, so the boxes are built again on the next idle frame.\n
 
         :return: None.
         """
-        # clear the current box image
-        if not self.boxes_on_screen_obj[box_num].open:
-            self.boxes_on_screen_obj[box_num].clear_image(self.list_depend[self.current_round][box_num - 1])
+        self.layout_version += 1
 
-            # replace the image
-            self.boxes_on_screen_obj[box_num].open_box(new_name_img="chest_open.png", color=RED)
-            # list of dependencies starting from 0
+    def create_prisoner(self, num_prisoner: int) -> None:
+        """
+        Method that creates a new PrisonerV object.
+        :param num_prisoner: An integer representing the number of the prisoner.\n
 
-            OPEN_CHEST_SOUND.play()  # plays the open chest sound
-            self.clock.tick(WAIT_FRAME_RATE)  # waits 1 frame rate
+        :return: None.
+        """
+        self.prisoner = PrisonerV(DOOR_WAY, num_prisoner, self.screen_operator.renderer, self.generate_random_image())
 
-    def get_boxes_locations(self) -> dict:
+    @suppress_warnings
+    def generate_random_image(self) -> Surface:
         """
-        Method returns the dictionary of the boxes on the screen
+        Method that generate random image's prisoner to load, the image is shared by the asset manager.
 
-        :return:  boxes on the screen -> dict.
+        :return: The image itself -> Surface.
         """
-        return self.boxes_on_screen_pos
+        image_name = IMG_PRISONERS[randint(0, len(IMG_PRISONERS) - 1)]
+        return ASSETS.image(image_name)
 
-    @suppress_warnings
-    def get_box_dimensions(self) -> tuple:
+    def replace_prisoner(self, prisoner_num: int) -> None:
         """
-        Method that returns the box dimensions on the screen.
+        Method that replaces the current prisoner with a new one and close all boxes when prisoner replaces.\n
+        :param prisoner_num: An integer representing the number of the new prisoner.\n
 
-        :return: box dimension -> tuple.
+        :return: None.
         """
-        return IMG_BOX_WIDTH, IMG_BOX_HEIGHT
+        self.close_opened_boxes()
+        self.create_prisoner(prisoner_num)
+        self.prisoner.set_pris_pos(self.camera.to_screen(self.prisoner_world_pos))
 
-    def get_pris_dimensions(self) -> tuple:
+    def open_box(self, box_num: int) -> None:
         """
-        Method that returns the prisoner dimensions on the screen.
+        Method that opens the box according the box number.
+        :param box_num: An integer representing the number of the box to be opened.\n
 
-        :return: box dimension -> tuple.
+        :return: None.
         """
-        return self.prisoner.img_prisoner.get_rect().width, self.prisoner.img_prisoner.get_rect().height
+        # clear the current box image, the state of a box out of the viewport is kept until the box is created again
+        if box_num not in self.opened_boxes:
+            self.opened_boxes[box_num] = self.list_depend.next_box(self.current_round, box_num)
+            if box_num in self.boxes_on_screen_obj:
+                self.boxes_on_screen_obj[box_num].clear_image(self.opened_boxes[box_num])
+
+                # replace the image
+                self.boxes_on_screen_obj[box_num].open_box(new_name_img=IMG_BOX_OPEN, color=RED)
+
+            if self.sim_clock.is_real_time():  # faster games do not stop at every box
+                ASSETS.sound(OPEN_CHEST_SOUND).play()  # plays the open chest sound
+                self.clock.tick(WAIT_FRAME_RATE)  # waits 1 frame rate
+
+    def get_boxes_locations(self) -> dict:
+        """
+        Method returns the dictionary of the positions of all the boxes in the world grid
+
+        :return:  boxes in the world grid -> dict.
+        """
+        return self.boxes_world_pos
 
     @suppress_warnings
     def handle_with_success(self, current_pris_num, num_succeeded) -> None:
@@ -546,10 +714,10 @@ class ViewManager:
 
         :return: None.
         """
-        SUCCESS_SOUND.play()
         self.screen_operator.draw_success(current_pris_num, num_succeeded)
-        pygame.display.update()
-        self.clock.tick(1)
+        if self.sim_clock.is_real_time():
+            ASSETS.sound(SUCCESS_SOUND).play()
+            self.clock.tick(1)
 
     @suppress_warnings
     def handle_with_failure(self, current_pris_num) -> None:
@@ -559,10 +727,10 @@ class ViewManager:
 
         :return: None
         """
-        FAILURE_SOUND.play()
         self.screen_operator.draw_failure(current_pris_num)
-        pygame.display.update()
-        self.clock.tick(1)
+        if self.sim_clock.is_real_time():
+            ASSETS.sound(FAILURE_SOUND).play()
+            self.clock.tick(1)
 
     def handle_with_time(self, time: float) -> None:
         """
@@ -573,15 +741,17 @@ class ViewManager:
         """
         self.screen_operator.current_reach_time = time
 
-    """*******************************************MVC Methods******************************************************"""
-
-    def view_request_pris_pos(self) -> tuple[int, int]:
+    def set_round(self, round_num: int) -> None:
         """
-        Method that requests from the model the current prisoner position.\n
+        Method that updates the current round of the game.\n
+        :param round_num: int, the current round number.
 
-        :return: the position of prisoner -> tuple (x,y).
+        :return: None.
         """
-        return self.listener.view_need_pris_pos()
+        self.current_round = round_num
+        self.screen_operator.current_round = round_num
+
+    """*******************************************MVC Methods******************************************************"""
 
     def view_request_to_start_game(self, num_of_prisoners: int, num_of_rounds: int, initial_pos: tuple[int, int],
                                    print_specifically: bool) -> dict:
@@ -597,14 +767,6 @@ class ViewManager:
         """
         return self.listener.view_need_to_init_game(num_of_prisoners, num_of_rounds, initial_pos, print_specifically)
 
-    def view_request_round_num(self) -> int:
-        """
-        Method that requests from the model the current prisoner number.\n
-
-        :return: the number of prisoner -> int.
-        """
-        return self.listener.view_need_round_num()
-
     def view_request_pris_num(self) -> int:
         """
         Method that requests from the model the current prisoner number.\n
@@ -613,21 +775,21 @@ class ViewManager:
         """
         return self.listener.view_need_pris_num()
 
-    def view_request_run_game(self) -> None:
+    def view_request_run_game(self) -> bool:
         """
-        Method that requests from the model to start the game.\n
+        Method that requests from the model to run a single tick of the game.\n
 
-        :return: None.
+        :return: False -> the game is over -> bool.
         """
-        self.listener.view_need_to_run_game()
+        return self.listener.view_need_to_run_game()
 
-    def view_request_is_running_game(self) -> None:
+    def view_request_events(self) -> int:
         """
-        Method that checks the game status in the back.\n
+        Method that requests from the model the events that were published since the last frame.\n
 
-        :return: None.
+        :return: the number of delivered events -> int.
         """
-        return self.listener.view_need_know_game_status()
+        return self.listener.view_need_events()
 
     def view_request_update_boxes_pos(self) -> None:
         """
@@ -656,10 +818,18 @@ class ViewManager:
         """
         self.listener.view_need_to_init_statistics(num_prisoners, num_rounds, print_specify)
 
-    def view_get_output(self) -> str:
+    def view_request_statistics_ready(self) -> bool:
+        """
+        Method that checks if the statistics of the running game were calculated.\n
+
+        :return: bool.
+        """
+        return self.listener.view_need_statistics_ready()
+
+    def view_get_output(self) -> TextIO:
         """
          Method that that get statistics.\n
-        :return: str.
+        :return: TextIO, a handle of the statistics report.
         """
         return self.listener.view_need_output()
 
@@ -0,0 +1,309 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+from time import perf_counter
+
+from Model.modelmanager import ModelManger
+from Model.probabilities_handler import ProbabilitiesHandler
+from Model.round_engine import round_permutation
+from Model.route_cache import route_between
+from View.layout import DOOR_WAY, box_world_pos
+
+SEED = 2023
+# A measured run repeats the work until it takes at least this long, so the short benchmarks are not lost in the timer noise
+MIN_RUN_SECONDS = 0.2
+BASELINE_FILE = "benchmark_baseline.json"
+# A benchmark that is slower than the baseline allows is measured again this many times, it is reported only if it stays slower
+RECHECKS = 2
+
+
+class HeadlessView:
+    """
+    Stand-in of the view for the benchmarks of the game model, the boxes are placed in the world grid as the game places them.\n
+
+    Attributes:\n
+
+    boxes_world_pos: the positions of the boxes in the world grid -> dict of {box number: tuple[int,int]}.
+    """
+
+    def __init__(self, num_prisoners: int) -> None:
+        """
+        Initialize HeadlessView object.\n
+        :param num_prisoners: int, the number of boxes of the game.
+        :return: None.
+        """
+        self.boxes_world_pos = {box_num: box_world_pos(box_num) for box_num in range(1, num_prisoners + 1)}
+
+    def model_need_all_boxes_on_screen_pos(self) -> dict:
+        """
+        Return the positions of the boxes in the world grid.\n
+        :return: dict of {box number: tuple[int,int]}.
+        """
+        return self.boxes_world_pos
+
+
+def new_model(num_prisoners: int) -> ModelManger:
+    """
+    Create a model of a game of one round with a headless view, without starting the statistics of the game.\n
+    :param num_prisoners: int, the number of prisoners.
+    :return: ModelManger object.
+    """
+    model = ModelManger()
+    model.set_listener(HeadlessView(num_prisoners))
+    model.dict_rounds = ProbabilitiesHandler(num_prisoners, 1, False, seed=SEED).prepare_rounds()
+    model.total_pris = num_prisoners
+    model.total_rounds = 1
+    model.initial_pos = DOOR_WAY
+    return model
+
+
+def bench_run_route(num_prisoners: int, print_route: bool):
+    """
+    Benchmark of ProbabilitiesHandler.run_route on one round, the route report is written to the null device.\n
+    :param num_prisoners: int, the number of prisoners.
+    :param print_route: bool, the routes of the prisoners are written.
+    :return: callable, the measured work.
+    """
+    prob_handler = ProbabilitiesHandler(num_prisoners, 1, print_route, seed=SEED)
+    list_of_boxes = round_permutation("python", num_prisoners, SEED)
+
+    def work():
+        prob_handler.file = open(os.devnull, "w", buffering=prob_handler.buffer_size)
+        try:
+            prob_handler.run_route(list_of_boxes, print_route)
+        finally:
+            prob_handler.close_file()
+    return work
+
+
+def bench_run_all_probs(num_prisoners: int, num_rounds: int, print_route: bool, directory: str):
+    """
+    Benchmark of ProbabilitiesHandler.run_all_probs with the python engine in a single process.\n
+    :param num_prisoners: int, the number of prisoners.
+    :param num_rounds: int, the number of rounds.
+    :param print_route: bool, the routes of the prisoners are written.
+    :param directory: str, the directory of the report file.
+    :return: callable, the measured work.
+    """
+    prob_handler = ProbabilitiesHandler(num_prisoners, num_rounds, print_route, backend="python", workers=1, seed=SEED,
+                                        filename=os.path.join(directory, "run_all_probs.txt"))
+    return lambda: prob_handler.run_all_probs(print_route)
+
+
+def bench_run_probabilities(num_prisoners: int, num_rounds: int, directory: str):
+    """
+    Benchmark of ProbabilitiesHandler.run_probabilities with the numpy engine in a single process.\n
+    :param num_prisoners: int, the number of prisoners.
+    :param num_rounds: int, the number of rounds.
+    :param directory: str, the directory of the report file.
+    :return: callable, the measured work.
+    """
+    prob_handler = ProbabilitiesHandler(num_prisoners, num_rounds, False, backend="numpy", workers=1, seed=SEED,
+                                        filename=os.path.join(directory, "run_probabilities.txt"))
+    return prob_handler.run_probabilities
+
+
+def bench_init_game(num_prisoners: int):
+    """
+    Benchmark of ModelManger.init_boxes and ModelManger.init_prisoners of a round.\n
+    :param num_prisoners: int, the number of prisoners.
+    :return: callable, the measured work.
+    """
+    model = new_model(num_prisoners)
+
+    def work():
+        model.init_boxes(num_pris=num_prisoners)
+        model.init_prisoners(num_pris=num_prisoners, initial_pos=DOOR_WAY)
+    return work
+
+
+def bench_search_round(num_prisoners: int):
+    """
+    Benchmark of PrisonerM.is_still_searching and PrisonerM.navigate, every prisoner of a round walks his chain to the end, the cache
+    of the routes is emptied first so every run plans its routes.\n
+    :param num_prisoners: int, the number of prisoners.
+    :return: callable, the measured work.
+    """
+    model = new_model(num_prisoners)
+
+    def work():
+        route_between.cache_clear()
+        model.init_boxes(num_pris=num_prisoners)
+        model.init_prisoners(num_pris=num_prisoners, initial_pos=DOOR_WAY)
+        for pris_num, prisoner in model.dict_prisoners.items():
+            model.current_pris_num = pris_num
+            while prisoner.is_still_searching()[0]:
+                if not prisoner.on_exit:
+                    model.model_request_box()
+                prisoner.navigate()
+    return work
+
+
+def suite(directory: str) -> list:
+    """
+    Return the benchmarks of the suite, every benchmark over a range of numbers of prisoners.\n
+    :param directory: str, the directory of the report files.
+    :return: list of (name, factory), the factory creates the measured work.
+    """
+    cases = []
+    for n in (100, 1000, 10000):
+        cases.append(("run_route[n={}]".format(n), lambda n=n: bench_run_route(n, False)))
+    for n in (10, 100, 1000):  # The route report of a round grows with n * n
+        cases.append(("run_route_print[n={}]".format(n), lambda n=n: bench_run_route(n, True)))
+    for n in (10, 100, 1000):
+        cases.append(("run_all_probs[n={}]".format(n), lambda n=n: bench_run_all_probs(n, 1000, False, directory)))
+        cases.append(("run_probabilities[n={}]".format(n), lambda n=n: bench_run_probabilities(n, 5000, directory)))
+    for n in (10, 100, 300):
+        cases.append(("run_all_probs_print[n={}]".format(n), lambda n=n: bench_run_all_probs(n, 20, True, directory)))
+    for n in (10, 50, 200):
+        cases.append(("init_game[n={}]".format(n), lambda n=n: bench_init_game(n)))
+    for n in (10, 30, 50):
+        cases.append(("search_round[n={}]".format(n), lambda n=n: bench_search_round(n)))
+    return cases
+
+
+def reference_time() -> float:
+    """
+    Time a fixed pure Python workload, the benchmarks are compared relative to it so a baseline holds on another machine.\n
+    :return: float, the best time in seconds of three runs.
+    """
+    best = float("inf")
+    for _ in range(3):
+        start = perf_counter()
+        total = 0
+        for value in range(1000000):
+            total += value * value % 7
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def measure(work, repeat: int) -> float:
+    """
+    Run the work to warm it up and to find how many times a run repeats it, and return the best time of a single work of the runs.
+    The garbage collector is paused during the runs, as timeit does, so a collection does not land on one run of a short benchmark.\n
+    :param work: callable, the measured work.
+    :param repeat: int, the number of measured runs.
+    :return: float, the best time in seconds.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        loops = 1
+        while True:
+            start = perf_counter()
+            for _ in range(loops):
+                work()
+            if perf_counter() - start >= MIN_RUN_SECONDS:
+                break
+            loops *= 2
+        best = float("inf")
+        for _ in range(repeat):
+            gc.collect()
+            start = perf_counter()
+            for _ in range(loops):
+                work()
+            best = min(best, (perf_counter() - start) / loops)
+        return best
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def run_suite(repeat: int, select: str = None, names: list = None) -> dict:
+    """
+    Run the benchmarks of the suite.\n
+    :param repeat: int, the number of measured runs of every benchmark.
+    :param select: str, only the benchmarks whose name contains it are run, None -> all of them.
+    :param names: list, only the benchmarks of these names are run, None -> all of them.
+    :return: dict, the results and the machine they were measured on.
+    """
+    reference = reference_time()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, factory in suite(directory):
+            if (select and select not in name) or (names is not None and name not in names):
+                continue
+            seconds = measure(factory(), repeat)
+            results[name] = {"seconds": seconds, "relative": seconds / reference}
+            print("{:<32} {:>10.4f} s {:>10.3f} x reference".format(name, seconds, seconds / reference))
+    return {"python": platform.python_version(), "machine": platform.platform(), "seed": SEED, "repeat": repeat,
+            "reference_seconds": reference, "results": results}
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compare the results with the baseline by the times relative to the reference workload.\n
+    :param current: dict, the results of this run.
+    :param baseline: dict, the results of the baseline.
+    :param tolerance: float, the allowed slowdown, 0.25 -> a benchmark may be 25% slower than the baseline.
+    :return: dict of {name: ratio}, the benchmarks that became slower than allowed and how many times slower they are.
+    """
+    regressions = {}
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        ratio = result["relative"] / baseline["results"][name]["relative"]
+        print("{:<32} {:>8.2f} x baseline".format(name, ratio))
+        if ratio > 1 + tolerance:
+            regressions[name] = ratio
+    return regressions
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Parse the command line of the benchmarks.\n
+    :param argv: list, the arguments without the program name, None -> sys.argv.
+    :return: Namespace, the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the model of the prisoners riddle against a stored baseline.")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of measured runs of every benchmark")
+    parser.add_argument("--select", default=None, help="run only the benchmarks whose name contains this text")
+    parser.add_argument("--output", default="benchmark_results.json", help="the file the results are written to")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="the stored baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="the allowed slowdown, 0.5 -> 50%% slower")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    """
+    Run the benchmarks, write the results and compare them with the baseline, only the Model is imported so pygame is never loaded.\n
+    :param argv: list, the arguments without the program name, None -> sys.argv.
+    :return: int, the exit status, 1 -> a benchmark became slower than the baseline allows.
+    """
+    args = parse_args(argv)
+    current = run_suite(args.repeat, args.select)
+    with open(args.output, "w") as results_file:
+        json.dump(current, results_file, indent=2)
+    if args.update_baseline:
+        if args.select and os.path.exists(args.baseline):  # Only the selected benchmarks are replaced
+            with open(args.baseline) as baseline_file:
+                results = json.load(baseline_file)["results"]
+            results.update(current["results"])
+            current = dict(current, results=results)
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+        print("The baseline was written to", args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        print("There is no baseline at", args.baseline, ", run with --update-baseline to store one")
+        return 0
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare(current, baseline, args.tolerance)
+    for _ in range(RECHECKS):  # A busy machine slows a single measurement down, a real regression stays slower
+        if not regressions:
+            break
+        print("Measuring again:", ", ".join(regressions))
+        regressions = compare(run_suite(args.repeat, names=list(regressions)), baseline, args.tolerance)
+    for name, ratio in regressions.items():
+        print("SLOWER: {} is {:.2f} x slower than the baseline".format(name, ratio))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import argparse
+
+from Model.exact_probability import longest_cycle_distribution
+from Model.probabilities_handler import ProbabilitiesHandler
+
+# The lengths of the longest cycle that are rarer than this, both simulated and exact, are left out of the comparison
+LONGEST_CYCLE_MIN_RATE = 0.001
+
+
+def int_at_least(minimum: int):
+    """
+    Return an argparse type that accepts an integer of at least a minimum value.\n
+    :param minimum: int, the smallest accepted value.
+    :return: callable, converts the text of an argument to int and raises ArgumentTypeError for a smaller value.
+    """
+    def convert(text: str) -> int:
+        value = int(text)
+        if value < minimum:
+            raise argparse.ArgumentTypeError("{} is less than {}".format(value, minimum))
+        return value
+    return convert
+
+
+def open_fraction(text: str) -> float:
+    """
+    The argparse type of a number between 0 and 1, both excluded.\n
+    :param text: str, the text of the argument.
+    :return: float, raises ArgumentTypeError for a number out of the range.
+    """
+    value = float(text)
+    if not 0 < value < 1:
+        raise argparse.ArgumentTypeError("{} is not between 0 and 1".format(value))
+    return value
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Parse the command line of the headless simulation.\n
+    :param argv: list, the arguments without the program name, None -> sys.argv.
+    :return: Namespace, the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Simulate the prisoners riddle without the game window.")
+    parser.add_argument("prisoners", type=int_at_least(2), help="the number of prisoners (and boxes), at least 2")
+    parser.add_argument("rounds", type=int_at_least(1), help="the number of rounds, at least 1, with --precision the most rounds to run")
+    parser.add_argument("--seed", type=int, default=None, help="the master seed, the same seed gives the same rounds")
+    parser.add_argument("--output", default=ProbabilitiesHandler.filename, help="the report file")
+    parser.add_argument("--backend", choices=ProbabilitiesHandler.backends, default="numpy", help="the simulation engine")
+    parser.add_argument("--workers", type=int_at_least(1), default=None, help="the number of worker processes, one per core by default")
+    parser.add_argument("--precision", type=open_fraction, default=None,
+                        help="stop as soon as the confidence interval of the success rate is at most this wide, for example 0.002")
+    parser.add_argument("--confidence", type=open_fraction, default=0.99, help="the confidence level of the --precision interval")
+    parser.add_argument("--longest-cycle", action="store_true",
+                        help="compare the simulated distribution of the longest cycle with the exact one")
+    parser.add_argument("--print-specifically", action="store_true", help="write the route of every prisoner to the report")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> None:
+    """
+    Run the simulation and write the report, only the Model is imported so pygame is never loaded.\n
+    :param argv: list, the arguments without the program name, None -> sys.argv.
+    :return: None.
+    """
+    args = parse_args(argv)
+    prob_handler = ProbabilitiesHandler(args.prisoners, args.rounds, args.print_specifically, backend=args.backend,
+                                        workers=args.workers, seed=args.seed, filename=args.output)
+    if args.precision is None:
+        prob_handler.run_probabilities()
+    else:
+        prob_handler.run_until_precision(args.precision, args.confidence, max_rounds=args.rounds)
+        print("The {}% Wilson interval of the success rate is {}".format(100 * args.confidence, prob_handler.interval))
+    print("{} successful rounds out of {}, seed {}, report written to {}".format(
+        prob_handler.success_rounds, prob_handler.rounds_used, prob_handler.seed, args.output))
+    if args.longest_cycle:
+        print_longest_cycles(prob_handler)
+
+
+def print_longest_cycles(prob_handler: ProbabilitiesHandler) -> None:
+    """
+    Print the simulated rate of every length of the longest cycle next to its exact probability, the lengths that are rarer than
+    LONGEST_CYCLE_MIN_RATE in both are left out, and the total variation distance between the two distributions.\n
+    :param prob_handler: ProbabilitiesHandler, the handler after its run.
+    :return: None.
+    """
+    simulated = prob_handler.longest_cycle_histogram() / prob_handler.rounds_used
+    exact = longest_cycle_distribution(prob_handler.num_prisoners)
+    print("{:>8} {:>12} {:>12}".format("longest", "simulated", "exact"))
+    for length in range(1, prob_handler.num_prisoners + 1):
+        if max(simulated[length], exact[length]) >= LONGEST_CYCLE_MIN_RATE:
+            print("{:>8} {:>12.6f} {:>12.6f}".format(length, simulated[length], exact[length]))
+    print("Total variation distance:", sum(abs(rate - probability) for rate, probability in zip(simulated, exact)) / 2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+import io
+import os
+import tempfile
+import unittest
+
+from Model.probabilities_handler import ProbabilitiesHandler
+from Model.round_engine import cycle_lengths, rounds_per_chunk
+
+
+def baseline_run_route(list_of_boxes: list, file) -> None:
+    """
+    The route report of a round as the first version of ProbabilitiesHandler.run_route printed it, box by box.\n
+    :param list_of_boxes: list, list of dependencies between the boxes numbered from zero to n-1.
+    :param file: the file the report is printed to.
+    :return: None.
+    """
+    number_of_boxes = len(list_of_boxes)
+    list_of_success = number_of_boxes * [0]
+    for j in range(number_of_boxes):
+        print("Prisoner number:", j + 1, file=file)
+        visited_boxes = []
+        pointer_box = list_of_boxes[j]
+        current_box = j + 1
+        visited_boxes.append(pointer_box)
+        for attempts in range(number_of_boxes):
+            success = False
+            print("Box number", current_box, " is leading to box", pointer_box + 1, file=file)
+            if pointer_box == j and attempts < (number_of_boxes // 2):
+                success = True
+                list_of_success[j] = 1
+                break
+            else:
+                if pointer_box == j:
+                    break
+                else:
+                    current_box = pointer_box + 1
+                    pointer_box = list_of_boxes[pointer_box]
+                    visited_boxes.append(pointer_box)
+        print("Total Boxes:", end=" ", file=file)
+        for o in range(number_of_boxes):
+            print(list_of_boxes[o] + 1, end=" ", file=file)
+        print(file=file)
+        print("Visited in boxes:", end=" ", file=file)
+        for g in range(len(visited_boxes)):
+            print(visited_boxes[g] + 1, end=" ", file=file)
+        print(file=file)
+        if success:
+            print("Prisoner number", j + 1, "has been succeeded,", "the chain length is", (attempts + 1), file=file)
+        else:
+            print("Prisoner number", j + 1, "has been failed,", "the chain length is", (attempts + 1), file=file)
+        print(file=file)
+    print("The number of prisoners that found their number is", sum(list_of_success), "\nout of", number_of_boxes, "prisoners.\n",
+          file=file)
+
+
+class DeterminismTest(unittest.TestCase):
+    """
+    Tests that a seed gives the same rounds and the same outcome whatever the workers, the store and the backend are.
+    """
+    num_prisoners = 50
+    num_rounds = 2000
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def run_handler(self, backend: str, workers: int, store: str = "seeds", store_path: str = None,
+                    print_route: bool = False, num_rounds: int = None, start_method: str = None) -> ProbabilitiesHandler:
+        prob_handler = ProbabilitiesHandler(self.num_prisoners, num_rounds or self.num_rounds, print_route, backend=backend,
+                                            workers=workers, seed=7, store=store, store_path=store_path,
+                                            filename=os.path.join(self.directory.name, "results.txt"), start_method=start_method)
+        prob_handler.pool_elements = 0  # every run with several workers goes through the process pool
+        prob_handler.run_probabilities()
+        return prob_handler
+
+    @staticmethod
+    def rounds_of(prob_handler: ProbabilitiesHandler) -> list:
+        return [list(prob_handler.dict_rounds[round_num]) for round_num in range(1, prob_handler.num_rounds + 1)]
+
+    def test_workers_do_not_change_the_run(self) -> None:
+        for backend in ProbabilitiesHandler.backends:
+            single = self.run_handler(backend, 1)
+            pooled = self.run_handler(backend, 4)
+            self.assertEqual(pooled.success_rounds, single.success_rounds)
+            self.assertEqual(self.rounds_of(pooled), self.rounds_of(single))
+        spawned = self.run_handler("numpy", 4, start_method="spawn")  # the workers of the game are spawned
+        self.assertEqual(spawned.success_rounds, single.success_rounds)
+
+    def test_array_stores_match_the_seeds_store(self) -> None:
+        seeds = self.run_handler("numpy", 1)
+        expected = self.rounds_of(seeds)
+        for workers in (1, 4):
+            in_memory = self.run_handler("numpy", workers, store="array")
+            mapped = self.run_handler("numpy", workers, store="array",
+                                      store_path=os.path.join(self.directory.name, "rounds{}.npy".format(workers)))
+            for prob_handler in (in_memory, mapped):
+                self.assertEqual(prob_handler.success_rounds, seeds.success_rounds)
+                self.assertEqual(self.rounds_of(prob_handler), expected)
+
+    def test_route_report_matches_the_baseline(self) -> None:
+        for backend in ProbabilitiesHandler.backends:
+            prob_handler = self.run_handler(backend, 4, print_route=True, num_rounds=30)
+            expected = io.StringIO()
+            for round_num in range(1, 31):
+                print("Round number:", round_num, file=expected)
+                baseline_run_route([box - 1 for box in prob_handler.dict_rounds[round_num]], expected)
+            with open(prob_handler.filename) as report:
+                text = report.read()
+            self.assertEqual(text[:len(expected.getvalue())], expected.getvalue())
+            self.assertTrue(text[len(expected.getvalue()):].startswith("The total number of prisoners is"))
+
+
+class LongestCycleHistogramTest(unittest.TestCase):
+    """
+    Tests of the histogram of the longest cycle of the simulated rounds.
+    """
+
+    def test_histogram_of_every_store(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            histograms = []
+            for backend, store in (("numpy", "seeds"), ("numpy", "array"), ("python", "seeds")):
+                prob_handler = ProbabilitiesHandler(20, 300, False, backend=backend, workers=1, seed=7, store=store,
+                                                    filename=os.path.join(directory, "results.txt"))
+                prob_handler.run_probabilities()
+                histogram = prob_handler.longest_cycle_histogram()
+                expected = (20 + 1) * [0]
+                for round_num in range(1, 301):
+                    expected[max(cycle_lengths([box - 1 for box in prob_handler.dict_rounds[round_num]]))] += 1
+                self.assertEqual(histogram.tolist(), expected)
+                self.assertEqual(int(histogram[:11].sum()), prob_handler.success_rounds)
+                histograms.append(histogram.tolist())
+            self.assertEqual(histograms[0], histograms[1])
+
+
+class RunUntilPrecisionTest(unittest.TestCase):
+    """
+    Tests of the adaptive run that stops at a requested width of the confidence interval.
+    """
+    num_prisoners = 100
+    target_width = 0.03
+    confidence = 0.95
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def run_handler(self, max_rounds: int) -> ProbabilitiesHandler:
+        prob_handler = ProbabilitiesHandler(self.num_prisoners, max_rounds, False, backend="numpy", workers=1, seed=7,
+                                            filename=os.path.join(self.directory.name, "results.txt"))
+        prob_handler.run_until_precision(self.target_width, self.confidence, max_rounds=max_rounds)
+        return prob_handler
+
+    def test_stops_at_the_requested_width(self) -> None:
+        prob_handler = self.run_handler(10 ** 6)
+        lower, upper = prob_handler.interval
+        self.assertLessEqual(upper - lower, self.target_width)
+        self.assertLess(prob_handler.rounds_used, 10 ** 6)
+        self.assertLessEqual(lower, prob_handler.success_rounds / prob_handler.rounds_used)
+        self.assertGreaterEqual(upper, prob_handler.success_rounds / prob_handler.rounds_used)
+
+        # One chunk less is not enough, so the run stopped at the first chunk that reached the width
+        chunk_size = rounds_per_chunk(self.num_prisoners, 0)
+        shorter = self.run_handler(prob_handler.rounds_used - chunk_size)
+        lower, upper = shorter.interval
+        self.assertGreater(upper - lower, self.target_width)
+
+    def test_rejects_invalid_input(self) -> None:
+        filename = os.path.join(self.directory.name, "results.txt")
+        for num_prisoners, max_rounds, confidence, message in ((100, 0, 0.95, "rounds must be greater 0"),
+                                                               (1, 1000, 0.95, "must be greater than 1"),
+                                                               (100, 1000, 1.0, "the confidence must be between 0 and 1")):
+            prob_handler = ProbabilitiesHandler(num_prisoners, max_rounds, False, backend="numpy", workers=1, seed=7,
+                                                filename=filename)
+            self.assertEqual(prob_handler.run_until_precision(self.target_width, confidence, max_rounds=max_rounds), 0)
+            self.assertIsNone(prob_handler.interval)
+            with open(filename) as report:
+                self.assertIn(message, report.read())
+
+    def test_stops_at_max_rounds(self) -> None:
+        prob_handler = self.run_handler(1000)
+        self.assertEqual(prob_handler.rounds_used, 1000)
+        lower, upper = prob_handler.interval
+        self.assertGreater(upper - lower, self.target_width)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import itertools
+import math
+import random
+import unittest
+
+import numpy as np
+
+from Model.exact_probability import longest_cycle_distribution, success_probability
+from Model.round_engine import cycle_lengths, max_cycle_lengths, round_seeds, shuffle_block
+
+
+def walk_cycles(list_of_boxes: list) -> list:
+    """
+    Follow the chain of every prisoner box by box, the way the prisoners open the boxes.\n
+    :param list_of_boxes: list, list of dependencies between the boxes numbered from zero to n-1.
+    :return: list, the chain length of each prisoner by its number.
+    """
+    lengths = []
+    for prisoner in range(len(list_of_boxes)):
+        chain_length = 1
+        pointer_box = list_of_boxes[prisoner]
+        while pointer_box != prisoner:
+            pointer_box = list_of_boxes[pointer_box]
+            chain_length += 1
+        lengths.append(chain_length)
+    return lengths
+
+
+class SuccessProbabilityTest(unittest.TestCase):
+    """
+    Tests of the exact success probability against the closed form and a full enumeration.
+    """
+
+    def test_closed_form(self) -> None:
+        closed_form = 1 - sum(1 / length for length in range(51, 101))
+        self.assertAlmostEqual(success_probability(100, 50), closed_form, places=12)
+
+    def test_recurrence_against_enumeration(self) -> None:
+        num_prisoners = 7
+        permutations = list(itertools.permutations(range(num_prisoners)))
+        for max_attempts in range(num_prisoners + 1):
+            short_enough = sum(max(walk_cycles(list(boxes))) <= max_attempts for boxes in permutations)
+            self.assertAlmostEqual(success_probability(num_prisoners, max_attempts), short_enough / math.factorial(num_prisoners),
+                                   places=12)
+
+    def test_longest_cycle_distribution_against_enumeration(self) -> None:
+        num_prisoners = 7
+        counts = (num_prisoners + 1) * [0]
+        for boxes in itertools.permutations(range(num_prisoners)):
+            counts[max(walk_cycles(list(boxes)))] += 1
+        distribution = longest_cycle_distribution(num_prisoners)
+        self.assertEqual(len(distribution), num_prisoners + 1)
+        for length, count in enumerate(counts):
+            self.assertAlmostEqual(distribution[length], count / math.factorial(num_prisoners), places=12)
+        self.assertAlmostEqual(math.fsum(longest_cycle_distribution(100)), 1.0, places=12)
+
+
+class CycleLengthsTest(unittest.TestCase):
+    """
+    Tests of the cycle decompositions of the engine against a plain walk of the chains.
+    """
+
+    def test_cycle_lengths(self) -> None:
+        rng = random.Random(7)
+        for num_prisoners in (1, 2, 3, 10, 100, 257):
+            list_of_boxes = list(range(num_prisoners))
+            rng.shuffle(list_of_boxes)
+            self.assertEqual(cycle_lengths(list_of_boxes), walk_cycles(list_of_boxes))
+
+    def test_max_cycle_lengths(self) -> None:
+        for num_prisoners in (1, 2, 3, 10, 100, 257):
+            block = shuffle_block(round_seeds(7, 50), num_prisoners)
+            expected = [max(walk_cycles(row)) for row in block.tolist()]
+            self.assertEqual(max_cycle_lengths(block).tolist(), expected)
+
+    def test_max_cycle_lengths_identity_and_single_cycle(self) -> None:
+        identity = np.arange(8, dtype=np.int64)[None, :]
+        single_cycle = np.roll(np.arange(8, dtype=np.int64), -1)[None, :]
+        self.assertEqual(max_cycle_lengths(np.vstack([identity, single_cycle])).tolist(), [1, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
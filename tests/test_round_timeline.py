@@ -0,0 +1,33 @@
+import random
+import unittest
+
+from Model.round_timeline import RoundTimeline
+
+
+class RoundTimelineTest(unittest.TestCase):
+    """
+    Tests of the events of a round against prisoners that open the boxes one by one.
+    """
+
+    def test_against_opening_the_boxes(self) -> None:
+        rng = random.Random(7)
+        for num_prisoners in (2, 3, 10, 101):
+            list_of_boxes = list(range(1, num_prisoners + 1))
+            rng.shuffle(list_of_boxes)
+            timeline = RoundTimeline(list_of_boxes)
+            succeeded = 0
+            for prisoner_num in range(1, num_prisoners + 1):
+                opened = [prisoner_num]
+                while list_of_boxes[opened[-1] - 1] != prisoner_num:
+                    opened.append(list_of_boxes[opened[-1] - 1])
+                succeeded += len(opened) <= num_prisoners // 2
+                self.assertEqual(timeline.boxes_opened(prisoner_num), opened)
+                self.assertEqual(timeline.chain_length(prisoner_num), len(opened))
+                self.assertEqual(timeline.succeeds(prisoner_num), len(opened) <= num_prisoners // 2)
+                self.assertEqual(timeline.succeeded_until[prisoner_num], succeeded)
+            self.assertEqual(timeline.total_succeeded(), succeeded)
+            self.assertEqual(timeline.round_succeeded(), succeeded == num_prisoners)
+
+
+if __name__ == "__main__":
+    unittest.main()